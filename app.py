@@ -153,7 +153,7 @@ def main():
         with tabs[2]:
             st.header("🛠 시스템 관리 (Admin Dashboard)")
             
-            admin_tab1, admin_tab2, admin_tab3 = st.tabs(["📜 시스템 로그", "📂 파일 관리", "👥 사용자 관리"])
+            admin_tab1, admin_tab2, admin_tab3, admin_tab4 = st.tabs(["📜 시스템 로그", "📂 파일 관리", "👥 사용자 관리", "🌐 외부 통신"])
             
             # --- SubTab 1: System Logs ---
             with admin_tab1:
@@ -276,6 +276,41 @@ def main():
                                 st.error(msg)
                 else:
                     st.info("삭제할 수 있는 추가 사용자가 없습니다.")
+
+            # --- SubTab 4: HTTP Metrics ---
+            with admin_tab4:
+                st.subheader("🌐 외부 서버 통신 통계 (HTTP Metrics)")
+                if st.button("🔄 통계 새로고침"):
+                    st.rerun()
+
+                from src.modules.http_client import all_http_metrics
+                metrics = all_http_metrics()
+                if not metrics:
+                    st.info("아직 외부 서버 요청 기록이 없습니다.")
+                else:
+                    metric_df = pd.DataFrame([
+                        {
+                            "Endpoint": m['name'],
+                            "Hosts": ", ".join(m['hosts']),
+                            "Requests": m['requests'],
+                            "In-flight": m['in_flight'],
+                            "Retries": m['retries'],
+                            "Avg (s)": round(m['avg_latency'], 2),
+                            "p50 (s)": m['p50_latency'],
+                            "p95 (s)": m['p95_latency'],
+                            "Max (s)": round(m['max_latency'], 2),
+                            "Sent (KB)": round(m['bytes_sent'] / 1024, 1),
+                            "Received (KB)": round(m['bytes_received'] / 1024, 1),
+                            "Status": ", ".join(f"{k}: {v}" for k, v in sorted(m['status_codes'].items())),
+                            "Errors": ", ".join(f"{k}: {v}" for k, v in m['errors'].items())
+                        }
+                        for m in metrics
+                    ])
+                    st.dataframe(metric_df, use_container_width=True)
+
+                    st.caption("응답 시간 분포 (응답 헤더 수신까지)")
+                    hist_df = pd.DataFrame({m['name']: m['histogram'] for m in metrics})
+                    st.bar_chart(hist_df)
     
     # ==========================================
     # Tab 1: 신규 파일 등록 (Registration)
@@ -757,29 +792,29 @@ def process_jobs(jobs):
     Submit jobs to the background JobManager instead of running synchronously.
     """
     from src.job_manager import get_job_manager
-    from src.services.job_processor import JobProcessor
 
     mgr = get_job_manager()
     
-    # We need a wrapper function that the JobManager can call
-    # The JobManager expects a function that takes (job_data, progress_callback, log_callback, status_callback)
-    def worker_wrapper(progress_callback, log_callback, status_callback, job_data):
-        processor = JobProcessor(log_callback=log_callback, status_callback=status_callback)
-        # Process single job expects just the 'job' dict
-        # We assume job_data is the job dict
-        result_files = processor.process_single_job(job_data)
-        return result_files  # Return file paths for download
+    # 텔레그램 묶음 전송: 이번에 등록한 작업들의 알림을 모두 끝난 뒤 한 번에 전송
+    from src.modules.telegram_digest import get_digest, digest_enabled
+    digest_batch = get_digest().open_batch(len(jobs)) if digest_enabled() and jobs else None
 
     submitted_count = 0
     for job in jobs:
-        # Submit to queue
-        mgr.add_job(
+        # Submit to queue (작업 데이터는 저장되어 앱이 재시작되어도 이어서 처리)
+        mgr.add_staged_job(
             job_type=job['type'],
             title=job.get('file_name', 'Unknown'),
-            task_func=worker_wrapper,
-            job_data=job
+            handler='sheet_job',
+            job_data=job,
+            digest_batch=digest_batch
         )
         submitted_count += 1
+
+    # GPU 서버 모델 미리 로드 (STT 처리 동안 백그라운드로 적재)
+    if submitted_count:
+        from src.modules.api_client import APIClient
+        APIClient().warm_up(job_count=submitted_count)
         
     st.success(f"✅ {submitted_count}개의 작업이 백그라운드 큐에 등록되었습니다!")
     time.sleep(1)
@@ -801,6 +836,91 @@ def render_job_dashboard():
     if st.button("🔄 상태 새로고침 (Refresh Status)"):
         st.rerun()
 
+    # 외부 서버 상태 (서킷 브레이커)
+    from src.modules.circuit_breaker import get_breaker, all_breakers
+    from src.modules.endpoint_pool import all_endpoint_pools
+    state_icons = {'closed': '🟢 정상', 'half_open': '🟡 복구 확인 중', 'open': '🔴 차단'}
+    labels = {'stt': 'STT', 'llm': 'GPU(LLM)', 'telegram': 'Telegram'}
+    # 서버 풀은 서버별 브레이커 (stt@host, llm@host), 별도 서버 모델 라우트는 llm:<라우트 이름>
+    breakers = sorted(all_breakers(), key=lambda b: b['name']) or [get_breaker(n).snapshot() for n in labels]
+    status_parts = []
+    for b in breakers:
+        label = labels.get(b['name']) or b['name'].replace('llm:', 'GPU:').replace('llm@', 'GPU@').replace('stt@', 'STT@')
+        text = f"{label}: {state_icons.get(b['state'], b['state'])}"
+        if b['state'] == 'open':
+            text += f" (재확인 {b['retry_in']:.0f}s, {b['last_error']})"
+        status_parts.append(text)
+    st.caption("🔌 " + " · ".join(status_parts))
+    for pool in all_endpoint_pools():
+        loads = [
+            f"{e['name']} 진행 {e['outstanding']}건" + (f"/대기열 {e['queue_position']}" if e['queue_position'] else "")
+            + f" (가중치 {e['weight']:g}, 누적 {e['requests']}건)"
+            for e in pool.snapshot()
+        ]
+        st.caption(f"🖥 {labels.get(pool.name, pool.name)} 서버: " + " · ".join(loads))
+
+    # GPU 서버(LLM) 요청 대기열
+    from src.modules.llm_scheduler import get_llm_scheduler
+    sched = get_llm_scheduler().snapshot()
+    st.caption(
+        f"🧠 GPU 요청: 진행 {sched['in_flight']}/{sched['max_concurrent']} · 대기 {len(sched['waiting'])}건 · "
+        f"평균 대기 {sched['avg_wait']:.1f}s (최대 {sched['max_wait']:.1f}s)"
+    )
+    for w in sched['waiting']:
+        st.caption(f"   ⏳ {w['label']} (우선순위 {w['priority']}, {w['waited']:.0f}s 대기)")
+
+    # 요약 대기열 (GPU 서버 장애/지연으로 보관만 먼저 끝낸 작업)
+    from src.modules.summary_queue import SummaryQueue
+    pending_summaries = SummaryQueue().pending()
+    if pending_summaries:
+        st.caption(f"📥 요약 대기: {len(pending_summaries)}건")
+        for p in pending_summaries:
+            retry_in = max(0, p['next_attempt_at'] - time.time())
+            text = f"   ⏸ {p['filename']} (시도 {p['attempts']}회"
+            text += f", {retry_in:.0f}s 후 재시도: {p['last_error']})" if p['attempts'] else ")"
+            st.caption(text)
+
+    # 텔레그램 묶음 전송 대기 (배치 작업이 모두 끝나면 한 번에 전송)
+    from src.modules.telegram_digest import get_digest, digest_enabled
+    if digest_enabled():
+        for b in get_digest().pending():
+            if b['batch_id']:
+                st.caption(f"🗂 텔레그램 묶음 대기: 작업 {b['finished']}/{b['expected']}건 종료, 알림 {b['entries']}건")
+            else:
+                st.caption(f"🗂 텔레그램 묶음 대기: 지연 요약 알림 {b['entries']}건")
+
+    # 텔레그램 전송 대기열 (전송 간격 제한/장애로 아직 보내지 못한 메시지/파일)
+    from src.modules.telegram_outbox import TelegramOutbox
+    pending_sends = TelegramOutbox().pending()
+    if pending_sends:
+        st.caption(f"📨 텔레그램 전송 대기: {len(pending_sends)}건")
+        for p in pending_sends:
+            if not p['attempts'] and not p['last_error']:
+                continue
+            retry_in = max(0, p['next_attempt_at'] - time.time())
+            label = p['file_name'] or p['preview']
+            st.caption(f"   ⏸ {label} (시도 {p['attempts']}회, {retry_in:.0f}s 후 재전송: {p['last_error']})")
+
+    # 단계별 파이프라인 현황 (가장 느린 단계가 전체 처리 속도를 결정)
+    stage_labels = {'media': '오디오 추출', 'stt': 'STT', 'llm': 'AI 요약', 'thumbnail': '썸네일', 'archive': '아카이브', 'sheet': '시트 갱신'}
+    stage_stats = mgr.pipeline_stats()
+    if stage_stats:
+        st.caption("🏭 단계별 처리: " + " → ".join(
+            f"{stage_labels.get(s['stage'], s['stage'])} {s['active']}/{s['workers']}"
+            + (f" (대기 {s['queued']})" if s['queued'] else "")
+            + (f" 평균 {s['avg_sec']:.0f}s" if s['processed'] else "")
+            for s in stage_stats
+        ))
+
+    # 자원별 동시 사용 현황 (ffmpeg/STT/GPU/NAS 복사 - 대기 시간이 길면 해당 자원이 병목)
+    from src.resource_pool import all_resource_pools
+    st.caption("🧮 자원: " + " · ".join(
+        f"{r['name']} {r['in_use']}/{r['capacity']}"
+        + (f" (대기 {r['waiting']})" if r['waiting'] else "")
+        + f" 사용률 {r['utilization'] * 100:.0f}% · 평균 대기 {r['avg_wait']:.1f}s (최대 {r['max_wait']:.1f}s)"
+        for r in all_resource_pools()
+    ))
+
     jobs = mgr.get_all_jobs()
     
     if not jobs:
@@ -816,15 +936,16 @@ def render_job_dashboard():
     
     for j in jobs:
         with st.expander(f"[{j['status'].upper()}] {j['title']} ({j['progress']}%)", expanded=(j['status'] in ['processing', 'failed', 'completed'])):
-            st.write(f"**Status**: {j['status']}")
-            st.write(f"**Submitted**: {j['submitted_at'].strftime('%H:%M:%S')}")
+            st.write(f"**Status**: {j['status']}" + (f" ({stage_labels.get(j['stage'], j['stage'])})" if j.get('stage') and j['status'] == 'processing' else ""))
+            st.write(f"**Submitted**: {j['submitted_at'].strftime('%H:%M:%S')}"
+                     + (f" · 시도 {j['attempts']}회" if j.get('attempts', 0) > 1 else ""))
 
             # Show Logs
             if j['logs']:
                 st.code("\n".join(j['logs'][-5:])) # Last 5 logs
 
             if j['status'] == 'processing':
-                st.progress(j['progress'] / 100)
+                st.progress(j['progress'] / 100, text=j.get('progress_label'))
             elif j['status'] == 'completed':
                 st.success("완료됨")
 
@@ -13,8 +13,9 @@ from src.modules.gsheet import GSheetManager, MockGSheetManager
 from src.modules.media import MediaProcessor
 from src.modules.api_client import APIClient
 from src.modules.nas_manager import NASManager
-from src.modules.stt_module import ServerSTT
+from src.modules.stt_module import STTRouter
 from src.modules.telegram_bot import TelegramBot
+from src.modules.telegram_digest import get_digest
 
 def run_registration(settings, gsheet, media):
     # ---------------------------------------------------------
@@ -147,182 +148,210 @@ def run_processing(settings, gsheet, media, api_client, stt, nas, telegram):
     
     print(f"📋 총 {len(pending_jobs)}개의 대기 작업을 발견했습니다.")
 
+    # GPU 서버 모델 미리 로드 (첫 작업의 STT 처리 동안 백그라운드로 적재)
+    api_client.warm_up(job_count=len(pending_jobs))
+
+    # 텔레그램 묶음 전송: 모든 작업이 끝난 뒤 한 번에 전송
+    digest_batch = get_digest().open_batch(len(pending_jobs)) if telegram.use_digest and pending_jobs else None
+
     # 3. 작업 루프
-    for job in pending_jobs:
-        row_idx = job['index']
-        original_filename = job['file_name']
-        sheet_type = job['type']
-        meta = job['data']
+    try:
+        for job in pending_jobs:
+            row_idx = job['index']
+            original_filename = job['file_name']
+            sheet_type = job['type']
+            meta = job['data']
         
-        print(f"\n▶️ 작업 시작: {original_filename} (Row {row_idx})")
+            print(f"\n▶️ 작업 시작: {original_filename} (Row {row_idx})")
         
-        # [변경] Inbox 내 서브폴더 적용 (Testimony / MissionNews)
-        subfolders = settings.gsheet_config.get('subfolders', {})
-        subfolder_name = subfolders.get(sheet_type, "")
+            # [변경] Inbox 내 서브폴더 적용 (Testimony / MissionNews)
+            subfolders = settings.gsheet_config.get('subfolders', {})
+            subfolder_name = subfolders.get(sheet_type, "")
         
-        inbox_dir = os.path.join(settings.paths['inbox'], subfolder_name)
-        inbox_path = os.path.join(inbox_dir, original_filename)
+            inbox_dir = os.path.join(settings.paths['inbox'], subfolder_name)
+            inbox_path = os.path.join(inbox_dir, original_filename)
 
-        if not os.path.exists(inbox_dir):
-            print(f"❌ 폴더 없음: {inbox_dir}")
-            continue
+            if not os.path.exists(inbox_dir):
+                print(f"❌ 폴더 없음: {inbox_dir}")
+                if digest_batch:
+                    get_digest().finish_job(digest_batch)
+                continue
             
-        inbox_path = os.path.join(inbox_dir, original_filename)
-
-        # (1) Inbox 내에서 파일명 변경 ('240101_국가_이름.mp4' 형식)
-        # 메타데이터 기반 새 이름 생성 (구글 시트 헤더: 방송 일자, 국가, 이름(한글))
-        import re
-        raw_date = str(meta.get('방송 일자', ''))
-        # 숫자만 추출 (2025. 03. 22 (토) -> 20250322)
-        digits = re.sub(r'[^0-9]', '', raw_date)
+            inbox_path = os.path.join(inbox_dir, original_filename)
+
+            # (1) Inbox 내에서 파일명 변경 ('240101_국가_이름.mp4' 형식)
+            # 메타데이터 기반 새 이름 생성 (구글 시트 헤더: 방송 일자, 국가, 이름(한글))
+            import re
+            raw_date = str(meta.get('방송 일자', ''))
+            # 숫자만 추출 (2025. 03. 22 (토) -> 20250322)
+            digits = re.sub(r'[^0-9]', '', raw_date)
         
-        if len(digits) == 8: # 20250322
-            yymmdd = digits[2:] # 250322
-        elif len(digits) == 6: # 250322
-            yymmdd = digits
-        else:
-            yymmdd = '240101' # Default fallback
-
-        # NAS Archive를 위해 meta 날짜 표준화
-        meta['방송 일자'] = yymmdd 
-
-        country = meta.get('국가', 'Unknown')
-        name = meta.get('이름(한글)', 'Unknown')
-        region = meta.get('지역', country) # Default to Country if Region is empty
-
-        # [New] 스피커별 지역 매핑 규칙 (해외선교소식)
-        if sheet_type == 'mission_news':
-            speaker_map = {
-                "정경화": "필리핀_루손",
-                "배중기": "필리핀_비사야",
-                "고엄수": "필리핀_민다나오",
-                "정명준": "멕중남미"
-            }
-            if name in speaker_map:
-                region = speaker_map[name]
-                print(f"   ℹ️  지역 자동 매핑: {name} -> {region}")
-
-        if sheet_type == 'testimony':
-            new_filename = f"{region}_{yymmdd}_{name}.mp4"
-        elif sheet_type == 'mission_news':
-            new_filename = f"{yymmdd}_해외선교소식_{region}_{name}.mp4"
-        else:
-            new_filename = f"{yymmdd}_기타_{country}_{name}.mp4"
-
-        renamed_inbox_path = os.path.join(inbox_dir, new_filename)
-
-        # [Robust Check] 원본 파일이 없으면, 이미 변경된 파일이 있는지 확인
-        if not os.path.exists(inbox_path):
-            if os.path.exists(renamed_inbox_path):
-                print(f"   ℹ️  이미 변경된 파일 발견: {new_filename} (Proceeding)")
-                inbox_path = renamed_inbox_path # 포인터 변경
+            if len(digits) == 8: # 20250322
+                yymmdd = digits[2:] # 250322
+            elif len(digits) == 6: # 250322
+                yymmdd = digits
             else:
-                print(f"❌ 파일 없음: {original_filename}")
-                print(f"   (확인된 경로: {inbox_path})")
-                print(f"   (대체 경로: {renamed_inbox_path})")
+                yymmdd = '240101' # Default fallback
+
+            # NAS Archive를 위해 meta 날짜 표준화
+            meta['방송 일자'] = yymmdd 
+
+            country = meta.get('국가', 'Unknown')
+            name = meta.get('이름(한글)', 'Unknown')
+            region = meta.get('지역', country) # Default to Country if Region is empty
+
+            # [New] 스피커별 지역 매핑 규칙 (해외선교소식)
+            if sheet_type == 'mission_news':
+                speaker_map = {
+                    "정경화": "필리핀_루손",
+                    "배중기": "필리핀_비사야",
+                    "고엄수": "필리핀_민다나오",
+                    "정명준": "멕중남미"
+                }
+                if name in speaker_map:
+                    region = speaker_map[name]
+                    print(f"   ℹ️  지역 자동 매핑: {name} -> {region}")
+
+            if sheet_type == 'testimony':
+                new_filename = f"{region}_{yymmdd}_{name}.mp4"
+            elif sheet_type == 'mission_news':
+                new_filename = f"{yymmdd}_해외선교소식_{region}_{name}.mp4"
+            else:
+                new_filename = f"{yymmdd}_기타_{country}_{name}.mp4"
+
+            renamed_inbox_path = os.path.join(inbox_dir, new_filename)
+
+            # [Robust Check] 원본 파일이 없으면, 이미 변경된 파일이 있는지 확인
+            if not os.path.exists(inbox_path):
+                if os.path.exists(renamed_inbox_path):
+                    print(f"   ℹ️  이미 변경된 파일 발견: {new_filename} (Proceeding)")
+                    inbox_path = renamed_inbox_path # 포인터 변경
+                else:
+                    print(f"❌ 파일 없음: {original_filename}")
+                    print(f"   (확인된 경로: {inbox_path})")
+                    print(f"   (대체 경로: {renamed_inbox_path})")
                 
-                gsheet.update_status(sheet_type, row_idx, "에러", error_msg="File Not Found (Inbox)")
-                continue
+                    gsheet.update_status(sheet_type, row_idx, "에러", error_msg="File Not Found (Inbox)")
+                    if digest_batch:
+                        get_digest().finish_job(digest_batch)
+                    continue
 
-        try:
+            try:
             
-            # [Safe Rename] 원본과 타겟이 다를 때만 이름 변경
-            if inbox_path != renamed_inbox_path:
-                print(f"   [1/6] 파일명 변경: {os.path.basename(inbox_path)} -> {new_filename}")
-                os.rename(inbox_path, renamed_inbox_path)
-            else:
-                print(f"   [1/6] 파일명 변경 생략 (이미 일치): {new_filename}")
+                # [Safe Rename] 원본과 타겟이 다를 때만 이름 변경
+                if inbox_path != renamed_inbox_path:
+                    print(f"   [1/6] 파일명 변경: {os.path.basename(inbox_path)} -> {new_filename}")
+                    os.rename(inbox_path, renamed_inbox_path)
+                else:
+                    print(f"   [1/6] 파일명 변경 생략 (이미 일치): {new_filename}")
             
-            # (2) 오디오 추출 (변경된 파일에서)
-            print("   [2/6] 오디오 추출 중...")
-            audio_path = media.extract_audio(renamed_inbox_path)
+                # (2) 오디오 추출 (변경된 파일에서)
+                print("   [2/6] 오디오 추출 중...")
+                audio_path = media.extract_audio(renamed_inbox_path)
             
-            # (3) STT & AI 요약
-            print("   [3/6] AI 분석 (STT -> Server)...")
-            full_text = stt.transcribe(audio_path)
-            summary_text = api_client.analyze_text(full_text, prompt_type=sheet_type)
-            print(f"     ㄴ 요약 완료: {summary_text[:30]}...")
+                # (3) STT & AI 요약
+                print("   [3/6] AI 분석 (STT -> Server)...")
+                # (STT 엔진은 오디오 해시 기준 캐시를 먼저 조회 -> 재처리 시 STT 생략)
+                stt_result = stt.transcribe(audio_path, context={'sheet_type': sheet_type, 'row_idx': row_idx})
+                full_text = stt_result.get('text', "") if isinstance(stt_result, dict) else str(stt_result)
+                segments = stt_result.get('segments', []) if isinstance(stt_result, dict) else []
+                llm_text, llm_segments, compact_msg = api_client.compact_input(full_text, segments)
+                if compact_msg:
+                    print(f"     ㄴ {compact_msg}")
+                summary_text = api_client.analyze_text(
+                    llm_text, prompt_type=sheet_type, segments=llm_segments,
+                    broadcast_date=raw_date, label=new_filename
+                )
+                print(f"     ㄴ 요약 완료: {summary_text[:30]}...")
             
-            # 텔레그램 알림 발송
-            # 텔레그램 알림 발송
-            if sheet_type == 'testimony':
-                header = f"🕊️ **[간증] {job['data'].get('방송 일자', '')} {region} - {name}**"
-            elif sheet_type == 'mission_news':
-                header = f"🌍 **[선교소식] {job['data'].get('방송 일자', '')} {region} - {name}**"
-            else:
-                header = f"📢 **[{job['data'].get('방송 일자', '')} {region} - {name}]**"
+                # 텔레그램 알림 발송
+                # 텔레그램 알림 발송
+                if sheet_type == 'testimony':
+                    header = f"🕊️ **[간증] {job['data'].get('방송 일자', '')} {region} - {name}**"
+                elif sheet_type == 'mission_news':
+                    header = f"🌍 **[선교소식] {job['data'].get('방송 일자', '')} {region} - {name}**"
+                else:
+                    header = f"📢 **[{job['data'].get('방송 일자', '')} {region} - {name}]**"
 
-            msg = f"{header}\n\n{summary_text}"
-            telegram.send_message(msg)
+                telegram.send_job_result(sheet_type, header, summary_text, batch_id=digest_batch)
 
-            # (4) 썸네일 생성 (4:3 크롭 & 자막 제거)
-            print("   [4/6] 썸네일 생성 중 (4:3, 자막 제거)...")
+                # (4) 썸네일 생성 (4:3 크롭 & 자막 제거)
+                print("   [4/6] 썸네일 생성 중 (4:3, 자막 제거)...")
             
-            # 2초 지점(타이틀/인물) 다시 캡처 (원본 소스)
-            thumb_source = media.capture_frame(renamed_inbox_path, timestamp=2.0)
+                # 2초 지점(타이틀/인물) 다시 캡처 (원본 소스)
+                thumb_source = media.capture_frame(renamed_inbox_path, timestamp=2.0)
             
-            if thumb_source:
-                # 썸네일도 파일명 규칙 따름 (.jpg)
-                thumb_new_name = os.path.splitext(new_filename)[0] + ".jpg"
-                final_thumb_path = os.path.join(settings.paths['temp'], thumb_new_name)
+                if thumb_source:
+                    # 썸네일도 파일명 규칙 따름 (.jpg)
+                    thumb_new_name = os.path.splitext(new_filename)[0] + ".jpg"
+                    final_thumb_path = os.path.join(settings.paths['temp'], thumb_new_name)
                 
-                # 4:3 크롭 & 하단 자막 제거 적용
-                result = media.process_thumbnail_4_3(thumb_source, final_thumb_path)
+                    # 4:3 크롭 & 하단 자막 제거 적용
+                    result = media.process_thumbnail_4_3(thumb_source, final_thumb_path)
                 
-                if result:
-                    print(f"     ㄴ 썸네일 생성 완료: {thumb_new_name}")
+                    if result:
+                        print(f"     ㄴ 썸네일 생성 완료: {thumb_new_name}")
+                    else:
+                        print("     ⚠️ 썸네일 변환 실패")
+                        final_thumb_path = None # 마킹
                 else:
-                    print("     ⚠️ 썸네일 변환 실패")
-                    final_thumb_path = None # 마킹
-            else:
-                print("     ⚠️ 썸네일 소스 캡처 실패")
-                final_thumb_path = None
-
-            # [복구] STT 결과 텍스트 파일 저장 (Archive Backup X, Temp Only O)
-            txt_filename = os.path.splitext(new_filename)[0] + ".txt"
-            txt_path = os.path.join(settings.paths['temp'], txt_filename)
-            try:
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write(f"방송일자: {yymmdd}\n")
-                    f.write(f"제목: {new_filename}\n")
-                    f.write("-" * 20 + "\n")
-                    f.write(summary_text + "\n")
-                    f.write("-" * 20 + "\n\n")
-                    f.write("[전체 자막]\n")
-                    f.write(full_text)
-                print(f"     ㄴ 텍스트 생성 완료: {txt_filename}")
-            except Exception as e:
-                print(f"     ⚠️ 텍스트 저장 실패: {e}")
+                    print("     ⚠️ 썸네일 소스 캡처 실패")
+                    final_thumb_path = None
 
-            # (5) NAS 아카이빙 (영상 + 썸네일 + 텍스트) -> [변경] archive_mock/20YYMMDD
-            print("   [5/6] 아카이브 저장 (Mock)...")
+                # [복구] STT 결과 텍스트 파일 저장 (Archive Backup X, Temp Only O)
+                txt_filename = os.path.splitext(new_filename)[0] + ".txt"
+                txt_path = os.path.join(settings.paths['temp'], txt_filename)
+                try:
+                    with open(txt_path, 'w', encoding='utf-8') as f:
+                        f.write(f"방송일자: {yymmdd}\n")
+                        f.write(f"제목: {new_filename}\n")
+                        f.write("-" * 20 + "\n")
+                        f.write(summary_text + "\n")
+                        f.write("-" * 20 + "\n\n")
+                        f.write("[전체 자막]\n")
+                        f.write(full_text)
+                    print(f"     ㄴ 텍스트 생성 완료: {txt_filename}")
+                except Exception as e:
+                    print(f"     ⚠️ 텍스트 저장 실패: {e}")
+
+                # (5) NAS 아카이빙 (영상 + 썸네일 + 텍스트) -> [변경] archive_mock/20YYMMDD
+                print("   [5/6] 아카이브 저장 (Mock)...")
             
-            # Destination Folder
-            dest_folder = os.path.join(settings.paths['archive'], f"20{yymmdd}")
-            if not os.path.exists(dest_folder):
-                os.makedirs(dest_folder, exist_ok=True)
+                # Destination Folder
+                dest_folder = os.path.join(settings.paths['archive'], f"20{yymmdd}")
+                if not os.path.exists(dest_folder):
+                    os.makedirs(dest_folder, exist_ok=True)
             
-            # 1. Text
-            shutil.copy(txt_path, os.path.join(dest_folder, txt_filename))
+                # 1. Text
+                shutil.copy(txt_path, os.path.join(dest_folder, txt_filename))
             
-            # 2. Video
-            video_dest_path = os.path.join(dest_folder, new_filename)
-            shutil.copy(renamed_inbox_path, video_dest_path)
+                # 2. Video
+                video_dest_path = os.path.join(dest_folder, new_filename)
+                shutil.copy(renamed_inbox_path, video_dest_path)
             
-            # 3. Thumbnail
-            if final_thumb_path and os.path.exists(final_thumb_path):
-                thumb_dest_filename = os.path.splitext(new_filename)[0] + ".jpg"
-                shutil.copy(final_thumb_path, os.path.join(dest_folder, thumb_dest_filename))
+                # 3. Thumbnail
+                if final_thumb_path and os.path.exists(final_thumb_path):
+                    thumb_dest_filename = os.path.splitext(new_filename)[0] + ".jpg"
+                    shutil.copy(final_thumb_path, os.path.join(dest_folder, thumb_dest_filename))
             
-            print(f"     ✅ 저장 완료: {dest_folder}")
+                print(f"     ✅ 저장 완료: {dest_folder}")
 
-            # (6) 상태 업데이트
-            gsheet.update_status(sheet_type, row_idx, "완료", new_filename=new_filename, summary_text=summary_text)
-            print("✅ 모든 작업 완료!")
+                # (6) 상태 업데이트
+                gsheet.update_status(sheet_type, row_idx, "완료", new_filename=new_filename, summary_text=summary_text)
+                print("✅ 모든 작업 완료!")
 
-        except Exception as e:
-            print(f"❌ 에러 발생: {e}")
-            gsheet.update_status(sheet_type, row_idx, "에러", error_msg=str(e))
+            except Exception as e:
+                print(f"❌ 에러 발생: {e}")
+                gsheet.update_status(sheet_type, row_idx, "에러", error_msg=str(e))
+            finally:
+                # 성공/실패/건너뜀 무관하게 배치에 종료 기록 (마지막 작업이면 바로 묶음 전송)
+                if digest_batch:
+                    get_digest().finish_job(digest_batch)
+    finally:
+        # 종료 전 텔레그램 묶음/대기열 전송 마무리 (남은 항목은 다음 실행 시 이어서 전송, 중간에 예외가 나도 실행)
+        if digest_batch:
+            get_digest().flush(digest_batch)
+        telegram.flush()
 
 
 def main():
@@ -356,9 +385,8 @@ def main():
     nas = NASManager()
     
     # (5) STT (Server-Side)
-    print("   [Init] STT 모델 로딩 중 (Server STT)...")
-    print("   [Init] STT 모델 로딩 중 (Server STT)...")
-    stt = ServerSTT()
+    print("   [Init] STT 엔진 초기화 중 (Server STT + Local Fallback)...")
+    stt = STTRouter()
     
     # (6) Telegram Bot
     telegram = TelegramBot()
@@ -0,0 +1,142 @@
+"""
+STT 클라이언트 부하 테스트 하네스
+- Mock STT 서버(scripts/mock_stt_server.py)를 띄우고 ServerSTT로 N개 Job을 동시에 실행
+- 클라이언트 설정(폴링 간격, 업로드 청크 크기 등)별로 업로드 처리량, 폴링 오버헤드, 전체 지연 시간 비교
+
+사용법:
+    python scripts/bench_stt_client.py --jobs 8 --audio-min 5 --server-workers 2
+    python scripts/bench_stt_client.py --url http://127.0.0.1:8900   # 이미 떠 있는 서버 사용
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from src.config_loader import settings
+from src.modules import stt_poller
+from src.modules.stt_module import ServerSTT
+from mock_stt_server import MockSTTServer
+
+# 비교할 클라이언트 설정
+PRESETS = [
+    {'label': 'fixed-2s / 256KB', 'polling': {'min_interval_sec': 2, 'max_interval_sec': 2}, 'upload': {'chunk_size_kb': 256}},
+    {'label': 'adaptive / 256KB', 'polling': {'min_interval_sec': 1, 'max_interval_sec': 30}, 'upload': {'chunk_size_kb': 256}},
+    {'label': 'adaptive / 1MB', 'polling': {'min_interval_sec': 1, 'max_interval_sec': 30}, 'upload': {'chunk_size_kb': 1024}},
+]
+
+
+def make_dummy_audio(directory, index, size):
+    path = os.path.join(directory, f"bench_{index}.mp3")
+    with open(path, 'wb') as f:
+        f.write(os.urandom(size))
+    return path
+
+
+def fetch_stats(url):
+    try:
+        return requests.get(f"{url}/stats", timeout=5).json()
+    except Exception:
+        return {}
+
+
+def run_preset(url, preset, audio_paths):
+    # 프리셋마다 폴러를 새로 만들어 설정을 적용
+    stt_poller._poller = stt_poller.STTJobPoller(preset['polling'])
+    stt = ServerSTT(config={'api_url': url, 'api_key': 'bench', 'upload': preset['upload']})
+
+    before = fetch_stats(url)
+    upload_times = {}
+
+    def run_one(path):
+        marks = {}
+
+        def on_progress(sent, total):
+            marks.setdefault('first', time.perf_counter())
+            if total and sent >= total:
+                marks['last'] = time.perf_counter()
+
+        start = time.perf_counter()
+        result = stt.transcribe(path, progress_callback=on_progress)
+        elapsed = time.perf_counter() - start
+        if 'first' in marks and 'last' in marks:
+            upload_times[path] = marks['last'] - marks['first']
+        return elapsed, isinstance(result, dict)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(audio_paths)) as pool:
+        outcomes = list(pool.map(run_one, audio_paths))
+    wall = time.perf_counter() - wall_start
+    after = fetch_stats(url)
+
+    latencies = [t for t, ok in outcomes if ok]
+    total_bytes = sum(os.path.getsize(p) for p in audio_paths)
+    upload_total = sum(upload_times.values())
+    polls = after.get('status_polls', 0) - before.get('status_polls', 0)
+
+    return {
+        'label': preset['label'],
+        'ok': len(latencies),
+        'failed': len(outcomes) - len(latencies),
+        'wall': wall,
+        'p50': statistics.median(latencies) if latencies else 0,
+        'max': max(latencies) if latencies else 0,
+        'upload_mbps': (total_bytes / 1024 / 1024) / upload_total if upload_total else 0,
+        'polls': polls,
+        'polls_per_job': polls / len(outcomes) if outcomes else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STT 클라이언트 부하 테스트")
+    parser.add_argument('--url', default=None, help='이미 실행 중인 (Mock) STT 서버 주소')
+    parser.add_argument('--jobs', type=int, default=6, help='동시 실행 Job 수')
+    parser.add_argument('--audio-min', type=float, default=3.0, help='Job당 오디오 길이 (분, 192kbps 기준 크기로 생성)')
+    parser.add_argument('--server-workers', type=int, default=2)
+    parser.add_argument('--sec-per-min', type=float, default=1.0, help='Mock 서버 처리 시간 (오디오 1분당 초)')
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    # 캐시가 켜져 있으면 두 번째 프리셋부터 서버를 거치지 않으므로 비활성화
+    settings.config.setdefault('cache', {})['enabled'] = False
+
+    server = None
+    url = args.url
+    if not url:
+        server = MockSTTServer(
+            port=0, workers=args.server_workers,
+            sec_per_audio_min=args.sec_per_min, fail_rate=args.fail_rate
+        ).start()
+        url = server.url
+
+    size = int(args.audio_min * 60 * 24000)
+    print(f"🧪 대상: {url} | Job {args.jobs}개 x {size / 1024 / 1024:.1f}MB ({args.audio_min}분)")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_paths = [make_dummy_audio(tmp, i, size) for i in range(args.jobs)]
+        for preset in PRESETS:
+            print(f"\n▶️ {preset['label']} 실행 중...")
+            rows.append(run_preset(url, preset, audio_paths))
+
+    if server:
+        server.stop()
+
+    print("\n" + "=" * 92)
+    print(f"{'설정':<22}{'성공':>6}{'실패':>6}{'전체(s)':>10}{'p50(s)':>10}{'max(s)':>10}{'업로드MB/s':>13}{'폴링':>8}{'폴링/Job':>10}")
+    print("-" * 92)
+    for r in rows:
+        print(f"{r['label']:<22}{r['ok']:>6}{r['failed']:>6}{r['wall']:>10.2f}{r['p50']:>10.2f}"
+              f"{r['max']:>10.2f}{r['upload_mbps']:>13.1f}{r['polls']:>8}{r['polls_per_job']:>10.1f}")
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    main()
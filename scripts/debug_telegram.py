@@ -11,6 +11,7 @@ def test_telegram():
     print(f"Chat ID: {bot.chat_id}")
     
     bot.send_message("🔔 [Test] Telegram Connectivity Check from MNAP System.")
+    bot.flush()
 
 if __name__ == "__main__":
     test_telegram()
@@ -0,0 +1,261 @@
+"""
+STT 서버 대역(stand-in) - 실제 GPU 서버 없이 업로드/폴링/결과 프로토콜을 검증하기 위한 로컬 서버
+
+구현 엔드포인트 (실서버와 동일):
+    POST /transcribe                     -> {"job_id", "queue_position"}
+    GET  /transcribe/job/{id}            -> {"status", "queue_position", "error"}
+    GET  /transcribe/job/{id}/result     -> {"text", "segments", "language"}
+    GET  /stats                          -> 요청 통계 (부하 테스트용)
+
+사용법:
+    python scripts/mock_stt_server.py --port 8900 --workers 2 --sec-per-min 3 --fail-rate 0.05
+    (config.yaml의 stt_server.api_url을 http://127.0.0.1:8900 으로 지정)
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+CANNED_SENTENCES = [
+    "안녕하세요, 오늘 간증을 나누게 되어 감사합니다.",
+    "처음 선교지에 도착했을 때는 모든 것이 낯설었습니다.",
+    "현지 교회 성도들과 함께 예배를 드리며 큰 은혜를 받았습니다.",
+    "어려운 시기에도 하나님께서 길을 열어주셨습니다.",
+    "앞으로도 계속 기도로 함께해 주시기를 부탁드립니다.",
+]
+
+
+class MockSTTServer:
+    """
+    :param workers: 동시에 처리하는 Job 수 (GPU 워커 수 흉내)
+    :param sec_per_audio_min: 오디오 1분당 처리 시간 (초)
+    :param bytes_per_sec: 업로드 크기 -> 오디오 길이 환산 기준 (기본 192kbps mp3)
+    :param fail_rate: 처리 실패 확률 (0~1)
+    :param segment_sec: canned 세그먼트 하나의 길이 (초)
+    :param api_key: 지정 시 X-API-Key 헤더 검사
+    """
+    def __init__(self, host="127.0.0.1", port=8900, workers=1, sec_per_audio_min=2.0,
+                 bytes_per_sec=24000, fail_rate=0.0, segment_sec=5.0, api_key=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.sec_per_audio_min = sec_per_audio_min
+        self.bytes_per_sec = bytes_per_sec
+        self.fail_rate = fail_rate
+        self.segment_sec = segment_sec
+        self.api_key = api_key
+
+        self.jobs = {}
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.has_work = threading.Condition(self.lock)
+        self.stats = {'uploads': 0, 'upload_bytes': 0, 'status_polls': 0, 'result_fetches': 0, 'failed': 0}
+
+        self._httpd = None
+        self._threads = []
+        self._stop = threading.Event()
+
+    # --- Lifecycle ---
+
+    def start(self):
+        server = self
+
+        class Handler(_Handler):
+            mock = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._httpd.server_address[1] # port=0 이면 실제 할당된 포트
+        self._threads = [threading.Thread(target=self._serve_http, daemon=True)]
+        self._threads += [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        with self.has_work:
+            self.has_work.notify_all()
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _serve_http(self):
+        self._httpd.serve_forever(poll_interval=0.2)
+
+    # --- Job Processing ---
+
+    def submit(self, size):
+        duration = size / float(self.bytes_per_sec)
+        job_id = uuid.uuid4().hex[:12]
+        with self.has_work:
+            self.jobs[job_id] = {'status': 'queued', 'duration': duration, 'error': None, 'submitted_at': time.time()}
+            self.pending.append(job_id)
+            position = len(self.pending)
+            self.stats['uploads'] += 1
+            self.stats['upload_bytes'] += size
+            self.has_work.notify()
+        return job_id, position
+
+    def _worker(self):
+        while not self._stop.is_set():
+            with self.has_work:
+                while not self.pending and not self._stop.is_set():
+                    self.has_work.wait(timeout=0.5)
+                if self._stop.is_set():
+                    return
+                job_id = self.pending.popleft()
+                job = self.jobs[job_id]
+                job['status'] = 'processing'
+
+            time.sleep(job['duration'] / 60.0 * self.sec_per_audio_min)
+
+            with self.lock:
+                if random.random() < self.fail_rate:
+                    job['status'] = 'failed'
+                    job['error'] = 'Injected failure (mock)'
+                    self.stats['failed'] += 1
+                else:
+                    job['status'] = 'completed'
+
+    def status(self, job_id):
+        with self.lock:
+            self.stats['status_polls'] += 1
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            data = {'job_id': job_id, 'status': job['status']}
+            if job['status'] == 'queued':
+                data['queue_position'] = list(self.pending).index(job_id) + 1
+            if job['error']:
+                data['error'] = job['error']
+            return data
+
+    def result(self, job_id):
+        with self.lock:
+            self.stats['result_fetches'] += 1
+            job = self.jobs.get(job_id)
+            if not job or job['status'] != 'completed':
+                return None
+            duration = job['duration']
+
+        segments = []
+        t = 0.0
+        while t < duration:
+            end = min(duration, t + self.segment_sec)
+            segments.append({
+                'id': len(segments),
+                'start': round(t, 2),
+                'end': round(end, 2),
+                'text': CANNED_SENTENCES[len(segments) % len(CANNED_SENTENCES)]
+            })
+            t = end
+        return {'text': " ".join(s['text'] for s in segments), 'segments': segments, 'language': 'ko'}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Keep-Alive 지원
+    mock = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, code, obj):
+        body = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        if self.mock.api_key and self.headers.get('X-API-Key') != self.mock.api_key:
+            self._send_json(401, {'detail': 'Invalid API Key'})
+            return False
+        return True
+
+    def _drain_body(self):
+        """업로드 바디를 읽고 크기만 반환 (Content-Length / chunked 모두 지원)"""
+        size = 0
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                n = int(self.rfile.readline().strip() or b'0', 16)
+                if n == 0:
+                    self.rfile.readline()
+                    break
+                remaining = n
+                while remaining:
+                    remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+                self.rfile.readline()
+                size += n
+        else:
+            remaining = int(self.headers.get('Content-Length', 0))
+            size = remaining
+            while remaining:
+                chunk = self.rfile.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+        return size
+
+    def do_POST(self):
+        size = self._drain_body()
+        if not self._authorized():
+            return
+        if self.path.rstrip('/') != '/transcribe':
+            return self._send_json(404, {'detail': 'Not Found'})
+        job_id, position = self.mock.submit(size)
+        self._send_json(200, {'job_id': job_id, 'queue_position': position})
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        parts = self.path.strip('/').split('/')
+        if parts == ['stats']:
+            with self.mock.lock:
+                return self._send_json(200, dict(self.mock.stats))
+        if len(parts) >= 3 and parts[0] == 'transcribe' and parts[1] == 'job':
+            job_id = parts[2]
+            if len(parts) == 4 and parts[3] == 'result':
+                data = self.mock.result(job_id)
+            else:
+                data = self.mock.status(job_id)
+            if data is None:
+                return self._send_json(404, {'detail': 'Job not found'})
+            return self._send_json(200, data)
+        self._send_json(404, {'detail': 'Not Found'})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock STT Server (로컬 부하 테스트용)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--workers', type=int, default=1, help='동시 처리 Job 수')
+    parser.add_argument('--sec-per-min', type=float, default=2.0, help='오디오 1분당 처리 시간(초)')
+    parser.add_argument('--bytes-per-sec', type=int, default=24000, help='업로드 크기 -> 오디오 길이 환산 (기본 192kbps)')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='실패 주입 확률 (0~1)')
+    parser.add_argument('--api-key', default=None)
+    args = parser.parse_args()
+
+    server = MockSTTServer(
+        host=args.host, port=args.port, workers=args.workers,
+        sec_per_audio_min=args.sec_per_min, bytes_per_sec=args.bytes_per_sec,
+        fail_rate=args.fail_rate, api_key=args.api_key
+    ).start()
+    print(f"🧪 Mock STT Server: {server.url} (workers={args.workers}, {args.sec_per_min}s/min, fail={args.fail_rate})")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,85 @@ ALLOWED_VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv'}
 ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
 
 # === STT 관련 ===
-STT_POLL_INTERVAL = 2  # 폴링 간격 (초)
-STT_MAX_RETRIES = 180  # 최대 재시도 횟수 (2초 * 180 = 6분)
-STT_TIMEOUT_SECONDS = 600  # 타임아웃 (초)
+STT_POLL_INTERVAL = 2  # 폴링 간격 (초, 최소값)
+STT_POLL_MAX_INTERVAL = 30  # 최대 폴링 간격 (초)
+STT_POLL_QUEUE_STEP = 2  # 대기열 1순위당 추가 폴링 간격 (초)
+STT_POLL_PROCESSING_RATIO = 0.1  # 처리 경과 시간 대비 폴링 간격 비율
+STT_POLL_TIMEOUT_SECONDS = 3 * 60 * 60  # Job 단위 최대 대기 시간 (초)
+STT_POLL_MAX_ERRORS = 5  # 연속 상태 조회 실패 허용 횟수
+STT_CHUNK_MIN_DURATION_SEC = 900  # 이 길이(초) 이상 오디오만 분할 전송
+STT_CHUNK_COUNT = 4  # 분할 청크 수
+STT_CHUNK_OVERLAP_SEC = 1.0  # 청크 간 겹침 구간 (초)
+STT_CHUNK_SEARCH_RATIO = 0.2  # 분할 지점 주변 무음 탐색 범위 (청크 길이 대비)
+STT_UPLOAD_CHUNK_SIZE = 256 * 1024  # 스트리밍 업로드 청크 크기 (바이트)
+STT_UPLOAD_RETRIES = 3  # 업로드 중단 시 재시도 횟수
+STT_UPLOAD_TIMEOUT = (10, 300)  # 업로드 (Connect, Read) 타임아웃 (초)
+
+# === LLM 관련 ===
+LLM_CONNECT_TIMEOUT = 10  # 서버 연결 타임아웃 (초)
+LLM_READ_TIMEOUT = 1800  # 비스트리밍 응답 대기 시간 (초)
+LLM_FIRST_TOKEN_TIMEOUT = 600  # 스트리밍: 첫 토큰까지 대기 시간 (긴 원문 prefill 고려)
+LLM_INACTIVITY_TIMEOUT = 120  # 스트리밍: 토큰 사이 무응답 허용 시간 (초)
+LLM_PROGRESS_INTERVAL = 1.0  # 스트리밍 진행 상황 보고 간격 (초)
+LLM_MAX_INPUT_CHARS = 40000  # 단일 요청 원문 최대 길이 (초과분은 잘림, map-reduce 모드 제외)
+LLM_MAP_REDUCE_THRESHOLD_TOKENS = 12000  # 이 추정 토큰 수를 넘으면 분할 요약 (map-reduce)
+LLM_MAP_CHUNK_TOKENS = 6000  # 분할 요약 청크당 토큰 예산
+LLM_MAP_MAX_PARALLEL = 2  # 분할 요약 동시 요청 수 (GPU 서버 부하 제한)
+LLM_COMPACT_MAX_TOKENS = 24000  # 원문 정리 후 토큰 예산 (분할 요약 사용 시 적용 안 함)
+LLM_MAX_CONCURRENT = 1  # GPU 서버 동시 요청 수
+LLM_PRIORITY_AGING_SEC = 300  # 대기 시간이 이 값만큼 지날 때마다 우선순위 한 단계 상승
+LLM_URGENT_DAYS = 2  # 방송일이 N일 이내면 최우선 처리
+LLM_DEFAULT_PRIORITIES = {"mission_news": 1, "testimony": 2}  # 작을수록 먼저 (0 = 방송 임박)
+LLM_WARMUP_PER_JOB_SEC = 600  # 모델 예열: 작업 1건당 예상 소요 시간 (keep_alive 계산용)
+LLM_WARMUP_MIN_KEEP_ALIVE = 900  # 모델 예열: 최소 keep_alive (초)
+LLM_WARMUP_MAX_KEEP_ALIVE = 4 * 3600  # 모델 예열: 최대 keep_alive (초)
+SUMMARY_QUEUE_POLL_SEC = 30  # 요약 대기열 확인 간격 (초)
+SUMMARY_RETRY_BASE_SEC = 60  # 요약 재시도 기본 간격 (실패할 때마다 2배)
+SUMMARY_RETRY_MAX_SEC = 3600  # 요약 재시도 최대 간격 (초)
+
+# === 서킷 브레이커 ===
+BREAKER_FAILURE_THRESHOLD = 3  # 연속 실패 N회 시 차단
+BREAKER_RESET_TIMEOUT = 60  # 차단 후 헬스 체크까지 대기 (초)
+BREAKER_PROBE_TIMEOUT = 5  # 헬스 체크 요청 타임아웃 (초)
+
+# === HTTP 클라이언트 ===
+HTTP_POOL_MAXSIZE = 10  # 호스트별 Keep-Alive 연결 수
+HTTP_CONNECT_TIMEOUT = 10  # 기본 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = 60  # 기본 응답 타임아웃 (초)
+HTTP_RETRIES = 2  # 연결 실패/일시 장애(502/503/504, GET만) 재시도 횟수
+HTTP_RETRY_BACKOFF = 0.5  # 재시도 간격 계수 (0.5, 1, 2 ...초)
+HTTP_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)  # 응답 시간 분포 구간 (초)
+
+# === 텔레그램 ===
+TELEGRAM_OUTBOX_POLL_SEC = 30  # 전송 대기열 확인 간격 (초)
+TELEGRAM_GLOBAL_PER_SEC = 30  # 전체 전송 한도 (초당 건수)
+TELEGRAM_CHAT_PER_MIN = 20  # 채팅방별 전송 한도 (분당 건수, 그룹/채널 기준)
+TELEGRAM_RETRY_BASE_SEC = 5  # 전송 재시도 기본 간격 (실패할 때마다 2배)
+TELEGRAM_RETRY_MAX_SEC = 600  # 전송 재시도 최대 간격 (초)
+TELEGRAM_MAX_ATTEMPTS = 10  # 이 횟수만큼 실패하면 전송 포기
+TELEGRAM_OUTBOX_LEASE_SEC = 300  # 전송 중 항목 점유 시간 (다른 프로세스의 전송기는 건너뜀, 만료되면 다시 전송)
+TELEGRAM_MESSAGE_LIMIT = 4096  # 메시지 1개 최대 글자 수
+TELEGRAM_DIGEST_WINDOW_SEC = 1800  # 묶음 전송: 배치 작업이 멈추거나 배치 없는 항목이 이 시간 동안 쌓이면 전송
+TELEGRAM_DIGEST_POLL_SEC = 30  # 묶음 전송 확인 간격 (초)
+
+# === 엔드포인트 풀 ===
+ENDPOINT_QUEUE_POSITION_TTL = 120  # 서버가 알려준 대기열 순번을 부하 계산에 반영하는 시간 (초)
+
+# === 작업 파이프라인 ===
+PIPELINE_QUEUE_SIZE = 2  # 단계 사이 큐 크기 (가득 차면 앞 단계가 대기)
+PIPELINE_STAGE_WORKERS = {"media": 1, "stt": 2, "llm": 1, "thumbnail": 1, "archive": 1, "sheet": 1}  # 단계별 작업자 수
+RESOURCE_POOL_LIMITS = {"ffmpeg": 2, "stt": 3, "llm": 1, "nas_io": 1}  # 자원별 동시 사용 수 (단계 작업자 수와 별도로 전체 제한)
+RESOURCE_UTILIZATION_WINDOW = 600  # 자원 사용률 계산 구간 (최근 N초)
+JOB_MAX_ATTEMPTS = 3  # 처리 중 앱이 재시작된 작업을 다시 실행하는 최대 횟수
+JOB_LOG_LIMIT = 200  # 작업별로 저장하는 최근 로그 줄 수
+JOB_HISTORY_DAYS = 7  # 종료된 작업 기록 보관 기간 (일)
+JOB_PROGRESS_SAVE_SEC = 1.0  # 진행률 저장 최소 간격 (초)
+CHECKPOINT_RETENTION_DAYS = 14  # 완료되지 않은 작업의 단계별 결과 보관 기간 (일)
+
+# === 캐시 관련 ===
+TRANSCRIPT_CACHE_MAX_MB = 512  # STT 결과 캐시 최대 용량 (MB)
+SUMMARY_CACHE_MAX_MB = 64  # LLM 요약 캐시 최대 용량 (MB)
+CACHE_EVICT_TARGET_RATIO = 0.9  # 용량 초과 시 최대 용량의 이 비율까지 정리 (매 저장마다 정리하지 않도록 여유 확보)
 
 # === 썸네일 관련 ===
 THUMBNAIL_ASPECT_RATIO = (4, 3)  # 가로:세로 비율
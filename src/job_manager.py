@@ -5,41 +5,255 @@ import uuid
 from datetime import datetime
 import logging
 
+from src.config_loader import settings
+from src.constants import PIPELINE_QUEUE_SIZE, PIPELINE_STAGE_WORKERS, JOB_MAX_ATTEMPTS, JOB_PROGRESS_SAVE_SEC
+from src.job_pipeline import StagePipeline
+from src.job_store import JobStore, PROCESS_TOKEN
+from src.resource_pool import hold_resources
+
 class JobManager:
+    """
+    백그라운드 작업 관리 (작업 목록/상태는 JobStore에 저장 - 앱 재시작 후에도 유지)
+    self.jobs에는 실행 중인 작업의 실행 함수/실행기만 보관합니다.
+    """
     def __init__(self):
+        self.store = JobStore()
         self.job_queue = queue.Queue()
-        self.jobs = {} # job_id -> job_info
+        self.jobs = {} # job_id -> job_info (이 관리자가 실행할 작업)
+        self._jobs_lock = threading.Lock() # self.jobs는 등록/단계 작업자 스레드에서 함께 사용
+        self._handlers = {} # handler 이름 -> (runner_factory, stages, resources)
         self._shutdown_event = threading.Event()
         self._thread = threading.Thread(target=self._worker, daemon=True)
         self._thread.start()
         print("JobManager background thread started.")
 
+        # 단계별 파이프라인 (단계 구성별로 1개, 첫 단계별 작업 등록 시 생성)
+        self.pipeline_config = ((settings.config.get('job_manager', {}) or {}).get('pipeline', {}) or {}) if settings else {}
+        self.pipeline_enabled = bool(self.pipeline_config.get('enabled', True))
+        self._pipelines = {}
+        self._pipelines_lock = threading.Lock()
+
+    def register_handler(self, name, runner_factory, stages, resources=None):
+        """
+        단계별 작업 종류 등록 (재시작 후 저장된 작업 데이터만으로 다시 실행하기 위해 이름으로 찾음)
+        :param runner_factory: callable(progress_callback, log_callback, status_callback, **kwargs) -> runner
+            runner.run_stage(stage) -> 다음 단계 진행 여부, runner.result, runner.finish(error)
+        :param stages: 단계 이름 목록 (같은 구성의 작업은 같은 파이프라인 공유)
+        :param resources: {단계: (자원 이름, ...)} 단계 실행 동안 확보할 자원 (job_manager.resources 설정으로 동시 사용 수 제한)
+        """
+        self._handlers[name] = (runner_factory, list(stages), resources or {})
+
     def add_job(self, job_type, title, task_func, **kwargs):
         """
         Add a job to the queue.
+        실행 함수는 저장되지 않으므로 앱이 재시작되면 이 작업은 실패로 표시됩니다 (재실행이 필요하면 add_staged_job).
         :param job_type: 'testimony' or 'mission_news'
         :param title: Display title for the job
         :param task_func: Function to execute. Must accept (status_callback, log_callback) as kwargs or args.
         :param kwargs: Arguments to pass to task_func
         """
-        job_id = str(uuid.uuid4())
+        job_id = self._register(job_type, title, kwargs, task_func=task_func)
+        self._dispatch(job_id)
+        return job_id
+
+    def add_staged_job(self, job_type, title, handler, **kwargs):
+        """
+        Add a job that runs stage by stage.
+        파이프라인 사용 시 단계별 작업자가 나눠서 실행 (여러 작업의 다른 단계가 동시에 진행),
+        사용하지 않으면 일반 작업처럼 한 작업씩 모든 단계를 순서대로 실행합니다.
+        :param handler: register_handler로 등록한 작업 종류 이름
+        :param kwargs: runner_factory에 넘길 작업 데이터 (JSON으로 저장 - 재시작 후 다시 실행)
+        """
+        if handler not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 종류: {handler}")
+        job_id = self._register(job_type, title, kwargs, handler=handler)
+        self._dispatch(job_id)
+        return job_id
+
+    def recover(self):
+        """
+        시작 시 저장된 미완료 작업 다시 실행 (이전 실행에서 처리 중이던 작업은 처음 단계부터)
+        실행 함수를 다시 찾을 수 없는 작업(handler 없음)은 실패 처리
+        """
+        resumed = 0
+        for row in self.store.recover(JOB_MAX_ATTEMPTS):
+            if row['handler'] in self._handlers:
+                self._register(row['type'], row['title'], row['kwargs'], handler=row['handler'], row=row)
+                self._dispatch(row['id'])
+                resumed += 1
+            elif row['owner'] != PROCESS_TOKEN:
+                self.store.update(row['id'], status='failed', error="앱 재시작으로 중단됨 - 다시 등록해 주세요")
+        if resumed:
+            print(f"♻️ 재시작 전 미완료 작업 {resumed}건을 다시 실행합니다.")
+        return resumed
+
+    def _register(self, job_type, title, kwargs, task_func=None, handler=None, row=None):
+        """작업 등록 (row: 저장된 작업을 다시 실행하는 경우)"""
+        job_id = row['id'] if row else str(uuid.uuid4())
         job_info = {
             'id': job_id,
             'type': job_type,
             'title': title,
             'task_func': task_func,
+            'handler': handler,
             'kwargs': kwargs,
-            'submitted_at': datetime.now(),
+            'submitted_at': row['submitted_at'] if row else datetime.now(),
             'status': 'queued', # queued, processing, completed, failed
+            'stage': None,
             'progress': 0,
-            'logs': [],
+            'progress_label': None,
+            'logs': list(row['logs']) if row else [],
             'result': None,
             'error': None
         }
-        self.jobs[job_id] = job_info
-        self.job_queue.put(job_id)
+        if row is None:
+            self.store.add(job_id, job_type, title, kwargs, handler=handler)
+        with self._jobs_lock:
+            self.jobs[job_id] = job_info
         return job_id
 
+    def _job_info(self, job_id):
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def _drop(self, job_id):
+        with self._jobs_lock:
+            self.jobs.pop(job_id, None)
+
+    def _dispatch(self, job_id):
+        job_info = self._job_info(job_id)
+        if job_info['handler'] and self.pipeline_enabled:
+            _, stages, resources = self._handlers[job_info['handler']]
+            self._pipeline_for(stages, resources).submit(job_id)
+        else:
+            self.job_queue.put(job_id)
+
+    def _claim(self, job_info):
+        """
+        작업 점유 (DB에서 대기 -> 처리 중, 시도 횟수 +1)
+        다른 작업자/같은 프로세스의 이전 관리자가 이미 가져간 작업이면 False (이 관리자에서는 제외)
+        """
+        if not self.store.claim(job_info['id']):
+            self._drop(job_info['id'])
+            return False
+        job_info['status'] = 'processing'
+        job_info['started_at'] = datetime.now()
+        if job_info['logs']:
+            self._callbacks(job_info)['log_callback']("재시작 후 다시 실행")
+        return True
+
+    def _pipeline_for(self, stages, resources=None):
+        key = (tuple(stages), tuple(sorted((resources or {}).items())))
+        with self._pipelines_lock:
+            if key not in self._pipelines:
+                workers = dict(PIPELINE_STAGE_WORKERS)
+                workers.update(self.pipeline_config.get('workers', {}) or {})
+                self._pipelines[key] = StagePipeline(
+                    stages, run=self._run_stage, on_done=self._finish_staged, on_start=self._start_stage,
+                    workers=workers, queue_size=self.pipeline_config.get('queue_size', PIPELINE_QUEUE_SIZE),
+                    resources=resources
+                )
+            return self._pipelines[key]
+
+    def _start_stage(self, job_id, stage):
+        job_info = self._job_info(job_id)
+        if job_info is None or job_info['status'] == 'queued' and not self._claim(job_info):
+            return
+        job_info['stage'] = stage
+        job_info['progress_label'] = None
+        self.store.update(job_id, stage=stage, progress=job_info['progress'], progress_label=None)
+
+    def _new_runner(self, job_info):
+        runner_factory = self._handlers[job_info['handler']][0]
+        return runner_factory(**self._callbacks(job_info), **job_info['kwargs'])
+
+    def _run_stage(self, job_id, stage):
+        job_info = self._job_info(job_id)
+        if job_info is None:
+            return False # 다른 작업자가 점유한 작업
+        if job_info.get('runner') is None:
+            job_info['runner'] = self._new_runner(job_info)
+        return job_info['runner'].run_stage(stage)
+
+    def _finish_staged(self, job_id, error):
+        job_info = self._job_info(job_id)
+        if job_info is None:
+            return
+        runner = job_info.pop('runner', None)
+        if runner is not None:
+            runner.finish(error)
+        if error is None:
+            self._complete(job_info, runner.result if runner is not None else None)
+        else:
+            self._fail(job_info, error)
+
+    def _run_all(self, job_info, callbacks):
+        """파이프라인 미사용 시 단계별 작업을 한 작업자에서 처음부터 끝까지 실행"""
+        runner_factory, stages, resources = self._handlers[job_info['handler']]
+        runner = runner_factory(**callbacks, **job_info['kwargs'])
+        error = None
+        try:
+            for stage in stages:
+                job_info['stage'] = stage
+                self.store.update(job_info['id'], stage=stage)
+                with hold_resources(resources.get(stage)):
+                    proceed = runner.run_stage(stage)
+                if not proceed:
+                    break
+            return runner.result
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            runner.finish(error)
+
+    def _complete(self, job_info, result):
+        job_info['status'] = 'completed'
+        job_info['result'] = result
+        job_info['completed_at'] = datetime.now()
+        job_info['progress'] = 100
+        job_info['progress_label'] = None
+        self.store.update(job_info['id'], status='completed', result=result, progress=100, progress_label=None)
+        self._drop(job_info['id'])
+
+    def _fail(self, job_info, error):
+        self._callbacks(job_info)['log_callback'](f"CRITICAL ERROR: {error}")
+        job_info['status'] = 'failed'
+        job_info['error'] = str(error)
+        self.store.update(job_info['id'], status='failed', error=str(error), progress_label=None)
+        self._drop(job_info['id'])
+
+    def pipeline_stats(self):
+        """대시보드용 파이프라인 단계별 현황"""
+        with self._pipelines_lock:
+            pipelines = list(self._pipelines.values())
+        return [stage for p in pipelines for stage in p.snapshot()]
+
+    def _callbacks(self, job_info):
+        """작업별 진행/로그/상태 콜백 (진행률은 JOB_PROGRESS_SAVE_SEC 간격으로 저장)"""
+        job_id = job_info['id']
+
+        def update_progress(current, total, label=None):
+            # total을 알 수 없는 단계(LLM 스트리밍 등)는 진행률은 그대로 두고 라벨만 갱신
+            if total > 0:
+                job_info['progress'] = int((current / total) * 100)
+            if label is not None:
+                job_info['progress_label'] = label
+            now = time.monotonic()
+            if now - job_info.get('progress_saved_at', 0) >= JOB_PROGRESS_SAVE_SEC:
+                job_info['progress_saved_at'] = now
+                self.store.update(job_id, progress=job_info['progress'], progress_label=job_info['progress_label'])
+        
+        def log_msg(msg):
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            job_info['logs'].append(f"[{timestamp}] {msg}")
+            self.store.append_log(job_id, job_info['logs'])
+
+        def status_update(msg):
+             log_msg(f"STATUS: {msg}")
+
+        return {'progress_callback': update_progress, 'log_callback': log_msg, 'status_callback': status_update}
+
     def _worker(self):
         while not self._shutdown_event.is_set():
             try:
@@ -48,67 +262,103 @@ class JobManager:
             except queue.Empty:
                 continue
 
-            job_info = self.jobs[job_id]
-            job_info['status'] = 'processing'
-            job_info['started_at'] = datetime.now()
+            job_info = self._job_info(job_id)
+            if job_info is None or not self._claim(job_info):
+                self.job_queue.task_done()
+                continue
             
             # Define callbacks to capture state
-            def update_progress(current, total):
-                if total > 0:
-                    job_info['progress'] = int((current / total) * 100)
-                else:
-                    job_info['progress'] = 0
-            
-            def log_msg(msg):
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                job_info['logs'].append(f"[{timestamp}] {msg}")
-
-            def status_update(msg):
-                 log_msg(f"STATUS: {msg}")
+            callbacks = self._callbacks(job_info)
 
             try:
                 # Execute the function
-                # The task_func should accept specific callbacks if they are designed to support them
-                # Adapting to our existing JobProcessor which expects (jobs, progress_callback)
-                # But here we are processing ONE job at a time usually, or we wrap it.
-                
-                # We'll assume task_func is a wrapper that takes these callbacks.
-                result = job_info['task_func'](
-                    progress_callback=update_progress,
-                    log_callback=log_msg,
-                    status_callback=status_update,
-                    **job_info['kwargs']
-                )
-                
-                job_info['status'] = 'completed'
-                job_info['result'] = result
-                job_info['completed_at'] = datetime.now()
-                job_info['progress'] = 100
+                # 단계별 작업(handler)은 등록된 실행기로 모든 단계를 순서대로 실행
+                if job_info['handler']:
+                    result = self._run_all(job_info, callbacks)
+                else:
+                    result = job_info['task_func'](**callbacks, **job_info['kwargs'])
+                self._complete(job_info, result)
                 
             except Exception as e:
-                job_info['status'] = 'failed'
-                job_info['error'] = str(e)
-                log_msg(f"CRITICAL ERROR: {e}")
+                self._fail(job_info, e)
             finally:
                 self.job_queue.task_done()
 
     def get_all_jobs(self):
-        return list(self.jobs.values())
+        """대시보드용 작업 목록 (저장된 작업 기준 - 재시작 전 작업 포함)"""
+        return self.store.list()
 
     def get_job(self, job_id):
-        return self.jobs.get(job_id)
+        return self.store.get(job_id)
 
     def clear_completed(self):
-        """Remove completed or failed jobs to clean up memory"""
-        keys_to_remove = [k for k, v in self.jobs.items() if v['status'] in ['completed', 'failed']]
-        for k in keys_to_remove:
-            del self.jobs[k]
+        """Remove completed or failed jobs from the job history"""
+        self.store.clear_finished()
 
 # Singleton Pattern for Streamlit
 # We will instantiate this in app.py using st.cache_resource
 
 import streamlit as st
 
+def _schedule_stt_recovery(mgr):
+    """재시작 전에 STT 서버에 제출된 Job이 남아 있으면 결과 회수 작업을 큐에 등록"""
+    try:
+        from src.modules.stt_module import ServerSTT
+        stt = ServerSTT()
+        if not stt.job_store or not stt.job_store.has_pending():
+            return
+
+        def recover(progress_callback, log_callback, status_callback):
+            return stt.resume_pending_jobs(log_callback=log_callback)
+
+        mgr.add_job('system', 'STT 미완료 작업 복구', recover)
+    except Exception as e:
+        print(f"⚠️ STT 작업 복구 등록 실패: {e}")
+
+def _start_deferred_summarizer():
+    """요약 대기열 백그라운드 처리 시작 (재시작 전에 남은 항목도 이어서 처리)"""
+    try:
+        from src.services.deferred_summarizer import get_deferred_summarizer
+        get_deferred_summarizer()
+    except Exception as e:
+        print(f"⚠️ 요약 대기열 처리 시작 실패: {e}")
+
+def _start_telegram_outbox():
+    """텔레그램 전송 대기열/묶음 전송 백그라운드 시작 (재시작 전에 남은 항목도 이어서 전송)"""
+    try:
+        from src.modules.telegram_outbox import get_outbox_sender, outbox_enabled
+        from src.modules.telegram_digest import get_digest, digest_enabled
+        if outbox_enabled():
+            get_outbox_sender()
+        if digest_enabled():
+            get_digest()
+    except Exception as e:
+        print(f"⚠️ 텔레그램 전송 대기열 시작 실패: {e}")
+
+def _register_job_handlers(mgr):
+    """재시작 후 다시 실행할 수 있는 작업 종류 등록 (시트 행 처리)"""
+    try:
+        from src.services.job_processor import StagedJob
+
+        # 단계별 실행기 (미디어 -> STT -> 요약 -> 썸네일 -> 아카이브 -> 시트, 단계마다 작업자가 따로 처리)
+        def make_runner(progress_callback, log_callback, status_callback, job_data, digest_batch=None):
+            return StagedJob(
+                job_data, digest_batch=digest_batch,
+                log_callback=log_callback,
+                status_callback=status_callback,
+                progress_callback=progress_callback
+            )
+
+        mgr.register_handler('sheet_job', make_runner, StagedJob.stages, StagedJob.resources)
+    except Exception as e:
+        print(f"⚠️ 작업 종류 등록 실패: {e}")
+
 @st.cache_resource
 def get_job_manager():
-    return JobManager()
+    mgr = JobManager()
+    _register_job_handlers(mgr)
+    mgr.recover()
+    _schedule_stt_recovery(mgr)
+    _start_deferred_summarizer()
+    _start_telegram_outbox()
+    return mgr
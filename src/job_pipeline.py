@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+
+from src.resource_pool import hold_resources
+
+
+class StageStats:
+    """단계별 처리 통계 (대시보드용)"""
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.active = 0
+        self.processed = 0
+        self.failed = 0
+        self.busy_sec = 0.0
+        self.wait_sec = 0.0 # 이 단계 큐에서 기다린 시간 합계
+        self.resource_wait_sec = 0.0 # 자원 확보까지 기다린 시간 합계
+
+
+class StagePipeline:
+    """
+    단계별 작업자 + 단계 사이 크기 제한 큐로 여러 작업을 겹쳐서 처리합니다.
+    (작업 N+1의 오디오 추출 / 작업 N의 STT / 작업 N-1의 요약이 동시에 진행)
+    - 단계마다 작업자 수 지정, 한 작업의 단계는 순서대로 하나씩 실행
+    - 다음 단계 큐가 가득 차면 앞 단계 작업자가 대기 (느린 단계 앞에 중간 결과가 쌓이지 않음)
+    - 첫 단계 큐는 크기 제한 없음 (작업 등록은 기다리지 않음)
+
+    :param run: callable(item, stage) -> bool, False면 이후 단계 생략
+    :param on_start: callable(item, stage), 단계 시작 직전 (진행 상태 표시용)
+    :param on_done: callable(item, error), 마지막 단계 완료/중단/예외 시 1회
+    :param resources: {단계: (자원 이름, ...)} 단계 실행 동안 확보할 자원 (resource_pool)
+    """
+    def __init__(self, stages, run, on_done, workers=None, queue_size=2, on_start=None, resources=None,
+                 name="pipeline"):
+        self.stages = list(stages)
+        self.run = run
+        self.on_done = on_done
+        self.on_start = on_start
+        self.resources = resources or {}
+        workers = workers or {}
+        self.queues = [queue.Queue()] + [queue.Queue(maxsize=max(1, int(queue_size))) for _ in self.stages[1:]]
+        self.stats = [StageStats(stage, max(1, int(workers.get(stage, 1)))) for stage in self.stages]
+        self._lock = threading.Lock()
+
+        for index, stats in enumerate(self.stats):
+            for n in range(stats.workers):
+                threading.Thread(
+                    target=self._worker, args=(index,), daemon=True, name=f"{name}-{stats.name}-{n}"
+                ).start()
+
+    def submit(self, item):
+        self.queues[0].put((item, time.monotonic()))
+
+    def _worker(self, index):
+        stage = self.stages[index]
+        stats = self.stats[index]
+        while True:
+            item, queued_at = self.queues[index].get()
+            started = time.monotonic()
+            with self._lock:
+                stats.active += 1
+                stats.wait_sec += started - queued_at
+
+            error = None
+            proceed = False
+            waited = 0.0
+            try:
+                with hold_resources(self.resources.get(stage)) as waited:
+                    if self.on_start:
+                        self.on_start(item, stage)
+                    proceed = self.run(item, stage) is not False
+            except Exception as e:
+                error = e
+            finally:
+                with self._lock:
+                    stats.active -= 1
+                    stats.busy_sec += time.monotonic() - started - waited
+                    stats.resource_wait_sec += waited
+                    stats.processed += 1
+                    stats.failed += error is not None
+
+            if error is None and proceed and index + 1 < len(self.stages):
+                self.queues[index + 1].put((item, time.monotonic())) # 가득 차 있으면 대기
+            else:
+                try:
+                    self.on_done(item, error)
+                except Exception as e:
+                    print(f"⚠️ 파이프라인 완료 처리 오류: {e}")
+
+    def snapshot(self):
+        """단계별 현황 [{'stage', 'workers', 'active', 'queued', 'processed', 'failed', 'avg_sec', 'avg_wait_sec', 'avg_resource_wait_sec'}]"""
+        with self._lock:
+            return [
+                {
+                    'stage': s.name,
+                    'workers': s.workers,
+                    'active': s.active,
+                    'queued': self.queues[i].qsize(),
+                    'processed': s.processed,
+                    'failed': s.failed,
+                    'avg_sec': s.busy_sec / s.processed if s.processed else 0.0,
+                    'avg_wait_sec': s.wait_sec / s.processed if s.processed else 0.0,
+                    'avg_resource_wait_sec': s.resource_wait_sec / s.processed if s.processed else 0.0
+                }
+                for i, s in enumerate(self.stats)
+            ]
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+
+from src import state_db
+from src.constants import JOB_LOG_LIMIT, JOB_HISTORY_DAYS
+
+# 이 프로세스의 식별자 (작업 점유 기록용 - 재시작 후에는 값이 바뀌므로 이전 프로세스가 점유한 작업을 구분)
+PROCESS_TOKEN = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class JobStore:
+    """
+    백그라운드 작업 목록 (재시작/캐시 초기화 후에도 유지)
+    작업 상태/단계/시도 횟수/시각/결과/최근 로그를 저장하고, 작업자는 claim으로 작업을 점유합니다.
+    실행 함수는 저장하지 않고 handler 이름으로 다시 찾습니다 (handler 없는 작업은 재시작 시 실패 처리).
+    """
+    def __init__(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    handler TEXT,
+                    kwargs TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    owner TEXT,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    progress_label TEXT,
+                    logs TEXT NOT NULL DEFAULT '[]',
+                    result TEXT,
+                    error TEXT,
+                    submitted_at REAL NOT NULL,
+                    started_at REAL,
+                    completed_at REAL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, submitted_at)")
+
+    def add(self, job_id, job_type, title, kwargs, handler=None):
+        now = time.time()
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, job_type, title, handler, kwargs, status, owner, submitted_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, job_type, title, handler, json.dumps(kwargs, ensure_ascii=False, default=str),
+                 PROCESS_TOKEN, now, now)
+            )
+
+    def claim(self, job_id):
+        """대기 중인 작업 점유 (다른 작업자/이전 관리자가 이미 가져갔으면 False)"""
+        now = time.time()
+        with closing(state_db.connect()) as conn, conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'processing', owner = ?, attempts = attempts + 1, "
+                "started_at = ?, completed_at = NULL, error = NULL, stage = NULL, progress = 0, "
+                "progress_label = NULL, updated_at = ? WHERE job_id = ? AND status = 'queued'",
+                (PROCESS_TOKEN, now, now, job_id)
+            ).rowcount == 1
+
+    def update(self, job_id, **fields):
+        """상태/단계/진행률/로그/결과 등 갱신 (logs, result는 JSON으로 저장)"""
+        for key in ('logs', 'result'):
+            if key in fields and fields[key] is not None:
+                fields[key] = json.dumps(fields[key], ensure_ascii=False, default=str)
+        if fields.get('status') in ('completed', 'failed'):
+            fields.setdefault('completed_at', time.time())
+        fields['updated_at'] = time.time()
+        columns = ", ".join(f"{key} = ?" for key in fields)
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE job_id = ?", (*fields.values(), job_id))
+
+    def append_log(self, job_id, logs):
+        """최근 JOB_LOG_LIMIT줄만 저장"""
+        self.update(job_id, logs=logs[-JOB_LOG_LIMIT:])
+
+    def get(self, job_id):
+        with closing(state_db.connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, limit=200):
+        """대시보드용 (미완료 작업 전체 + 최근 종료 작업 limit개)"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status IN ('queued', 'processing') "
+                "UNION ALL SELECT * FROM (SELECT * FROM jobs WHERE status NOT IN ('queued', 'processing') "
+                "ORDER BY completed_at DESC LIMIT ?)",
+                (limit,)
+            ).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def recover(self, max_attempts):
+        """
+        시작 시 이전 프로세스가 남긴 미완료 작업 정리 -> 대기 중인 작업 목록 (등록 순)
+        - 이전 프로세스가 처리 중이던 작업은 대기 상태로 되돌림 (같은 프로세스의 이전 관리자가 처리 중인 작업은 그대로)
+        - owner: 작업을 등록/점유한 프로세스 (이전 프로세스에서 넘어온 작업은 None)
+        - 시도 횟수를 모두 쓴 작업(처리 중 프로세스가 계속 죽는 경우 등)은 실패 처리
+        """
+        now = time.time()
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, completed_at = ?, updated_at = ? "
+                "WHERE status = 'processing' AND owner IS NOT ? AND attempts >= ?",
+                (f"처리 중 중단 {max_attempts}회 - 재시도 중지", now, now, PROCESS_TOKEN, max_attempts)
+            )
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', owner = NULL, stage = NULL, updated_at = ? "
+                "WHERE status = 'processing' AND owner IS NOT ?",
+                (now, PROCESS_TOKEN)
+            )
+            conn.execute(
+                "UPDATE jobs SET owner = NULL WHERE status = 'queued' AND owner IS NOT ?", (PROCESS_TOKEN,)
+            )
+            # 오래된 종료 작업 정리
+            conn.execute(
+                "DELETE FROM jobs WHERE status NOT IN ('queued', 'processing') AND completed_at < ?",
+                (now - JOB_HISTORY_DAYS * 86400,)
+            )
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY submitted_at"
+            ).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def clear_finished(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("DELETE FROM jobs WHERE status NOT IN ('queued', 'processing')")
+
+    @staticmethod
+    def _to_dict(row):
+        d = dict(row)
+        d['id'] = d.pop('job_id')
+        d['type'] = d.pop('job_type')
+        d['kwargs'] = json.loads(d['kwargs'])
+        d['logs'] = json.loads(d['logs'] or '[]')
+        d['result'] = json.loads(d['result']) if d['result'] else None
+        for key in ('submitted_at', 'started_at', 'completed_at'):
+            d[key] = datetime.fromtimestamp(d[key]) if d[key] else None
+        return d
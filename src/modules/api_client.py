@@ -1,7 +1,56 @@
 import requests
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.config_loader import settings
+from src.constants import (
+    LLM_CONNECT_TIMEOUT, LLM_READ_TIMEOUT, LLM_FIRST_TOKEN_TIMEOUT,
+    LLM_INACTIVITY_TIMEOUT, LLM_PROGRESS_INTERVAL, LLM_MAX_INPUT_CHARS,
+    LLM_MAP_REDUCE_THRESHOLD_TOKENS, LLM_MAP_CHUNK_TOKENS, LLM_MAP_MAX_PARALLEL,
+    LLM_COMPACT_MAX_TOKENS, LLM_MAX_CONCURRENT, LLM_WARMUP_PER_JOB_SEC, LLM_WARMUP_MIN_KEEP_ALIVE, LLM_WARMUP_MAX_KEEP_ALIVE
+)
+from src.modules.circuit_breaker import probe_timeout, CircuitOpenError
+from src.modules.endpoint_pool import get_endpoint_pool
+from src.modules.http_client import get_http_client
+from src.modules.llm_scheduler import get_llm_scheduler, priority_for
+from src.modules.result_cache import get_summary_cache, text_sha256
+from src.utils.token_estimator import estimate_tokens, split_by_token_budget
+from src.utils.transcript_compactor import compact_transcript
+
+# 분할 요약(map) 단계 전용 지시문 - 최종 포맷은 reduce 단계에서 docs/prompts의 시스템 프롬프트로 작성
+MAP_SYSTEM_PROMPT = (
+    "당신은 긴 음성 기록(STT)의 한 구간을 정리하는 보조 에디터입니다.\n"
+    "입력은 전체 원문 중 일부 구간입니다. 최종 원고를 쓰지 말고, 이 구간의 내용을 빠짐없이 개조식으로 정리하세요.\n"
+    "* 인물(이름, 직분, 국가), 시기, 장소, 숫자, 사건의 흐름을 사실 위주로 기록합니다.\n"
+    "* 인상 깊은 발언은 따옴표로 원문 그대로 1~2개 발췌합니다.\n"
+    "* STT 오타와 반복은 문맥에 맞게 정리하되, 없는 내용을 추가하지 않습니다.\n"
+    "* 의미 있는 내용이 없으면 '내용 없음'이라고만 출력합니다."
+)
+
+
+# 시스템 프롬프트 캐시: path -> (mtime, 정규화된 본문)
+_prompt_cache = {}
+_prompt_cache_lock = threading.Lock()
+
+
+def normalize_prompt(text):
+    """
+    시스템 프롬프트 정규화 - 요청마다 바이트 단위로 동일한 prefix 유지 (서버 프롬프트 캐시 재사용)
+    BOM 제거, 줄바꿈 LF 통일, 줄 끝 공백/앞뒤 빈 줄 제거
+    """
+    text = text.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip("\n")
+
+
+class LLMInactivityTimeout(RuntimeError):
+    """스트리밍 응답 도중 일정 시간 이상 토큰이 오지 않음"""
+
+
+class LLMIncompleteStream(RuntimeError):
+    """스트리밍 응답이 완료 신호([DONE]/finish_reason) 없이 끊겼거나 본문이 비어 있음"""
+
 
 class APIClient:
     """
@@ -11,50 +60,226 @@ class APIClient:
     def __init__(self):
         self.config = settings.gpu_config
         self.base_url = self.config.get('api_url') # 예: http://aiteam.tplinkdns.com:10001/ollama/v1
-        self.base_url = self.config.get('api_url') # 예: http://aiteam.tplinkdns.com:10001/ollama/v1
         self.api_key = self.config.get('api_key')
         self.model = self.config.get('model', 'gpt-oss:120b').strip() # 공백 제거 안전장치
+        self.temperature = self.config.get('temperature', 0.7)
 
-    def analyze_text(self, input_text, prompt_type="testimony"):
-        """
-        [2단계: LLM] 변환된 텍스트(input_text)를 받아 요약문을 반환합니다.
-        """
-        
+        # 긴 원문 분할 요약 (구간별 요약 병렬 요청 -> 시스템 프롬프트로 최종 요약)
+        map_reduce = self.config.get('map_reduce', {})
+        self.map_reduce_enabled = bool(map_reduce.get('enabled', False))
+        self.map_reduce_threshold = int(map_reduce.get('threshold_tokens', LLM_MAP_REDUCE_THRESHOLD_TOKENS))
+        self.map_chunk_tokens = int(map_reduce.get('chunk_tokens', LLM_MAP_CHUNK_TOKENS))
+        self.map_max_parallel = max(1, int(map_reduce.get('max_parallel', LLM_MAP_MAX_PARALLEL)))
+
+        # STT 원문 정리 (중복/반복/군말 제거 -> 입력 토큰 절감)
+        compaction = self.config.get('compaction', {})
+        self.compaction_enabled = bool(compaction.get('enabled', False))
+        self.compaction_max_tokens = int(compaction.get('max_tokens', LLM_COMPACT_MAX_TOKENS))
+
+        cache_enabled = (settings.config.get('cache', {}) or {}).get('enabled', True)
+        self.cache = get_summary_cache() if cache_enabled else None
+
+        # Keep-Alive 연결 풀 + 요청 통계 (프로세스 전역)
+        self.http = get_http_client('llm')
+        # GPU 서버 풀 (endpoints 목록 또는 단일 api_url) - 요청마다 진행 중 요청이 가장 적은 서버 선택
+        # 서버별 브레이커: 다운된 서버는 Connect Timeout을 매번 기다리지 않고 제외 (복구는 헬스 체크로 자동 감지)
+        self.pool = get_endpoint_pool('llm', self.config, probe=self._probe)
+        if self.pool.endpoints:
+            self.base_url, self.api_key = self.pool.endpoints[0].url, self.pool.endpoints[0].api_key
+        # GPU 서버 동시 요청 수 제한 + 우선순위 대기열 (프로세스 전역, 서버 수만큼 슬롯)
+        self.scheduler = self._scheduler_for('llm', self.pool)
+
+        # 모델 라우팅: 시트 종류/원문 토큰 수/대기열 길이에 따라 모델(서버)과 타임아웃 선택
+        self.default_route = self._build_route({'name': 'default'})
+        routing = self.config.get('routing', {}) or {}
+        self.routes = []
+        if routing.get('enabled', False):
+            self.routes = [self._build_route(rule) for rule in (routing.get('routes') or [])]
+
+    @staticmethod
+    def is_error_result(text):
+        """analyze_text가 반환한 에러 문자열 여부"""
+        return not text or str(text).startswith(("[에러]", "[단순 요약]"))
+
+    def _chat_url(self, base_url=None):
         # 현재 API 주소는 'ollama/v1' --> OpenAI Chat Completion API 규격일 가능성이 높습니다.
         # Chat Completion 엔드포인트 구성
-        if self.base_url.endswith("/chat/completions"):
-            url = self.base_url
+        base_url = base_url or self.base_url
+        if base_url.endswith("/chat/completions"):
+            return base_url
+        return f"{base_url}/chat/completions"
+
+    def _probe(self, endpoint):
+        """헬스 체크: OpenAI 호환 /models 조회 (모델 로딩 없이 서버 응답만 확인)"""
+        models_url = self._chat_url(endpoint.url)[:-len("/chat/completions")] + "/models"
+        res = self.http.get(models_url, headers=self._headers(endpoint.api_key), timeout=probe_timeout())
+        return res.status_code < 500
+
+    def _scheduler_for(self, name, pool, max_concurrent=None):
+        """서버당 동시 요청 수 x 서버 수 슬롯의 대기열"""
+        per_endpoint = max_concurrent or (self.config.get('scheduler') or {}).get('max_concurrent', LLM_MAX_CONCURRENT)
+        return get_llm_scheduler(name, int(per_endpoint) * max(1, len(pool.endpoints)))
+
+    def _build_route(self, rule):
+        """
+        라우팅 규칙 -> 요청에 쓸 모델/서버/타임아웃 (지정하지 않은 항목은 gpu_server 기본값)
+        별도 서버(api_url 또는 endpoints 목록)를 쓰는 라우트는 서버 풀/장애 차단/대기열을 따로 관리합니다.
+        """
+        def option(key, default):
+            return rule.get(key, self.config.get(key, default))
+
+        name = str(rule.get('name') or rule.get('model') or 'route')
+        prompt_types = rule.get('prompt_types')
+        route = {
+            'name': name,
+            'model': str(rule.get('model', self.model)).strip(),
+            'stream': bool(option('stream', False)),
+            'connect_timeout': float(option('connect_timeout_sec', LLM_CONNECT_TIMEOUT)),
+            'read_timeout': float(option('read_timeout_sec', LLM_READ_TIMEOUT)),
+            'first_token_timeout': float(option('first_token_timeout_sec', LLM_FIRST_TOKEN_TIMEOUT)),
+            'inactivity_timeout': float(option('inactivity_timeout_sec', LLM_INACTIVITY_TIMEOUT)),
+            # 조건 (None = 제한 없음)
+            'prompt_types': [prompt_types] if isinstance(prompt_types, str) else prompt_types,
+            'min_tokens': rule.get('min_tokens'),
+            'max_tokens': rule.get('max_tokens'),
+            'min_queue': rule.get('min_queue'),
+            'max_queue': rule.get('max_queue')
+        }
+        if rule.get('api_url') or rule.get('endpoints'):
+            pool_config = {
+                'api_url': rule.get('api_url'),
+                'api_key': rule.get('api_key', self.api_key),
+                'endpoints': rule.get('endpoints')
+            }
+            route['pool'] = get_endpoint_pool(f"llm:{name}", pool_config, probe=self._probe)
+            route['scheduler'] = self._scheduler_for(f"llm:{name}", route['pool'], rule.get('max_concurrent'))
         else:
-            url = f"{self.base_url}/chat/completions"
-        
-        headers = {
+            route['pool'] = self.pool
+            route['scheduler'] = self.scheduler
+        return route
+
+    def select_route(self, prompt_type, input_tokens):
+        """
+        라우팅 규칙을 순서대로 확인해 첫 번째로 맞는 라우트 반환 (없으면 기본 모델)
+        - queue 조건은 기본 GPU 서버 대기열 길이 기준 (붐빌 때 작은 모델로 넘기기 등)
+        - 별도 서버 라우트가 차단 중이면 건너뜀
+        """
+        queue_depth = len(self.scheduler.snapshot()['waiting'])
+        for route in self.routes:
+            if not self._route_matches(route, prompt_type, input_tokens, queue_depth):
+                continue
+            if route['pool'] is not self.pool and not route['pool'].allow():
+                print(f"[API] ⛔ 라우트 '{route['name']}' 서버 차단 중 - 다음 규칙 확인")
+                continue
+            return route
+        return self.default_route
+
+    @staticmethod
+    def _route_matches(route, prompt_type, input_tokens, queue_depth):
+        if route['prompt_types'] and prompt_type not in route['prompt_types']:
+            return False
+        for value, low, high in (
+            (input_tokens, route['min_tokens'], route['max_tokens']),
+            (queue_depth, route['min_queue'], route['max_queue'])
+        ):
+            if low is not None and value < int(low):
+                return False
+            if high is not None and value > int(high):
+                return False
+        return True
+
+    def is_available(self):
+        """GPU 서버 요청 가능 여부 (차단 중이면 False)"""
+        return bool(self.pool.endpoints) and self.pool.allow()
+
+    def warm_up(self, job_count=1, background=True):
+        """
+        배치 시작 시 모델 미리 로드 (Ollama keep_alive)
+        첫 요약이 모델 로딩(VRAM 적재)을 기다리지 않도록, STT 단계와 동시에 백그라운드에서 진행합니다.
+        keep_alive = 작업 수 x 작업당 예상 시간 (최소/최대 범위 내)
+        """
+        warmup = self.config.get('warmup', {}) or {}
+        if not warmup.get('enabled', False) or job_count <= 0 or not self.is_available():
+            return None
+
+        keep_alive = job_count * float(warmup.get('per_job_sec', LLM_WARMUP_PER_JOB_SEC))
+        keep_alive = int(min(
+            float(warmup.get('max_keep_alive_sec', LLM_WARMUP_MAX_KEEP_ALIVE)),
+            max(float(warmup.get('min_keep_alive_sec', LLM_WARMUP_MIN_KEEP_ALIVE)), keep_alive)
+        ))
+        # 서버가 여러 대면 각 서버에 모두 적재 (url 지정은 서버 1대일 때만 사용)
+        url = warmup.get('url') if len(self.pool.endpoints) == 1 else None
+        targets = [e for e in self.pool.endpoints if e.breaker.allow()]
+
+        def run():
+            return all([self._send_warmup(keep_alive, endpoint, url) for endpoint in targets])
+
+        if not background:
+            return run()
+        thread = threading.Thread(target=run, daemon=True, name="llm-warmup")
+        thread.start()
+        return thread
+
+    def _warmup_url(self, endpoint, url=None):
+        """Ollama 네이티브 /api/generate 주소 (OpenAI 호환 '.../v1' 주소에서 유도)"""
+        if url:
+            return url
+        base = self._chat_url(endpoint.url)[:-len("/chat/completions")]
+        if base.endswith("/v1"):
+            return base[:-len("/v1")] + "/api/generate"
+        return None
+
+    def _send_warmup(self, keep_alive, endpoint, url=None):
+        """
+        빈 프롬프트 요청으로 모델만 적재 (토큰 생성 없음) -> 성공 여부 반환
+        네이티브 API가 없으면 OpenAI 호환 엔드포인트로 1토큰 요청 (keep_alive는 서버 기본값)
+        """
+        route = self.default_route
+        headers = self._headers(endpoint.api_key)
+        timeout = (route['connect_timeout'], route['first_token_timeout'])
+        started = time.monotonic()
+        try:
+            native_url = self._warmup_url(endpoint, url)
+            response = None
+            if native_url:
+                payload = {"model": route['model'], "prompt": "", "keep_alive": f"{keep_alive}s", "stream": False}
+                response = self.http.post(native_url, headers=headers, json=payload, timeout=timeout)
+            if response is None or response.status_code == 404:
+                payload = {
+                    "model": route['model'],
+                    "messages": [{"role": "user", "content": "ping"}],
+                    "max_tokens": 1,
+                    "keep_alive": f"{keep_alive}s"
+                }
+                response = self.http.post(self._chat_url(endpoint.url), headers=headers, json=payload, timeout=timeout)
+            if response.status_code != 200:
+                print(f"[API] ⚠️ 모델 예열 실패: {endpoint.name} (Status: {response.status_code})")
+                return False
+            print(
+                f"[API] 🔥 모델 예열 완료: {route['model']} @ {endpoint.name} "
+                f"({time.monotonic() - started:.1f}s, keep_alive {keep_alive}s)"
+            )
+            return True
+        except Exception as e:
+            print(f"[API] ⚠️ 모델 예열 실패: {endpoint.name} ({e})")
+            return False
+
+    def _headers(self, api_key=None):
+        return {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
+            "Authorization": f"Bearer {self.api_key if api_key is None else api_key}"
         }
 
-        # 프롬프트 설정 (Config에서 로드)
-        prompts_config = self.config.get('prompts', {})
-        # Fallback to default if not in config
-        if not prompts_config:
-            # Config에 없는 경우를 대비한 하드코딩 기본값 (안전장치)
-            prompts_config = settings.config.get('prompts', {})
-        
-        # prompt_type에 맞는 설정 가져오기 (testimony / mission_news)
-        target_prompt = prompts_config.get(prompt_type, {})
-        
-        system_instruction = ""
-        
+    def _load_system_prompt(self, prompt_type):
+        """docs/prompts의 시스템 프롬프트 로드 (Retry + No Fallback)"""
         # 파일 매핑: prompt_type -> filename
         prompt_files = {
             "testimony": "System_Prompt_Testimony.md",
             "mission_news": "System_Prompt_Mission.md"
         }
-        
-        
-        # [수정] 프롬프트 로드 로직 강화 (Retry + No Fallback)
-        import time
+
         max_retries = 3
-        
+
         target_file = prompt_files.get(prompt_type)
         if not target_file:
              # 파일 매핑 자체가 없는 경우 (치명적)
@@ -68,10 +293,18 @@ class APIClient:
         for attempt in range(max_retries):
             try:
                 if os.path.exists(prompt_path):
+                    # 파일이 바뀌지 않았으면 캐시된 본문 사용 (요청마다 동일한 system prefix)
+                    mtime = os.path.getmtime(prompt_path)
+                    with _prompt_cache_lock:
+                        cached = _prompt_cache.get(prompt_path)
+                    if cached and cached[0] == mtime:
+                        return cached[1]
                     with open(prompt_path, "r", encoding="utf-8") as f:
-                        system_instruction = f.read()
+                        system_instruction = normalize_prompt(f.read())
+                    with _prompt_cache_lock:
+                        _prompt_cache[prompt_path] = (mtime, system_instruction)
                     print(f"[API] 시스템 프롬프트 로드 완료: {prompt_path}")
-                    break # 성공 시 루프 탈출
+                    return system_instruction
                 else:
                     raise FileNotFoundError(f"프롬프트 파일 없음: {prompt_path}")
             except Exception as e:
@@ -82,57 +315,331 @@ class APIClient:
                     # 최종 실패 시 에러 발생 (작업 중단 -> 미완료 상태 유지)
                     print(f"[API] ❌ 시스템 프롬프트 로드 최종 실패. 작업을 중단합니다.")
                     raise RuntimeError(f"시스템 프롬프트 파일 로드 실패: {target_file}")
-        
-        # [수정] Config의 'user' 프롬프트가 System Prompt와 충돌하는 문제를 방지하기 위해 
+
+    def compact_input(self, input_text, segments=None):
+        """
+        LLM 요청 전 STT 원문 정리 -> (text, segments, 로그 메시지)
+        분할 요약 사용 시에는 전체 내용을 반영해야 하므로 토큰 예산으로 자르지 않습니다.
+        """
+        if not self.compaction_enabled:
+            return input_text, segments, None
+        max_tokens = None if self.map_reduce_enabled else self.compaction_max_tokens
+        result = compact_transcript(input_text, segments, max_tokens=max_tokens)
+        before, after = result['tokens_before'], result['tokens_after']
+        saved = (1 - after / float(before)) * 100 if before else 0
+        message = f"원문 정리: 약 {before} -> {after} tokens (-{saved:.0f}%)"
+        if result['truncated']:
+            message += f", 예산 {max_tokens} tokens 초과분 생략"
+        return result['text'], result['segments'] or segments, message
+
+    def analyze_text(self, input_text, prompt_type="testimony", progress_callback=None, segments=None,
+                     broadcast_date=None, label=None):
+        """
+        [2단계: LLM] 변환된 텍스트(input_text)를 받아 요약문을 반환합니다.
+        :param progress_callback: (current, total, label) - 스트리밍 모드에서 수신 토큰 수/속도 보고
+        :param segments: STT 세그먼트 리스트 - 분할 요약 시 세그먼트 경계에서 자르기 위해 사용
+        :param broadcast_date: 방송 일자 - 임박한 경우 GPU 대기열에서 우선 처리
+        :param label: 대기열 표시용 이름 (파일명 등)
+        """
+        system_instruction = self._load_system_prompt(prompt_type)
+
+        route = self.select_route(prompt_type, estimate_tokens(input_text))
+        if route is not self.default_route:
+            print(f"[API] 라우팅: '{route['name']}' 규칙 -> {route['model']}")
+
+        cache_key = self.summary_cache_key(input_text, system_instruction, route)
+        if cache_key:
+            cached = self.cache.get_summary(cache_key)
+            if cached:
+                print(f"[API] 요약 캐시 적중 - GPU 서버 요청 생략 ({cache_key[:12]}...)")
+                return cached
+
+        request = {
+            'priority': priority_for(prompt_type, broadcast_date),
+            'label': label or prompt_type,
+            'progress_callback': progress_callback,
+            'route': route
+        }
+        summary = self._summarize(input_text, system_instruction, segments, request)
+        # 에러 문자열은 캐시하지 않음 (재처리 시 다시 요청)
+        if cache_key and not self.is_error_result(summary):
+            self.cache.put_summary(cache_key, summary)
+        return summary
+
+    def summary_cache_key(self, input_text, system_instruction, route=None):
+        """원문 + 시스템 프롬프트 내용 + 모델/온도(+분할 요약 설정) 기준 캐시 키"""
+        if not self.cache:
+            return None
+        fingerprint = {
+            'prompt': text_sha256(system_instruction),
+            'model': (route or self.default_route)['model'],
+            'temperature': self.temperature,
+            'max_chars': LLM_MAX_INPUT_CHARS,
+            'map_reduce': [self.map_reduce_threshold, self.map_chunk_tokens] if self.map_reduce_enabled else None
+        }
+        return self.cache.make_key(input_text, fingerprint)
+
+    def _summarize(self, input_text, system_instruction, segments, request):
+        if self.map_reduce_enabled:
+            input_tokens = estimate_tokens(input_text)
+            if input_tokens > self.map_reduce_threshold:
+                return self._map_reduce(input_text, system_instruction, segments, request, input_tokens)
+
+        # [수정] Config의 'user' 프롬프트가 System Prompt와 충돌하는 문제를 방지하기 위해
         # Config 값을 무시하고, 중립적인 지시문을 사용합니다.
         user_msg = "위 System Prompt의 지침에 따라, 아래 [원문 내용]을 분석 및 처리하여 지정된 포맷으로 출력해주세요."
 
         # 텍스트가 너무 길면 잘라야 할 수도 있음 (Token Limit)
         # 1시간 분량(약 2~3만자)을 충분히 커버하기 위해 40,000자로 상향
-        safe_text = input_text[:40000] 
+        safe_text = input_text[:LLM_MAX_INPUT_CHARS]
+
+        route = request['route']
+        payload = self._build_payload(system_instruction, f"{user_msg}\n\n[원문 내용]: {safe_text}", route['model'])
 
-        payload = {
-            "model": self.model,
+        print(f"[API] 요청 전송: model={route['model']} (Text Length: {len(safe_text)}, stream={route['stream']})")
+        return self._post_completion(payload, request)
+
+    def _build_payload(self, system_instruction, user_content, model=None):
+        return {
+            "model": model or self.model,
             "messages": [
                 {"role": "system", "content": system_instruction},
-                {"role": "user", "content": f"{user_msg}\n\n[원문 내용]: {safe_text}"}
+                {"role": "user", "content": user_content}
             ],
-            "temperature": 0.7
+            "temperature": self.temperature
         }
 
-        print(f"[API] 요청 전송: {url} (Text Length: {len(safe_text)})")
-        
+    def _map_reduce(self, input_text, system_instruction, segments, request, input_tokens):
+        """
+        긴 원문 분할 요약
+        1) map: 세그먼트 경계 기준 토큰 예산 청크로 나눠 구간별 요약 (동시 요청 수 제한)
+        2) reduce: 구간 요약들을 모아 docs/prompts 시스템 프롬프트로 최종 요약
+        """
+        route = request['route']
+        progress_callback = request['progress_callback']
+        chunks = split_by_token_budget(input_text, self.map_chunk_tokens, segments)
+        total = len(chunks)
+        print(f"[API] 분할 요약 시작: 약 {input_tokens} tokens -> {total}개 구간 (동시 {self.map_max_parallel}개)")
+
+        def summarize_chunk(index):
+            user_content = (
+                f"[구간 {index + 1}/{total}]\n"
+                f"아래 원문 구간의 내용을 지침에 따라 정리해주세요.\n\n[원문 내용]: {chunks[index]}"
+            )
+            # 구간 요청은 병렬로 진행되므로 토큰 단위 진행 보고는 생략하고 완료 건수만 보고
+            map_request = dict(request, label=f"{request['label']} [{index + 1}/{total}]", progress_callback=None)
+            payload = self._build_payload(MAP_SYSTEM_PROMPT, user_content, route['model'])
+            return self._post_completion(payload, map_request)
+
+        if progress_callback:
+            progress_callback(0, total + 1, f"AI 구간 요약 0/{total}")
+        with ThreadPoolExecutor(max_workers=min(self.map_max_parallel, total)) as pool:
+            futures = {pool.submit(summarize_chunk, i): i for i in range(total)}
+            partials = [None] * total
+            for done, future in enumerate(as_completed(futures), start=1):
+                partials[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done, total + 1, f"AI 구간 요약 {done}/{total}")
+
+        for index, partial in enumerate(partials):
+            if self.is_error_result(partial):
+                print(f"[API] ❌ 구간 {index + 1}/{total} 요약 실패: {partial}")
+                return partial
+
+        joined = "\n\n".join(f"[구간 {i + 1}/{total} 요약]\n{p.strip()}" for i, p in enumerate(partials))
+        user_content = (
+            "아래는 긴 원문을 구간별로 나누어 정리한 내용입니다. "
+            "위 System Prompt의 지침에 따라, 전체 내용을 종합하여 지정된 포맷으로 출력해주세요.\n\n"
+            f"[원문 내용]:\n{joined}"
+        )
+        print(f"[API] 최종 요약 요청 (구간 요약 {len(joined)}자)")
+        if progress_callback:
+            progress_callback(total, total + 1, "AI 최종 요약 중")
+        return self._post_completion(self._build_payload(system_instruction, user_content, route['model']), request)
+
+    def _post_completion(self, payload, request):
+        """스케줄러 슬롯을 잡은 뒤 가장 한가한 서버로 요청 전송 (슬롯은 HTTP 요청 1건 단위)"""
+        progress_callback = request.get('progress_callback')
+        route = request.get('route') or self.default_route
+        pool = route['pool']
+
+        # 모든 서버가 차단 중이면 대기열 슬롯도 잡지 않고 즉시 실패
+        if not pool.allow():
+            print(f"[API] ⛔ GPU 서버 차단 중 - 요청 생략 ({pool.last_error})")
+            return "[에러] 서버가 꺼져있거나 응답하지 않습니다. (차단 중, 자동 재확인 대기)"
+
+        def on_wait(ahead):
+            print(f"[API] GPU 서버 대기열 진입 (앞선 요청 {ahead}건, priority {request['priority']})")
+            if progress_callback:
+                progress_callback(0, 0, f"AI 요청 대기 중 (앞선 요청 {ahead}건)")
+
+        with route['scheduler'].slot(request['priority'], request['label'], on_wait) as waited:
+            if waited >= 1:
+                print(f"[API] GPU 서버 대기 {waited:.1f}s 후 요청 시작 ({request['label']})")
+            try:
+                endpoint = pool.acquire()
+            except CircuitOpenError as e:
+                print(f"[API] ⛔ {e}")
+                return "[에러] 서버가 꺼져있거나 응답하지 않습니다. (차단 중, 자동 재확인 대기)"
+            try:
+                if len(pool.endpoints) > 1:
+                    print(f"[API] 서버 선택: {endpoint.name} (진행 중 {endpoint.outstanding}건)")
+                return self._send_completion(payload, progress_callback, route, endpoint)
+            finally:
+                pool.end(endpoint)
+
+    def _send_completion(self, payload, progress_callback=None, route=None, endpoint=None):
+        """Chat Completion 요청 전송 -> 응답 본문 또는 에러 문자열 반환"""
+        route = route or self.default_route
+        endpoint = endpoint or route['pool'].endpoints[0]
+        url = self._chat_url(endpoint.url)
+        breaker = endpoint.breaker
         try:
-            # 타임아웃 설정: (Connect Timeout, Read Timeout)
-            # Connect: 10초 내에 서버 연결 안되면 즉시 에러 (서버 꺼짐 판별)
-            # Read: 30분(1800초) 내에 응답 없으면 에러 (모델 처리 지연)
-            TIMEOUT_CONFIG = (10, 1800)
-            
+            if route['stream']:
+                return self._post_streaming(url, payload, progress_callback, route, endpoint)
+
+            # 타임아웃 설정: (Connect Timeout, Read Timeout) - 라우트별 설정 (기본 10초 / 30분)
+            # Connect: 서버 연결 안되면 즉시 에러 (서버 꺼짐 판별)
+            # Read: 응답 없으면 에러 (모델 처리 지연)
+            TIMEOUT_CONFIG = (route['connect_timeout'], route['read_timeout'])
+
             # 실제 요청 전송
-            response = requests.post(url, headers=headers, json=payload, timeout=TIMEOUT_CONFIG)
-            
+            response = self.http.post(url, headers=self._headers(endpoint.api_key), json=payload, timeout=TIMEOUT_CONFIG)
+
             if response.status_code == 200:
+                breaker.record_success()
                 result = response.json()
                 # OpenAI 포맷 응답 파싱
                 content = result['choices'][0]['message']['content']
                 return content
             else:
-                error_msg = f"API Error {response.status_code}: {response.text}"
-                print(error_msg)
-                return f"[단순 요약] 서버 통신 실패. (Status: {response.status_code} - 내부 에러)"
+                return self._status_error(response, breaker)
 
         except requests.exceptions.ConnectTimeout:
+             breaker.record_failure("Connect Timeout")
              print(f"[API] ❌ 서버 연결 실패 (Connect Timeout)")
              return f"[에러] 서버가 꺼져있거나 응답하지 않습니다. (Connect Timeout)"
 
-        except requests.exceptions.ReadTimeout:
-            print(f"[API] ⏳ 모델 처리 시간 초과 (1800s)")
+        except (requests.exceptions.ReadTimeout, LLMInactivityTimeout) as e:
+            breaker.record_failure("Read Timeout")
+            if route['stream']:
+                print(f"[API] ⏳ 모델 응답 중단 (무응답 타임아웃): {e}")
+            else:
+                print(f"[API] ⏳ 모델 처리 시간 초과 ({route['read_timeout']:.0f}s)")
             return f"[에러] AI 모델 처리 시간이 초과되었습니다. (Read Timeout)"
-            
-        except requests.exceptions.ConnectionError:
+
+        except requests.exceptions.ConnectionError as e:
+            # 스트리밍 중 소켓 타임아웃은 ConnectionError(ReadTimeoutError)로 감싸져 올라옴
+            if route['stream'] and 'timed out' in str(e).lower():
+                breaker.record_failure("Read Timeout")
+                print(f"[API] ⏳ 모델 응답 중단 (무응답 타임아웃)")
+                return f"[에러] AI 모델 처리 시간이 초과되었습니다. (Read Timeout)"
+            breaker.record_failure("Connection Error")
             print(f"[API] ❌ 연결 거부됨 (Connection Error)")
             return f"[에러] 서버 연결이 거부되었습니다. (서버 다운 추정)"
 
+        except LLMIncompleteStream as e:
+            breaker.record_failure("Incomplete Stream")
+            print(f"[API] ❌ 스트리밍 응답 불완전: {e}")
+            return f"[에러] AI 응답이 중간에 끊겼습니다. ({e})"
+
         except Exception as e:
             print(f"[API] ⚠️ 통신 중 예외 발생: {str(e)}")
             return f"[에러] 통신 오류: {str(e)}"
+
+    def _status_error(self, response, breaker):
+        """200 이외 응답 처리 (5xx는 서버 장애로 보고 브레이커에 기록)"""
+        if response.status_code >= 500:
+            breaker.record_failure(f"HTTP {response.status_code}")
+        error_msg = f"API Error {response.status_code}: {response.text}"
+        print(error_msg)
+        return f"[단순 요약] 서버 통신 실패. (Status: {response.status_code} - 내부 에러)"
+
+    def _post_streaming(self, url, payload, progress_callback, route, endpoint):
+        """
+        stream=True (SSE) 요청. 'data: {...}' 청크의 delta.content를 이어 붙여 최종 본문을 만듭니다.
+        - 첫 토큰 전: first_token_timeout (긴 원문 prefill 시간)
+        - 첫 토큰 후: inactivity_timeout (토큰 사이 무응답 시간)
+        - [DONE]/finish_reason 없이 연결이 끊기거나 본문이 비어 있으면 LLMIncompleteStream (일부만 받은 요약을 성공으로 쓰지 않음)
+        """
+        first_token_timeout, inactivity_timeout = route['first_token_timeout'], route['inactivity_timeout']
+        payload = dict(payload, stream=True)
+        response = self.http.post(
+            url, headers=self._headers(endpoint.api_key), json=payload, stream=True,
+            timeout=(route['connect_timeout'], max(first_token_timeout, inactivity_timeout))
+        )
+
+        with response:
+            if response.status_code != 200:
+                return self._status_error(response, endpoint.breaker)
+            endpoint.breaker.record_success()
+
+            parts = []
+            tokens = 0
+            started = time.monotonic()
+            first_token_at = None
+            last_token_at = started
+            last_report = 0.0
+            finished = False
+
+            # chunk_size=None: 서버가 보낸 청크 단위로 바로 처리 (512B 버퍼가 찰 때까지 기다리지 않음)
+            for raw_line in response.iter_lines(chunk_size=None):
+                now = time.monotonic()
+                if not raw_line:
+                    continue
+                line = raw_line.decode('utf-8', errors='replace').strip()
+                if not line.startswith("data:"):
+                    continue # SSE 주석(: keep-alive) 등
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    finished = True
+                    break
+
+                try:
+                    chunk = json.loads(data)
+                except ValueError:
+                    continue
+                if chunk.get('error'):
+                    raise RuntimeError(f"스트리밍 응답 에러: {chunk['error']}")
+
+                choices = chunk.get('choices') or [{}]
+                if choices[0].get('finish_reason'):
+                    finished = True
+                delta = choices[0].get('delta') or {}
+                content = delta.get('content')
+                if content:
+                    if first_token_at is None:
+                        first_token_at = now
+                        print(f"[API] 첫 토큰 수신 ({now - started:.1f}s)")
+                        self._set_read_timeout(response, inactivity_timeout)
+                    elif now - last_token_at > inactivity_timeout:
+                        # 소켓 타임아웃 조정이 불가능한 환경 대비 (keep-alive 주석만 오는 경우 등)
+                        raise LLMInactivityTimeout(f"{now - last_token_at:.0f}s 동안 토큰 없음")
+                    parts.append(content)
+                    tokens += 1 # 스트리밍 청크 1개 ≈ 토큰 1개
+                    last_token_at = now
+                elif first_token_at is not None and now - last_token_at > inactivity_timeout:
+                    raise LLMInactivityTimeout(f"{now - last_token_at:.0f}s 동안 토큰 없음")
+
+                if progress_callback and content and now - last_report >= LLM_PROGRESS_INTERVAL:
+                    last_report = now
+                    rate = tokens / max(now - first_token_at, 1e-6)
+                    progress_callback(tokens, 0, f"AI 요약 생성 중 {tokens} tokens ({rate:.1f} tok/s)")
+
+        if not finished:
+            raise LLMIncompleteStream(f"완료 신호 없이 연결 종료 ({tokens} tokens 수신)")
+        if not parts:
+            raise LLMIncompleteStream("빈 응답")
+        elapsed = time.monotonic() - (first_token_at or started)
+        print(f"[API] 스트리밍 완료: {tokens} tokens, {tokens / max(elapsed, 1e-6):.1f} tok/s")
+        return "".join(parts)
+
+    @staticmethod
+    def _set_read_timeout(response, seconds):
+        """스트리밍 도중 소켓 읽기 타임아웃 변경 (첫 토큰 이후에는 짧은 무응답 타임아웃 적용)"""
+        try:
+            sock = response.raw.connection.sock
+            if sock is not None:
+                sock.settimeout(seconds)
+        except AttributeError:
+            pass
@@ -0,0 +1,194 @@
+import threading
+import time
+
+from src.config_loader import settings
+from src.constants import BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, BREAKER_PROBE_TIMEOUT
+
+STATE_CLOSED = "closed"       # 정상
+STATE_OPEN = "open"           # 차단 (요청하지 않고 즉시 실패)
+STATE_HALF_OPEN = "half_open" # 복구 확인 중 (요청 시험 통과, 실패 시 즉시 재차단)
+
+
+class CircuitOpenError(RuntimeError):
+    """차단된 엔드포인트로 요청하려 함"""
+    def __init__(self, name, last_error=None):
+        super().__init__(f"{name} 서버 응답 없음 (차단 중{': ' + str(last_error) if last_error else ''})")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 서킷 브레이커입니다.
+    - 연속 failure_threshold회 실패하면 차단(open) -> 이후 요청은 타임아웃을 기다리지 않고 즉시 실패
+    - reset_timeout 경과 후 헬스 체크(probe)가 성공하면 자동 복구
+      (probe가 없으면 요청 1건만 시험 삼아 통과시키고, 실패하면 바로 다시 차단하는 half-open 방식)
+    - allow(): 요청 가능 여부 조회, admit(): 실제 요청 직전 호출 (half-open이면 시험 요청 1건만 허용)
+    """
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.probe = None # callable() -> bool
+
+        self._lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.last_error = None
+        self.opened_at = None
+        self._probing = False
+        self._trial_at = None # half-open 시험 요청 시작 시각 (진행 중이 아니면 None)
+
+    def _trial_free(self):
+        # 결과가 기록되지 않은 시험 요청은 reset_timeout 후 만료 (다음 요청이 다시 시험)
+        return self._trial_at is None or time.monotonic() - self._trial_at >= self.reset_timeout
+
+    def allow(self):
+        """요청 가능 여부 (차단 중이고 복구 시각이 되었으면 헬스 체크 수행)"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_HALF_OPEN:
+                return self._trial_free()
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            if self.probe is None:
+                self.state = STATE_HALF_OPEN
+                self._trial_at = None
+                return True
+        return self.check()
+
+    def admit(self):
+        """실제 요청 직전 호출 -> 요청 가능 여부 (half-open이면 시험 요청 1건만 통과, 결과는 record_*로 기록)"""
+        if not self.allow():
+            return False
+        with self._lock:
+            if self.state == STATE_HALF_OPEN:
+                if not self._trial_free():
+                    return False
+                self._trial_at = time.monotonic()
+            return True
+
+    def check(self):
+        """헬스 체크 실행 -> 복구 여부 반환 (동시에 한 스레드만 수행)"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.probe is None or self._probing:
+                return False
+            self._probing = True
+        error = None
+        try:
+            healthy = bool(self.probe())
+        except Exception as e:
+            healthy = False
+            error = str(e)
+        with self._lock:
+            self._probing = False
+            if error is not None:
+                self.last_error = error
+            if healthy:
+                print(f"🟢 [{self.name}] 서버 복구 확인 - 차단 해제")
+                self._close()
+            else:
+                self.opened_at = time.monotonic()
+        return healthy
+
+    def record_success(self):
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                print(f"🟢 [{self.name}] 요청 성공 - 차단 해제")
+            self._close()
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error is not None else self.last_error
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != STATE_OPEN:
+                    print(f"🔴 [{self.name}] 연속 {self.failures}회 실패 - {int(self.reset_timeout)}초간 요청 차단 ({self.last_error})")
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+                self._trial_at = None
+                opened = True
+            else:
+                opened = False
+        if opened:
+            _ensure_monitor()
+
+    def _close(self):
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_at = None
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = None
+            if self.state == STATE_OPEN and self.opened_at is not None:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                'name': self.name,
+                'state': self.state,
+                'failures': self.failures,
+                'last_error': self.last_error,
+                'retry_in': retry_in
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_monitor = None
+
+
+def _breaker_config():
+    return (settings.config.get('circuit_breaker', {}) or {}) if settings else {}
+
+
+def get_breaker(name):
+    """엔드포인트 이름('stt', 'llm', 'telegram')별 프로세스 전역 브레이커"""
+    with _breakers_lock:
+        if name not in _breakers:
+            config = _breaker_config()
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=config.get('failure_threshold', BREAKER_FAILURE_THRESHOLD),
+                reset_timeout=config.get('reset_timeout_sec', BREAKER_RESET_TIMEOUT)
+            )
+        return _breakers[name]
+
+
+def probe_timeout():
+    return float(_breaker_config().get('probe_timeout_sec', BREAKER_PROBE_TIMEOUT))
+
+
+def all_breakers():
+    """대시보드용 전체 브레이커 상태"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [b.snapshot() for b in breakers]
+
+
+def _ensure_monitor():
+    """차단된 브레이커가 있는 동안 주기적으로 헬스 체크 (요청이 없어도 복구 감지)"""
+    global _monitor
+    with _breakers_lock:
+        if _monitor is not None and _monitor.is_alive():
+            return
+        _monitor = threading.Thread(target=_monitor_loop, daemon=True, name="breaker-monitor")
+        _monitor.start()
+
+
+def _monitor_loop():
+    global _monitor
+    while True:
+        with _breakers_lock:
+            opened = [b for b in _breakers.values() if b.snapshot()['state'] != STATE_CLOSED]
+            if not opened:
+                _monitor = None
+                return
+        wait = min(b.reset_timeout for b in opened)
+        time.sleep(max(1.0, wait))
+        for breaker in opened:
+            snapshot = breaker.snapshot()
+            if snapshot['state'] == STATE_OPEN and breaker.probe is not None and snapshot['retry_in'] == 0:
+                breaker.check()
@@ -0,0 +1,170 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+from src.constants import ENDPOINT_QUEUE_POSITION_TTL
+from src.modules.circuit_breaker import get_breaker, CircuitOpenError
+
+
+class Endpoint:
+    """풀에 속한 서버 1대 (주소/인증키/가중치 + 현재 부하)"""
+    def __init__(self, url, api_key=None, weight=1.0, breaker=None):
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+        self.weight = max(0.01, float(weight))
+        self.breaker = breaker
+        self.name = urlsplit(self.url).netloc or self.url
+
+        self.outstanding = 0 # 이 프로세스가 보내고 아직 끝나지 않은 요청/Job 수
+        self.requests = 0
+        self.queue_position = None # 서버가 알려준 대기열 순번 (STT)
+        self.queue_reported_at = 0.0
+
+    def report_queue(self, position):
+        self.queue_position = int(position or 0)
+        self.queue_reported_at = time.monotonic()
+
+    def load(self):
+        """선택 점수 (작을수록 한가함) = (진행 중 요청 + 최근 보고된 대기열 순번) / 가중치"""
+        queued = 0
+        if self.queue_position and time.monotonic() - self.queue_reported_at < ENDPOINT_QUEUE_POSITION_TTL:
+            queued = self.queue_position
+        return (self.outstanding + queued) / self.weight
+
+
+class EndpointPool:
+    """
+    같은 역할의 서버 여러 대 (STT 서버 / GPU LLM 서버)
+    - 가중치 + 최소 진행 요청(least outstanding) 기준 선택, STT는 서버가 알려준 대기열 순번도 반영
+    - 서버별 서킷 브레이커로 장애 서버는 선택에서 제외 (헬스 체크 통과 시 자동 복귀)
+    - 서버가 1대면 브레이커 이름은 풀 이름 그대로 ('stt', 'llm') 사용
+    """
+    def __init__(self, name, endpoints):
+        self.name = name
+        self.endpoints = endpoints
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청 가능한 서버가 하나라도 있는지 (차단된 서버는 복구 시각이 되면 헬스 체크)"""
+        return any(e.breaker.allow() for e in self.endpoints)
+
+    @property
+    def last_error(self):
+        errors = [f"{e.name}: {e.breaker.last_error}" for e in self.endpoints if e.breaker.last_error]
+        if len(self.endpoints) == 1:
+            return self.endpoints[0].breaker.last_error
+        return ", ".join(errors) or None
+
+    def choose(self, exclude=()):
+        """
+        가장 한가한 서버 선택 (차단된 서버, exclude 목록 제외)
+        exclude 외에 가능한 서버가 없으면 exclude 포함해서 다시 선택, 그래도 없으면 None
+        """
+        candidates = [e for e in self.endpoints if e not in exclude and e.breaker.allow()]
+        if not candidates:
+            candidates = [e for e in self.endpoints if e.breaker.allow()]
+        if not candidates:
+            return None
+        with self._lock:
+            return min(candidates, key=lambda e: (e.load(), -e.weight, self.endpoints.index(e)))
+
+    def begin(self, endpoint):
+        with self._lock:
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+
+    def end(self, endpoint):
+        with self._lock:
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+
+    def acquire(self, exclude=()):
+        """
+        서버 선택 + 진행 중 요청으로 집계 -> Endpoint (사용 후 end 호출). 가능한 서버가 없으면 CircuitOpenError
+        복구 확인 중(half-open)인 서버는 시험 요청 1건만 받으므로, 이미 시험 중이면 다른 서버 선택
+        """
+        refused = []
+        while True:
+            endpoint = self.choose(tuple(exclude) + tuple(refused))
+            if endpoint is None or endpoint in refused:
+                raise CircuitOpenError(self.name.upper(), self.last_error)
+            if endpoint.breaker.admit():
+                break
+            refused.append(endpoint)
+        self.begin(endpoint)
+        return endpoint
+
+    def endpoint_for(self, url):
+        """기록된 주소(재시작 복구 등)에 해당하는 서버 (풀에 없으면 None)"""
+        url = (url or "").rstrip("/")
+        return next((e for e in self.endpoints if e.url == url), None)
+
+    def snapshot(self):
+        """대시보드용 서버별 상태"""
+        with self._lock:
+            return [
+                {
+                    'name': e.name,
+                    'weight': e.weight,
+                    'outstanding': e.outstanding,
+                    'requests': e.requests,
+                    'queue_position': e.queue_position,
+                    'state': e.breaker.state
+                }
+                for e in self.endpoints
+            ]
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def endpoint_configs(config):
+    """
+    설정 -> [{'url', 'api_key', 'weight'}, ...]
+    endpoints 목록이 있으면 사용하고, 없으면 기존 단일 api_url/api_key
+    """
+    entries = config.get('endpoints') or []
+    if not entries and config.get('api_url'):
+        entries = [{'url': config.get('api_url')}]
+    result = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'url': entry}
+        if not entry.get('url'):
+            continue
+        result.append({
+            'url': entry['url'],
+            'api_key': entry.get('api_key', config.get('api_key')),
+            'weight': entry.get('weight', 1)
+        })
+    return result
+
+
+def get_endpoint_pool(name, config, probe=None):
+    """
+    이름별 프로세스 전역 풀 (진행 중 요청 수를 Job/클라이언트 인스턴스 사이에 공유)
+    :param probe: callable(endpoint) -> bool, 서버별 헬스 체크
+    """
+    entries = endpoint_configs(config)
+    key = (name, tuple((e['url'], e['api_key'], e['weight']) for e in entries))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            endpoints = []
+            for entry in entries:
+                endpoint = Endpoint(entry['url'], entry['api_key'], entry['weight'])
+                endpoint.breaker = get_breaker(name if len(entries) == 1 else f"{name}@{endpoint.name}")
+                endpoints.append(endpoint)
+            pool = EndpointPool(name, endpoints)
+            _pools[key] = pool
+        if probe is not None:
+            for endpoint in pool.endpoints:
+                endpoint.breaker.probe = lambda e=endpoint: probe(e)
+        return pool
+
+
+def all_endpoint_pools():
+    """대시보드용 (서버가 2대 이상인 풀만)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [p for p in pools if len(p.endpoints) > 1]
@@ -1,5 +1,3 @@
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 from src.config_loader import settings
 import os
 
@@ -77,14 +75,22 @@ class GSheetManager:
             # raise FileNotFoundError(f"Google API Key not found at {key_path}")
             return None # Allow Mock Fallback context to handle this
 
+        # Google 라이브러리는 실제 연결 시에만 import (MockGSheetManager/테스트는 설치 없이 동작)
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+
         creds = ServiceAccountCredentials.from_json_keyfile_name(key_path, scope)
         return gspread.authorize(creds)
 
     def get_pending_rows(self, sheet_type='testimony'):
         """
-        Scan the specified sheet (tab) for rows where Status is empty or '대기'.
+        Scan the specified sheet (tab) for rows where Status is empty, '대기' or '에러'.
         sheet_type: 'testimony' or 'mission_news' (mapped in config)
+        '요약 대기' 행은 제외: 영상은 이미 보관 완료, 요약은 요약 대기열(SQLite state DB)로만 재시도
+        (대기열 항목이 유실되면 원본 파일을 다시 넣고 상태를 '대기'로 바꿔 재처리)
         """
+        import gspread
+
         tab_name = self.config['tabs'].get(sheet_type)
         if not tab_name:
             print(f"Error: Tab name for '{sheet_type}' not found in config.")
@@ -177,29 +183,7 @@ class GSheetManager:
                 
                 # [New] Testimony Summary to Separate Tab
                 if summary_text and status == "완료":
-                    summary_tab_name = self.config['tabs'].get('testimony_summary')
-                    if summary_tab_name:
-                        try:
-                            # Need to fetch Date/Country/Name from the main sheet to copy over?
-                            # Or just rely on what we have? 
-                            # We don't have the data here conveniently unless we read it or pass it.
-                            # Let's read the row to be safe and accurate.
-                            row_values = worksheet.row_values(row_index)
-                            # Testimony Map: Date=1, Country=3, Name=7 (0-based)
-                            # row_values is 0-indexed list of strings
-                            
-                            # Valid check
-                            date_val = row_values[cols['date']] if len(row_values) > cols['date'] else ""
-                            country_val = row_values[cols['country']] if len(row_values) > cols['country'] else ""
-                            name_val = row_values[cols['name']] if len(row_values) > cols['name'] else ""
-
-                            # Append to Summary Tab
-                            sum_sheet = workbook.worksheet(summary_tab_name)
-                            # Format: [Date, Country, Name, Summary]
-                            sum_sheet.append_row([date_val, country_val, name_val, summary_text])
-                            print(f"     ㄴ 요약 탭 기록 완료: {summary_tab_name}")
-                        except Exception as ex:
-                            print(f"     ⚠️ 요약 탭 기록 실패: {ex}")
+                    self.update_summary(sheet_type, row_index, summary_text, worksheet=worksheet)
 
             elif sheet_type == 'mission_news':
                 # mission_news: Update Status (H)
@@ -215,13 +199,55 @@ class GSheetManager:
                 
                 # [New] Update Summary Column (F)
                 if summary_text:
-                    worksheet.update_cell(row_index, cols['summary'] + 1, summary_text)
+                    self.update_summary(sheet_type, row_index, summary_text, worksheet=worksheet)
                 
         except Exception as e:
             print(f"Error updating sheet: {e}")
 
         print(f"Updated Row {row_index} in {tab_name}: {status}")
 
+    def update_summary(self, sheet_type, row_index, summary_text, worksheet=None):
+        """
+        요약 기록 (상태와 별도로 호출 가능 - 나중에 요약하는 작업용)
+        - testimony: 요약 탭에 [날짜, 국가, 이름, 요약] 행 추가
+        - mission_news: 요약 열(F) 갱신
+        """
+        tab_name = self.config['tabs'].get(sheet_type)
+        workbook = self.workbooks.get(sheet_type)
+        cols = self.COLUMN_MAP.get(sheet_type)
+        if not workbook or not cols or not summary_text:
+            return
+
+        try:
+            if worksheet is None:
+                worksheet = workbook.worksheet(tab_name)
+
+            if sheet_type == 'testimony':
+                summary_tab_name = self.config['tabs'].get('testimony_summary')
+                if not summary_tab_name:
+                    return
+                try:
+                    # 요약 탭 행은 [날짜, 국가, 이름, 요약] - 날짜/국가/이름은 원본 행에서 읽어 옴
+                    # (나중에 요약하는 작업은 행 데이터를 따로 갖고 있지 않음)
+                    row_values = worksheet.row_values(row_index)
+
+                    # 열이 비어 있으면 row_values가 짧을 수 있음
+                    date_val = row_values[cols['date']] if len(row_values) > cols['date'] else ""
+                    country_val = row_values[cols['country']] if len(row_values) > cols['country'] else ""
+                    name_val = row_values[cols['name']] if len(row_values) > cols['name'] else ""
+
+                    sum_sheet = workbook.worksheet(summary_tab_name)
+                    sum_sheet.append_row([date_val, country_val, name_val, summary_text])
+                    print(f"     ㄴ 요약 탭 기록 완료: {summary_tab_name}")
+                except Exception as ex:
+                    print(f"     ⚠️ 요약 탭 기록 실패: {ex}")
+
+            elif sheet_type == 'mission_news':
+                worksheet.update_cell(row_index, cols['summary'] + 1, summary_text)
+
+        except Exception as e:
+            print(f"Error updating summary: {e}")
+
     def add_new_row(self, sheet_type, date, country, name, filename, **kwargs):
         """
         Appends a new row with the provided metadata.
@@ -342,6 +368,9 @@ class MockGSheetManager:
                 })
         return pending
 
+    def update_summary(self, sheet_type, row_index, summary_text, worksheet=None):
+        print(f"[Mock] SUMMARY Row {row_index}: {str(summary_text)[:30]}...")
+
     def update_status(self, sheet_type, row_index, status, error_msg=None, new_filename=None, url=None):
         print(f"[Mock] UPDATE Row {row_index}: Status='{status}' | Error='{error_msg}' | NewFile='{new_filename}'")
         # Update fake db in memory
@@ -0,0 +1,218 @@
+import bisect
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config_loader import settings
+from src.constants import (
+    HTTP_POOL_MAXSIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_RETRIES, HTTP_RETRY_BACKOFF, HTTP_LATENCY_BUCKETS
+)
+
+
+class EndpointMetrics:
+    """엔드포인트별 요청 통계 (응답 시간 분포, 송수신 바이트, 상태 코드, 예외)"""
+    def __init__(self, name, buckets=HTTP_LATENCY_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.histogram = [0] * (len(self.buckets) + 1) # 마지막 칸 = 최대 구간 초과
+        self.status_codes = {}
+        self.errors = {}
+        self.hosts = set()
+
+    def start(self, host):
+        with self._lock:
+            self.in_flight += 1
+            self.hosts.add(host)
+
+    def finish(self, latency, bytes_sent=0, status=None, error=None, retries=0):
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.retries += retries
+            self.bytes_sent += bytes_sent
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.histogram[bisect.bisect_left(self.buckets, latency)] += 1
+            if status is not None:
+                self.status_codes[status] = self.status_codes.get(status, 0) + 1
+            if error is not None:
+                self.errors[error] = self.errors.get(error, 0) + 1
+
+    def add_received(self, nbytes):
+        with self._lock:
+            self.bytes_received += nbytes
+
+    def percentile(self, ratio):
+        """히스토그램 기준 근사 백분위 (해당 구간의 상한값)"""
+        with self._lock:
+            total = sum(self.histogram)
+            if not total:
+                return 0.0
+            target = ratio * total
+            seen = 0
+            for i, count in enumerate(self.histogram):
+                seen += count
+                if seen >= target:
+                    return float(self.buckets[i]) if i < len(self.buckets) else self.max_latency
+        return self.max_latency
+
+    def snapshot(self):
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        with self._lock:
+            labels = [f"≤{b}s" for b in self.buckets] + [f">{self.buckets[-1]}s"]
+            return {
+                'name': self.name,
+                'hosts': sorted(self.hosts),
+                'requests': self.requests,
+                'in_flight': self.in_flight,
+                'retries': self.retries,
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+                'avg_latency': self.total_latency / self.requests if self.requests else 0.0,
+                'p50_latency': p50,
+                'p95_latency': p95,
+                'max_latency': self.max_latency,
+                'histogram': dict(zip(labels, self.histogram)),
+                'status_codes': dict(self.status_codes),
+                'errors': dict(self.errors)
+            }
+
+
+class MeteredSession(requests.Session):
+    """
+    요청 통계를 기록하는 Session
+    - 실제 전송(send) 단위로 측정 (응답 시간 = 응답 헤더 수신까지)
+    - stream=True 응답은 읽는 만큼 수신 바이트에 더함
+    """
+    def __init__(self, metrics, default_timeout):
+        super().__init__()
+        self.metrics = metrics
+        self.default_timeout = default_timeout
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.default_timeout
+        return super().request(method, url, **kwargs)
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        self.metrics.start(host)
+        started = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            self.metrics.finish(time.monotonic() - started, _body_size(request), error=type(e).__name__)
+            raise
+
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', None) or ()
+        self.metrics.finish(
+            time.monotonic() - started, _body_size(request), status=response.status_code, retries=len(retries)
+        )
+        if kwargs.get('stream'):
+            _count_streamed(response, self.metrics)
+        else:
+            self.metrics.add_received(len(response.content or b""))
+        return response
+
+
+def _body_size(request):
+    length = request.headers.get('Content-Length')
+    if length and str(length).isdigit():
+        return int(length)
+    if isinstance(request.body, (bytes, str)):
+        return len(request.body)
+    return 0
+
+
+def _count_streamed(response, metrics):
+    iter_content = response.iter_content
+
+    def counted(*args, **kwargs):
+        for chunk in iter_content(*args, **kwargs):
+            metrics.add_received(len(chunk))
+            yield chunk
+
+    response.iter_content = counted
+
+
+class HttpClient:
+    """
+    외부 서버(STT/LLM/Telegram)별 공용 HTTP 클라이언트입니다.
+    - 호스트별 Keep-Alive 연결 풀 재사용 (매 요청마다 TCP/TLS 재연결 방지)
+    - 기본 타임아웃 (호출 시 timeout= 미지정이어도 무한 대기하지 않음)
+    - 재시도: 연결 실패는 모든 메서드, 502/503/504는 GET/HEAD만
+      (POST는 서버가 처리했을 수 있으므로 응답 후 재전송하지 않음 - 호출부 재시도/브레이커가 담당)
+    """
+    def __init__(self, name, config=None):
+        config = config or {}
+        self.name = name
+        self.metrics = EndpointMetrics(name)
+        self.timeout = (
+            float(config.get('connect_timeout_sec', HTTP_CONNECT_TIMEOUT)),
+            float(config.get('read_timeout_sec', HTTP_READ_TIMEOUT))
+        )
+        retries = int(config.get('retries', HTTP_RETRIES))
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=float(config.get('backoff_sec', HTTP_RETRY_BACKOFF)),
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False
+        )
+        pool_size = int(config.get('pool_maxsize', HTTP_POOL_MAXSIZE))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = MeteredSession(self.metrics, self.timeout)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _endpoint_config(name):
+    http_config = (settings.config.get('http', {}) or {}) if settings else {}
+    config = {k: v for k, v in http_config.items() if k != 'endpoints'}
+    config.update((http_config.get('endpoints') or {}).get(name) or {})
+    return config
+
+
+def get_http_client(name):
+    """엔드포인트 이름('stt', 'llm', 'telegram')별 프로세스 전역 클라이언트"""
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = HttpClient(name, _endpoint_config(name))
+        return _clients[name]
+
+
+def all_http_metrics():
+    """대시보드용 전체 엔드포인트 통계"""
+    with _clients_lock:
+        clients = list(_clients.values())
+    return [c.metrics.snapshot() for c in clients]
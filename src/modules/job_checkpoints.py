@@ -0,0 +1,49 @@
+import json
+import time
+from contextlib import closing
+
+from src import state_db
+from src.constants import CHECKPOINT_RETENTION_DAYS
+
+
+class JobCheckpoints:
+    """
+    작업 1건의 단계별 결과 (오디오 경로/해시, STT 캐시 키, 요약, 썸네일, 아카이브 경로 등)
+    실패 후 같은 작업을 다시 처리하면 완료된 단계는 건너뛰고 처음 미완료 단계부터 이어서 진행합니다.
+    작업이 끝까지 완료되면 삭제됩니다.
+    """
+    def __init__(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_checkpoints (
+                    job_key TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    completed_at REAL NOT NULL,
+                    PRIMARY KEY (job_key, stage)
+                )
+            """)
+            # 끝내 다시 처리되지 않은 작업의 기록 정리
+            conn.execute(
+                "DELETE FROM job_checkpoints WHERE completed_at < ?",
+                (time.time() - CHECKPOINT_RETENTION_DAYS * 86400,)
+            )
+
+    def save(self, job_key, stage, data):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_checkpoints (job_key, stage, data, completed_at) VALUES (?, ?, ?, ?)",
+                (job_key, stage, json.dumps(data, ensure_ascii=False), time.time())
+            )
+
+    def load(self, job_key):
+        """완료된 단계별 결과 {단계: data}"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT stage, data FROM job_checkpoints WHERE job_key = ?", (job_key,)
+            ).fetchall()
+        return {r['stage']: json.loads(r['data']) for r in rows}
+
+    def clear(self, job_key):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("DELETE FROM job_checkpoints WHERE job_key = ?", (job_key,))
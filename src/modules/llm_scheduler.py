@@ -0,0 +1,153 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from src.config_loader import settings
+from src.constants import (
+    LLM_MAX_CONCURRENT, LLM_PRIORITY_AGING_SEC, LLM_URGENT_DAYS, LLM_DEFAULT_PRIORITIES
+)
+from src.utils.date_parser import parse_date
+
+PRIORITY_URGENT = 0
+
+
+class LLMScheduler:
+    """
+    GPU 서버 LLM 요청 동시 실행 수 제한 + 우선순위 대기열입니다.
+    - 동시에 max_concurrent 건까지만 요청 (공유 GPU 서버 과부하 방지)
+    - 우선순위 숫자가 작을수록 먼저 (방송일 임박 > mission_news > testimony)
+    - 같은 우선순위는 도착 순서(FIFO), 오래 기다린 요청은 aging_sec마다 한 단계씩 올라감 (기아 방지)
+    - 슬롯은 HTTP 요청 단위로 잡음 (분할 요약 중 구간 요청이 서로를 기다리는 교착 방지)
+    """
+    def __init__(self, max_concurrent=LLM_MAX_CONCURRENT, aging_sec=LLM_PRIORITY_AGING_SEC):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.aging_sec = float(aging_sec)
+
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waiting = {} # seq -> {'priority', 'label', 'enqueued_at'}
+        self._in_flight = 0
+
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _effective_priority(self, waiter, now):
+        aged = int((now - waiter['enqueued_at']) / self.aging_sec) if self.aging_sec > 0 else 0
+        return waiter['priority'] - aged
+
+    def _next_seq(self, now):
+        return min(
+            self._waiting,
+            key=lambda seq: (self._effective_priority(self._waiting[seq], now), seq)
+        )
+
+    def acquire(self, priority, label=None, on_wait=None):
+        """
+        슬롯 획득까지 대기 -> 대기 시간(초) 반환
+        :param on_wait: 대기가 필요할 때 한 번 호출 (앞선 요청 수, 잠금 밖에서 호출)
+        """
+        with self._cond:
+            seq = next(self._seq)
+            now = time.monotonic()
+            self._waiting[seq] = {'priority': priority, 'label': label, 'enqueued_at': now}
+            ahead = None
+            if not (self._in_flight < self.max_concurrent and self._next_seq(now) == seq):
+                ahead = len(self._waiting) - 1 + self._in_flight
+
+        # 진행 상황 콜백(작업 상태 저장 등)이 느려도 다른 요청의 획득/반환을 막지 않도록 잠금 해제 후 호출
+        if on_wait and ahead is not None:
+            on_wait(ahead)
+
+        with self._cond:
+            while not (self._in_flight < self.max_concurrent and self._next_seq(time.monotonic()) == seq):
+                # aging 반영을 위해 주기적으로 깨어나 순서 재계산
+                self._cond.wait(timeout=self.aging_sec if self.aging_sec > 0 else None)
+            del self._waiting[seq]
+            self._in_flight += 1
+            # 남은 슬롯이 있으면 다음 선두 요청이 바로 진행하도록 (먼저 깨어나 다시 잠든 요청 포함)
+            self._cond.notify_all()
+
+            waited = time.monotonic() - now
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            return waited
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self.completed += 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority, label=None, on_wait=None):
+        waited = self.acquire(priority, label, on_wait)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def snapshot(self):
+        """대시보드용 현재 상태"""
+        with self._cond:
+            now = time.monotonic()
+            waiting = sorted(
+                (
+                    {'label': w['label'], 'priority': w['priority'], 'waited': now - w['enqueued_at']}
+                    for w in self._waiting.values()
+                ),
+                key=lambda w: (w['priority'], -w['waited'])
+            )
+            granted = self.completed + self._in_flight
+            return {
+                'in_flight': self._in_flight,
+                'max_concurrent': self.max_concurrent,
+                'waiting': waiting,
+                'completed': self.completed,
+                'avg_wait': self.total_wait / granted if granted else 0.0,
+                'max_wait': self.max_wait
+            }
+
+
+def priority_for(prompt_type, broadcast_date=None, config=None):
+    """
+    요청 우선순위 계산 (작을수록 먼저)
+    - 방송일이 오늘~urgent_days일 이내면 최우선 (이미 지난 방송일은 기본값)
+    - 그 외에는 prompt_type별 기본 우선순위
+    """
+    config = config if config is not None else _scheduler_config()
+    priorities = dict(LLM_DEFAULT_PRIORITIES, **(config.get('priorities') or {}))
+    priority = int(priorities.get(prompt_type, max(priorities.values())))
+
+    parsed = parse_date(broadcast_date) if broadcast_date else None
+    if parsed:
+        days_left = (parsed.date() - datetime.now().date()).days
+        if 0 <= days_left <= int(config.get('urgent_days', LLM_URGENT_DAYS)):
+            priority = PRIORITY_URGENT
+    return priority
+
+
+def _scheduler_config():
+    return (settings.gpu_config.get('scheduler') or {}) if settings else {}
+
+
+_schedulers = {}
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler(name="llm", max_concurrent=None):
+    """
+    프로세스 전역 스케줄러 (JobProcessor/APIClient가 Job마다 새로 생성되므로 모듈 단위로 공유)
+    :param name: 엔드포인트 이름 - 기본 GPU 서버는 'llm', 별도 서버를 쓰는 라우트는 각자의 대기열
+    :param max_concurrent: 처음 생성 시 동시 요청 수 (None이면 scheduler 설정값)
+    """
+    with _scheduler_lock:
+        if name not in _schedulers:
+            config = _scheduler_config()
+            _schedulers[name] = LLMScheduler(
+                max_concurrent=max_concurrent or config.get('max_concurrent', LLM_MAX_CONCURRENT),
+                aging_sec=config.get('aging_sec', LLM_PRIORITY_AGING_SEC)
+            )
+        return _schedulers[name]
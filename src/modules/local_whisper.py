@@ -0,0 +1,105 @@
+import importlib.util
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from src.modules.stt_module import STTEngine
+
+# --- Worker Process Side ---
+# 모델은 워커 프로세스당 한 번만 로드해서 재사용합니다.
+_worker_model = None
+
+
+def _init_worker(model_name, device):
+    global _worker_model
+    import whisper
+    print(f"[LocalWhisper] 모델 로딩 (pid={os.getpid()}): {model_name} / {device}")
+    _worker_model = whisper.load_model(model_name, device=device)
+
+
+def _transcribe_in_worker(audio_path, options):
+    result = _worker_model.transcribe(audio_path, **options)
+    # 서버 STT와 동일한 {text, segments} 형태로 맞춤
+    return {
+        'text': result.get('text', '').strip(),
+        'segments': [
+            {'id': i, 'start': seg.get('start', 0), 'end': seg.get('end', 0), 'text': seg.get('text', '')}
+            for i, seg in enumerate(result.get('segments', []))
+        ],
+        'language': result.get('language')
+    }
+
+
+# --- Main Process Side ---
+_pool = None
+_pool_key = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(model_name, device, workers):
+    """프로세스 전역 워커 풀 (동시 실행 수 = workers, 모델 설정이 바뀌면 새로 생성)"""
+    global _pool, _pool_key
+    key = (model_name, device, workers)
+    with _pool_lock:
+        if _pool is None or _pool_key != key:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # 스레드가 많은 Streamlit 프로세스를 fork하지 않도록 spawn 사용
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(model_name, device)
+            )
+            _pool_key = key
+        return _pool
+
+
+class LocalWhisperSTT(STTEngine):
+    """
+    로컬 CPU Whisper 엔진 (openai-whisper).
+    STT 서버가 꺼져 있을 때의 대체 엔진, 또는 짧은 클립 전용 엔진으로 사용합니다.
+    """
+    name = "local"
+
+    def __init__(self, config=None):
+        super().__init__()
+        self.config = config or {}
+        self.model_name = self.config.get('model', 'small')
+        self.device = self.config.get('device', 'cpu')
+        self.workers = max(1, int(self.config.get('workers', 1)))
+        self.language = self.config.get('language', 'ko')
+
+    def is_available(self):
+        return importlib.util.find_spec('whisper') is not None
+
+    def cache_fingerprint(self):
+        return {'engine': 'local_whisper', 'model': self.model_name, 'language': self.language or 'auto'}
+
+    def transcribe(self, audio_path, progress_callback=None, context=None):
+        if not os.path.exists(audio_path):
+            return "Error: Audio file not found."
+        if not self.is_available():
+            return "Error: openai-whisper 패키지가 설치되어 있지 않습니다."
+
+        cache_key = self.cache_key_for(audio_path)
+        cached = self.get_cached(cache_key)
+        if cached:
+            return cached
+
+        print(f"[STT] 로컬 Whisper 변환 중... ({os.path.basename(audio_path)}, model={self.model_name})")
+        options = {'fp16': False}
+        if self.language:
+            options['language'] = self.language
+
+        try:
+            pool = _get_pool(self.model_name, self.device, self.workers)
+            result = pool.submit(_transcribe_in_worker, os.path.abspath(audio_path), options).result()
+        except Exception as e:
+            print(f"❌ Local Whisper Exception: {e}")
+            return f"Error: {str(e)}"
+
+        self._store(result, cache_key)
+        print(f"     ㄴ 로컬 변환 완료 (세그먼트 {len(result['segments'])}개)")
+        return result
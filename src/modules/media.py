@@ -35,6 +35,118 @@ class MediaProcessor:
             print("FFmpeg Error:", e.stderr.decode() if e.stderr else str(e))
             raise RuntimeError("Audio extraction failed")
 
+    def iter_audio(self, video_path, tee_path=None, chunk_size=256 * 1024):
+        """
+        Streams mp3 audio from ffmpeg stdout without waiting for the whole encode.
+        Yields byte chunks as they are produced; optionally tees them into tee_path
+        (archival copy). Raises RuntimeError if ffmpeg exits with an error.
+
+        Note: pipe output cannot be seeked back to write the VBR (Xing) header,
+        so this mode encodes CBR 192k instead of qscale=2 VBR.
+        """
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        print(f"Streaming audio: {video_path} -> (pipe){' + ' + tee_path if tee_path else ''}")
+
+        process = (
+            ffmpeg
+            .input(video_path)
+            .output('pipe:', format='mp3', acodec='libmp3lame', audio_bitrate='192k', vn=None, loglevel="error")
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+        tee = open(tee_path, 'wb') if tee_path else None
+        finished = False
+        try:
+            while True:
+                chunk = process.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                if tee:
+                    tee.write(chunk)
+                yield chunk
+
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                print("FFmpeg Error:", stderr.decode(errors='ignore'))
+                raise RuntimeError("Audio extraction failed")
+            finished = True
+        finally:
+            if tee:
+                tee.close()
+                if not finished and os.path.exists(tee_path):
+                    os.remove(tee_path) # 불완전한 아카이브 사본은 남기지 않음
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def detect_silences(self, audio_path, noise_db=-30, min_silence=0.4):
+        """
+        Runs ffmpeg silencedetect over the audio.
+        Returns a list of (silence_start, silence_end) tuples in seconds.
+        """
+        try:
+            _, stderr = (
+                ffmpeg
+                .input(audio_path)
+                .filter('silencedetect', noise=f"{noise_db}dB", d=min_silence)
+                .output('-', format='null')
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            print("FFmpeg Error (silencedetect):", e.stderr.decode() if e.stderr else str(e))
+            return []
+
+        silences = []
+        start = None
+        for line in stderr.decode(errors='ignore').splitlines():
+            if 'silence_start:' in line:
+                try:
+                    start = float(line.split('silence_start:')[1].split()[0])
+                except (IndexError, ValueError):
+                    start = None
+            elif 'silence_end:' in line and start is not None:
+                try:
+                    end = float(line.split('silence_end:')[1].split()[0])
+                    silences.append((start, end))
+                except (IndexError, ValueError):
+                    pass
+                start = None
+        return silences
+
+    def split_audio(self, audio_path, ranges):
+        """
+        Cuts the audio into pieces without re-encoding.
+        ranges: list of (start, end) in seconds (end=None means till the end)
+        Returns list of chunk paths in the same order.
+        """
+        base_name = os.path.splitext(os.path.basename(audio_path))[0]
+        ext = os.path.splitext(audio_path)[1] or '.mp3'
+        unique_id = str(uuid.uuid4())[:8]
+
+        chunk_paths = []
+        for i, (start, end) in enumerate(ranges):
+            output_path = os.path.join(self.temp_dir, f"{base_name}_chunk{i+1}_{unique_id}{ext}")
+            input_kwargs = {'ss': start}
+            if end is not None:
+                input_kwargs['t'] = end - start
+            try:
+                (
+                    ffmpeg
+                    .input(audio_path, **input_kwargs)
+                    .output(output_path, acodec='copy', loglevel="error")
+                    .overwrite_output()
+                    .run()
+                )
+            except ffmpeg.Error as e:
+                print("FFmpeg Error (split):", e.stderr.decode() if e.stderr else str(e))
+                for p in chunk_paths:
+                    if os.path.exists(p):
+                        os.remove(p)
+                raise RuntimeError("Audio split failed")
+            chunk_paths.append(output_path)
+        return chunk_paths
+
     def capture_frame(self, video_path, timestamp=0):
         """
         Captures a single frame at the given timestamp (seconds).
@@ -0,0 +1,217 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+from src.config_loader import settings
+from src.constants import FILE_CHUNK_SIZE, TRANSCRIPT_CACHE_MAX_MB, SUMMARY_CACHE_MAX_MB, CACHE_EVICT_TARGET_RATIO
+
+
+def file_sha256(path, chunk_size=FILE_CHUNK_SIZE):
+    """파일 내용 SHA-256 (대용량 파일도 chunk 단위로 읽어 메모리 사용 일정)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_sha256(text):
+    return hashlib.sha256(str(text).encode('utf-8')).hexdigest()
+
+
+def fingerprint_hash(fingerprint):
+    """설정(dict)을 정렬된 JSON으로 직렬화해 짧은 해시로 변환"""
+    raw = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class DiskCache:
+    """
+    gzip 압축 JSON 파일 기반 로컬 캐시입니다.
+    - key별 파일 1개 ({root}/{key[:2]}/{key}.json.gz)
+    - 임시 파일에 쓴 뒤 os.replace로 교체 (동시 실행/중단 시에도 깨진 파일 없음)
+    - 용량 초과 시 가장 오래 사용하지 않은 항목부터 최대 용량의 CACHE_EVICT_TARGET_RATIO까지 삭제 (mtime 기준 LRU)
+    - 전체 용량은 처음 한 번만 계산하고 이후 저장/삭제 시 증감 (폴더 전체 조회는 용량 초과 시에만)
+    """
+    def __init__(self, root, max_bytes=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = None # 추적 중인 전체 용량 (첫 저장 시 계산)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _add_size(self, delta):
+        with self._lock:
+            if self._total is not None:
+                self._total = max(0, self._total + delta)
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json.gz")
+
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path, None) # LRU 갱신
+            return value
+        except Exception as e:
+            print(f"⚠️ 캐시 읽기 실패 (무시): {e}")
+            return None
+
+    def put(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False, separators=(',', ':'))
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            new_size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+            self._add_size(new_size - old_size)
+        except Exception as e:
+            print(f"⚠️ 캐시 저장 실패 (무시): {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def delete(self, key):
+        path = self._path(key)
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+            os.remove(path)
+            self._add_size(-size)
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith('.json.gz'):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def _evict(self):
+        if not self.max_bytes:
+            return
+        with self._lock:
+            if self._total is not None and self._total <= self.max_bytes:
+                return
+            # 처음 또는 추적 용량 초과 시에만 폴더 전체 조회 (다른 프로세스가 쓴 항목도 반영)
+            entries = list(self._entries())
+            total = sum(size for _, size, _ in entries)
+            if total > self.max_bytes:
+                target = self.max_bytes * CACHE_EVICT_TARGET_RATIO
+                for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    if total <= target:
+                        break
+            self._total = total
+
+
+class TranscriptCache(DiskCache):
+    """
+    STT 결과 캐시 (오디오 내용 해시 + STT 설정 기준).
+    재처리 시 같은 오디오는 STT 서버에 다시 보내지 않습니다.
+    """
+    @staticmethod
+    def make_key(content_hash, fingerprint):
+        return f"{content_hash}_{fingerprint_hash(fingerprint)}"
+
+    def get_transcript(self, key):
+        value = self.get(key)
+        if not value:
+            return None
+        segments = [
+            {'id': i, 'start': start, 'end': end, 'text': text}
+            for i, (start, end, text) in enumerate(value.get('segments', []))
+        ]
+        result = {'text': value.get('text', ''), 'segments': segments}
+        if value.get('language'):
+            result['language'] = value['language']
+        return result
+
+    def put_transcript(self, key, result):
+        if not isinstance(result, dict):
+            return
+        # 세그먼트는 [start, end, text]만 남겨 용량 절약
+        compact = {
+            'text': result.get('text', ''),
+            'segments': [
+                [round(float(seg.get('start', 0)), 2), round(float(seg.get('end', 0)), 2), seg.get('text', '')]
+                for seg in result.get('segments', []) or []
+            ]
+        }
+        if result.get('language'):
+            compact['language'] = result['language']
+        self.put(key, compact)
+
+
+class SummaryCache(DiskCache):
+    """
+    LLM 요약 캐시 (원문 해시 + 시스템 프롬프트 해시 + 모델/온도 기준).
+    요약 이후 단계(NAS, 텔레그램 등) 실패로 재처리할 때 같은 요약을 다시 생성하지 않습니다.
+    프롬프트 파일을 수정하면 해시가 바뀌어 이전 항목은 더 이상 조회되지 않고 LRU로 정리됩니다.
+    """
+    @staticmethod
+    def make_key(text, fingerprint):
+        return f"{text_sha256(text)}_{fingerprint_hash(fingerprint)}"
+
+    def get_summary(self, key):
+        value = self.get(key)
+        if not value:
+            return None
+        return value.get('summary') or None
+
+    def put_summary(self, key, summary):
+        if not summary:
+            return
+        self.put(key, {'summary': summary})
+
+
+def _cache_root():
+    cache_config = settings.config.get('cache', {}) or {}
+    return cache_config.get('dir') or settings.paths.get('cache', './data/cache')
+
+
+_transcript_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache():
+    global _transcript_cache
+    with _cache_lock:
+        if _transcript_cache is None:
+            cache_config = settings.config.get('cache', {}) or {}
+            max_mb = cache_config.get('transcript_max_mb', TRANSCRIPT_CACHE_MAX_MB)
+            _transcript_cache = TranscriptCache(os.path.join(_cache_root(), 'stt'), max_bytes=max_mb * 1024 * 1024)
+        return _transcript_cache
+
+
+_summary_cache = None
+
+
+def get_summary_cache():
+    global _summary_cache
+    with _cache_lock:
+        if _summary_cache is None:
+            cache_config = settings.config.get('cache', {}) or {}
+            max_mb = cache_config.get('summary_max_mb', SUMMARY_CACHE_MAX_MB)
+            _summary_cache = SummaryCache(os.path.join(_cache_root(), 'llm'), max_bytes=max_mb * 1024 * 1024)
+        return _summary_cache
@@ -0,0 +1,74 @@
+import json
+import time
+from contextlib import closing
+
+from src import state_db
+
+
+class STTJobStore:
+    """
+    STT 서버에 제출한 Job ID를 로컬 DB에 기록합니다.
+    Streamlit 재시작/컨테이너 재기동 후에도 서버에서 진행 중이던 Job에 다시 붙어
+    결과를 받아오기 위한 용도입니다. (같은 파일을 다시 업로드하지 않음)
+
+    record_key: 결과를 저장할 캐시 키 (오디오 해시 + STT 설정)
+    분할 전송 시 한 record_key에 청크 수만큼 행이 생깁니다.
+    """
+    def __init__(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS stt_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    record_key TEXT NOT NULL,
+                    base_url TEXT NOT NULL,
+                    part_index INTEGER NOT NULL DEFAULT 0,
+                    part_count INTEGER NOT NULL DEFAULT 1,
+                    offset_sec REAL NOT NULL DEFAULT 0,
+                    context TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_stt_jobs_key ON stt_jobs(record_key)")
+
+    def add(self, record_key, job_id, base_url, part_index=0, part_count=1, offset=0.0, context=None):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stt_jobs "
+                "(job_id, record_key, base_url, part_index, part_count, offset_sec, context, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, record_key, base_url, part_index, part_count, offset,
+                 json.dumps(context or {}, ensure_ascii=False), time.time())
+            )
+
+    def get_group(self, record_key):
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM stt_jobs WHERE record_key = ? ORDER BY part_index", (record_key,)
+            ).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def groups(self):
+        """record_key -> [job dict, ...]"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute("SELECT * FROM stt_jobs ORDER BY record_key, part_index").fetchall()
+        grouped = {}
+        for r in rows:
+            grouped.setdefault(r['record_key'], []).append(self._to_dict(r))
+        return grouped
+
+    def has_pending(self):
+        with closing(state_db.connect()) as conn:
+            return conn.execute("SELECT 1 FROM stt_jobs LIMIT 1").fetchone() is not None
+
+    def delete_group(self, record_key):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("DELETE FROM stt_jobs WHERE record_key = ?", (record_key,))
+
+    @staticmethod
+    def _to_dict(row):
+        d = dict(row)
+        try:
+            d['context'] = json.loads(d.get('context') or '{}')
+        except ValueError:
+            d['context'] = {}
+        return d
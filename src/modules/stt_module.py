@@ -1,23 +1,103 @@
+import hashlib
 import os
-import requests
+from abc import ABC, abstractmethod
+import threading
 import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.config_loader import settings
+from src.constants import (
+    STT_CHUNK_MIN_DURATION_SEC, STT_CHUNK_COUNT, STT_CHUNK_OVERLAP_SEC, STT_CHUNK_SEARCH_RATIO,
+    STT_UPLOAD_CHUNK_SIZE, STT_UPLOAD_RETRIES, STT_UPLOAD_TIMEOUT
+)
+from src.modules.circuit_breaker import probe_timeout, CircuitOpenError
+from src.modules.endpoint_pool import get_endpoint_pool
+from src.modules.http_client import get_http_client
+from src.modules.result_cache import get_transcript_cache, file_sha256
+from src.modules.stt_job_store import STTJobStore
+from src.modules.stt_poller import get_stt_poller
+from src.utils.multipart_stream import MultipartFileStream, MultipartPipeStream
+from src.utils.transcript_stitcher import stitch_transcripts
+
+class UploadRejected(RuntimeError):
+    """STT 서버가 업로드를 거부(200 이외 응답)한 경우"""
+    def __init__(self, status_code):
+        super().__init__(f"Upload Failed ({status_code})")
+        self.status_code = status_code
+
+class STTEngine(ABC):
+    """
+    STT 엔진 공통 인터페이스.
+    transcribe()는 성공 시 {'text', 'segments'} dict, 실패 시 "Error: ..." 문자열을 반환합니다.
+    결과 캐시(오디오 해시 + cache_fingerprint 기준)는 모든 엔진이 공유합니다.
+    """
+    name = "base"
 
-class ServerSTT:
     def __init__(self):
-        self.config = settings.config.get('stt_server', {})
-        self.base_url = self.config.get('api_url')
-        self.api_key = self.config.get('api_key')
-        
+        cache_enabled = (settings.config.get('cache', {}) or {}).get('enabled', True)
+        self.cache = get_transcript_cache() if cache_enabled else None
+
+    @abstractmethod
+    def transcribe(self, audio_path, progress_callback=None, context=None):
+        """오디오 파일 변환 -> {'text', 'segments'} 또는 "Error: ..." 문자열"""
+
+    @abstractmethod
+    def is_available(self):
+        """지금 이 엔진으로 변환을 시도할 수 있는지 (설정/서버 상태)"""
+
+    @abstractmethod
+    def cache_fingerprint(self):
+        """캐시 키에 포함되는 STT 설정 (모델/언어가 바뀌면 다른 결과로 취급)"""
+
+    def cache_key_for(self, audio_path):
+        if not self.cache:
+            return None
+        return self.cache.make_key(file_sha256(audio_path), self.cache_fingerprint())
+
+    def get_cached(self, cache_key):
+        if not self.cache or not cache_key:
+            return None
+        cached = self.cache.get_transcript(cache_key)
+        if cached:
+            print(f"[STT] 캐시 적중 - 변환 생략 ({cache_key[:12]}...)")
+        return cached
+
+    def _store(self, result, cache_key):
+        if self.cache and cache_key and isinstance(result, dict):
+            self.cache.put_transcript(cache_key, result)
+
+class ServerSTT(STTEngine):
+    name = "server"
+
+    def __init__(self, config=None):
+        """
+        :param config: stt_server 설정 dict (None이면 config.yaml 사용, 부하 테스트 등에서 대체 서버 지정용)
+        """
+        super().__init__()
+        self.config = config if config is not None else settings.config.get('stt_server', {})
+        self.http = get_http_client('stt')
+        # STT 서버 풀 (endpoints 목록 또는 단일 api_url) - 가장 한가한 서버로 업로드, 장애 서버는 제외
+        self.pool = get_endpoint_pool('stt', self.config, probe=self._probe)
+        first = self.pool.endpoints[0] if self.pool.endpoints else None
+        self.base_url = first.url if first else None
+        self.api_key = first.api_key if first else None
+        self.chunk_config = self.config.get('chunking', {}) or {}
+        self.upload_config = self.config.get('upload', {}) or {}
+        # 재시작 후 Job 재연결은 캐시 키를 기준으로 하므로 캐시 사용 시에만 기록
+        self.job_store = STTJobStore() if self.cache else None
+
         if not self.base_url or not self.api_key:
             print("❌ STT 설정(URL/Key)이 누락되었습니다. config.yaml을 확인해주세요.")
-    
-    def transcribe(self, audio_path):
+
+    def transcribe(self, audio_path, progress_callback=None, context=None):
         """
         Transcribe audio using the server API.
         1. Upload -> Job ID
         2. Poll Status -> Completed
         3. Get Result -> Text
+        긴 오디오는 (chunking.enabled 시) 무음 구간에서 나눠 병렬 전송 후 병합합니다.
+        :param progress_callback: 업로드 진행률 콜백 (bytes_sent, total_bytes)
+        :param context: Job 기록에 함께 남길 정보 (예: {'sheet_type', 'row_idx'})
         """
         if not os.path.exists(audio_path):
             return "Error: Audio file not found."
@@ -25,58 +105,458 @@ class ServerSTT:
         if not self.base_url:
             return "Error: STT Server Configuration Missing."
 
-        print(f"[STT] 서버로 변환 요청 중... ({os.path.basename(audio_path)})")
-        
-        # 1. File Upload
-        upload_url = f"{self.base_url}/transcribe"
-        headers = {"X-API-Key": self.api_key}
-        
+        cache_key = self.cache_key_for(audio_path)
+        cached = self.get_cached(cache_key)
+        if cached:
+            return cached
+
+        if not self.pool.allow():
+            return f"Error: {CircuitOpenError('STT', self.pool.last_error)}"
+
         try:
-            with open(audio_path, 'rb') as f:
-                files = {'file': f}
-                # Optional: Add language='ko' if known, but auto-detect is default
-                response = requests.post(upload_url, headers=headers, files=files)
-                
-            if response.status_code != 200:
-                print(f"❌ Upload Failed: {response.status_code} - {response.text}")
-                return f"Error: Upload Failed ({response.status_code})"
-                
-            job_data = response.json()
-            job_id = job_data.get('job_id')
-            print(f"     ㄴ Job ID 발급: {job_id} (대기열: {job_data.get('queue_position')}번째)")
-            
-            # 2. Polling
-            status_url = f"{self.base_url}/transcribe/job/{job_id}"
-            
-            while True:
-                time.sleep(2) # 2초 간격 확인
-                res = requests.get(status_url, headers=headers)
-                state_data = res.json()
-                status = state_data.get('status')
-                
-                if status == 'completed':
-                    print("     ㄴ 변환 완료!")
-                    break
-                elif status == 'failed':
-                    err = state_data.get('error')
-                    print(f"❌ 변환 실패: {err}")
-                    return f"Error: Transcription Failed ({err})"
-                else:
-                    # queued or processing
-                    print(f"     ... {status} ing", end='\r')
-            
-            # 3. Get Result
-            result_url = f"{self.base_url}/transcribe/job/{job_id}/result"
-            res = requests.get(result_url, headers=headers)
-            final_data = res.json()
-            
+            # 이전 프로세스가 제출해둔 Job이 있으면 재업로드 없이 결과만 받아옴
+            resumed = self._resume(cache_key)
+            if resumed:
+                self._store(resumed, cache_key)
+                return resumed
+
+            print(f"[STT] 서버로 변환 요청 중... ({os.path.basename(audio_path)})")
+
+            ranges = self._plan_chunks(audio_path)
+            if len(ranges) > 1:
+                result = self._transcribe_chunked(audio_path, ranges, progress_callback, cache_key, context)
+            else:
+                job = self._upload(audio_path, progress_callback)
+                self._record(cache_key, [job], [0.0], context)
+                try:
+                    result = self._wait_for_result(job)
+                finally:
+                    self._forget(cache_key)
+
+            self._store(result, cache_key)
             # Return full data (text + segments) for SRT generation
-            return final_data
+            return result
 
         except Exception as e:
             print(f"❌ STT Exception: {e}")
             return f"Error: {str(e)}"
 
+    def transcribe_stream(self, chunks, filename, progress_callback=None, source_key=None, context=None):
+        """
+        ffmpeg stdout 등 생성 중인 오디오 바이트를 그대로 업로드해 변환합니다.
+        (인코딩과 네트워크 전송이 겹쳐서 진행됨)
+        스트림은 재생할 수 없으므로 업로드 재시도는 하지 않으며, 실패 시 "Error: ..." 문자열을 반환합니다.
+        호출 측은 파일 기반 transcribe()로 대체 실행하면 됩니다.
+        :param source_key: 원본(영상) 기준 캐시 키 (source_cache_key). 스트림은 업로드 전에
+                           오디오 해시를 알 수 없으므로 재처리 시 이 키로 캐시를 조회합니다.
+        """
+        if not self.base_url:
+            return "Error: STT Server Configuration Missing."
+        if not self.pool.allow():
+            return f"Error: {CircuitOpenError('STT', self.pool.last_error)}"
+
+        digest = hashlib.sha256()
+
+        def hashing(source):
+            for chunk in source:
+                digest.update(chunk)
+                yield chunk
+
+        print(f"[STT] 서버로 스트리밍 변환 요청 중... ({filename})")
+        try:
+            stream = MultipartPipeStream(
+                'file', hashing(chunks), filename,
+                file_content_type="audio/mpeg",
+                progress_callback=progress_callback
+            )
+            endpoint = self.pool.acquire()
+            try:
+                job = self._post_upload(stream, endpoint)
+            finally:
+                self.pool.end(endpoint)
+            self._record(source_key, [job], [0.0], context)
+            try:
+                result = self._wait_for_result(job)
+            finally:
+                self._forget(source_key)
+
+            if self.cache:
+                self._store(result, self.cache.make_key(digest.hexdigest(), self.cache_fingerprint()))
+                self._store(result, source_key)
+            return result
+        except Exception as e:
+            print(f"❌ STT Stream Exception: {e}")
+            return f"Error: {str(e)}"
+
+    def is_available(self):
+        return bool(self.base_url and self.api_key) and self.pool.allow()
+
+    def _probe(self, endpoint):
+        """헬스 체크: 서버가 HTTP 응답을 주면(5xx 제외) 정상으로 판단"""
+        res = self.http.get(endpoint.url, headers={"X-API-Key": endpoint.api_key}, timeout=probe_timeout())
+        return res.status_code < 500
+
+    # --- Transcript Cache ---
+
+    def cache_fingerprint(self):
+        return {
+            'engine': 'server',
+            'model': self.config.get('model', 'default'),
+            'language': self.config.get('language', 'auto')
+        }
+
+    def source_cache_key(self, video_path):
+        """스트리밍 모드용: 원본 영상 내용 기준 캐시 키"""
+        if not self.cache:
+            return None
+        fingerprint = dict(self.cache_fingerprint(), source='video', audio='mp3-cbr192k')
+        return self.cache.make_key(file_sha256(video_path), fingerprint)
+
+    # --- Resumable Jobs ---
+
+    def _record(self, record_key, jobs, offsets, context=None):
+        """제출한 Job ID를 로컬 DB에 기록 (프로세스가 죽어도 재연결 가능하도록)"""
+        if not self.job_store or not record_key:
+            return
+        for i, ((job_id, _, endpoint), offset) in enumerate(zip(jobs, offsets)):
+            self.job_store.add(
+                record_key, job_id, endpoint.url,
+                part_index=i, part_count=len(jobs), offset=offset, context=context
+            )
+
+    def _forget(self, record_key):
+        if self.job_store and record_key:
+            self.job_store.delete_group(record_key)
+
+    def _resume(self, record_key):
+        """
+        기록된 Job에 다시 붙어 결과를 받아옵니다.
+        서버에서 Job이 사라졌거나 실패했으면 기록을 지우고 None 반환 (호출 측이 새로 제출)
+        """
+        if not self.job_store or not record_key:
+            return None
+        group = self.job_store.get_group(record_key)
+        if not group:
+            return None
+        if len(group) != group[0]['part_count']:
+            # 분할 업로드 도중 중단되어 일부 청크만 기록된 경우
+            self._forget(record_key)
+            return None
+
+        print(f"[STT] 기존 서버 Job 재연결: {', '.join(row['job_id'] for row in group)}")
+        futures = []
+        for row in group:
+            # 기록된 서버가 풀에 남아 있으면 해당 서버의 키/부하 집계 사용
+            endpoint = self.pool.endpoint_for(row['base_url'])
+            if endpoint:
+                futures.append(self._track((row['job_id'], None, endpoint)))
+            else:
+                headers = {"X-API-Key": self.api_key}
+                futures.append(get_stt_poller().track(row['base_url'], row['job_id'], headers))
+        try:
+            results = self._wait_all(futures)
+        except Exception as e:
+            print(f"     ⚠️ 재연결 실패, 새로 제출합니다: {e}")
+            self._forget(record_key)
+            return None
+
+        self._forget(record_key)
+        if len(results) == 1:
+            return results[0]
+        return stitch_transcripts(results, [row['offset_sec'] for row in group])
+
+    def resume_pending_jobs(self, log_callback=print):
+        """
+        (시작 시 호출) 재시작 전에 제출된 Job들의 결과를 받아 캐시에 저장합니다.
+        이후 해당 행을 재처리하면 캐시에서 바로 결과를 가져갑니다.
+        """
+        if not self.job_store:
+            return 0
+        recovered = 0
+        for record_key, group in self.job_store.groups().items():
+            context = group[0].get('context') or {}
+            log_callback(f"[STT] 미완료 Job 복구 중: {context or record_key[:12]}")
+            result = self._resume(record_key)
+            if result:
+                self._store(result, record_key)
+                recovered += 1
+        log_callback(f"[STT] Job 복구 완료: {recovered}건")
+        return recovered
+
+    def should_stream(self, duration):
+        """스트리밍 모드 사용 여부 (분할 전송 대상 길이면 파일 기반 처리)"""
+        if not self.config.get('stream_from_ffmpeg', False):
+            return False
+        if self.chunk_config.get('enabled', False):
+            min_duration = self.chunk_config.get('min_duration_sec', STT_CHUNK_MIN_DURATION_SEC)
+            return duration < min_duration
+        return True
+
+    def _post_upload(self, stream, endpoint):
+        """업로드 요청 1회 전송. 성공 시 (Job ID, 대기열 순번, 서버), 실패 시 예외"""
+        upload_url = f"{endpoint.url}/transcribe"
+        headers = {"X-API-Key": endpoint.api_key, "Content-Type": stream.content_type}
+        try:
+            response = self.http.post(upload_url, headers=headers, data=stream, timeout=STT_UPLOAD_TIMEOUT)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            endpoint.breaker.record_failure(type(e).__name__)
+            raise
+
+        if response.status_code != 200:
+            print(f"❌ Upload Failed: {response.status_code} - {response.text}")
+            if response.status_code >= 500:
+                endpoint.breaker.record_failure(f"HTTP {response.status_code}")
+            raise UploadRejected(response.status_code)
+        endpoint.breaker.record_success()
+
+        job_data = response.json()
+        job_id = job_data.get('job_id')
+        queue_position = job_data.get('queue_position')
+        endpoint.report_queue(queue_position)
+        server = f", 서버: {endpoint.name}" if len(self.pool.endpoints) > 1 else ""
+        print(f"     ㄴ Job ID 발급: {job_id} (대기열: {queue_position}번째{server})")
+        return job_id, queue_position, endpoint
+
+    def _upload(self, audio_path, progress_callback=None):
+        """
+        파일을 가장 한가한 서버로 스트리밍 업로드한 뒤 (Job ID, 대기열 순번, 서버) 반환.
+        연결 끊김/타임아웃/5xx 응답은 새 스트림으로 재시도합니다. (Job 생성 전이므로 중복 Job 없음)
+        서버가 여러 대면 재시도는 실패한 서버를 피해서 보냅니다.
+        """
+        chunk_size = int(self.upload_config.get('chunk_size_kb', STT_UPLOAD_CHUNK_SIZE // 1024)) * 1024
+        retries = int(self.upload_config.get('retries', STT_UPLOAD_RETRIES))
+        backoff = float(self.upload_config.get('backoff_sec', 2))
+
+        last_error = None
+        failed = []
+        for attempt in range(retries + 1):
+            # Optional: Add language='ko' if known, but auto-detect is default
+            stream = MultipartFileStream(
+                'file', audio_path,
+                file_content_type="audio/mpeg",
+                chunk_size=chunk_size,
+                progress_callback=progress_callback
+            )
+            endpoint = self.pool.acquire(exclude=failed)
+            try:
+                return self._post_upload(stream, endpoint)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                last_error = f"Upload Interrupted ({type(e).__name__})"
+            except UploadRejected as e:
+                last_error = str(e)
+                if e.status_code < 500:
+                    break # 4xx는 재시도해도 동일
+            finally:
+                self.pool.end(endpoint)
+            failed.append(endpoint)
+
+            if attempt < retries:
+                if not self.pool.allow():
+                    raise CircuitOpenError('STT', last_error)
+                wait = backoff * (2 ** attempt)
+                print(f"     ⚠️ 업로드 재시도 ({attempt+1}/{retries}, {wait:.0f}초 후): {last_error}")
+                time.sleep(wait)
+
+        raise RuntimeError(last_error)
+
+    def _track(self, job):
+        """업로드된 Job을 공유 폴러에 등록하고 Future 반환 (완료까지 해당 서버의 진행 중 Job으로 집계)"""
+        job_id, queue_position, endpoint = job
+        headers = {"X-API-Key": endpoint.api_key}
+        self.pool.begin(endpoint)
+        future = get_stt_poller().track(endpoint.url, job_id, headers, queue_position=queue_position, endpoint=endpoint)
+        future.add_done_callback(lambda _: self.pool.end(endpoint))
+        return future
+
+    def _wait_for_result(self, job):
+        """Job 완료까지 대기 후 결과(dict) 반환 (폴러의 Job 타임아웃 + 여유 시간까지만 대기)"""
+        poller = get_stt_poller()
+        return self._track(job).result(timeout=poller.timeout + 60)
+
+    @staticmethod
+    def _wait_all(futures):
+        """여러 Job 결과를 순서대로 반환 (전체 대기도 폴러의 Job 타임아웃 + 여유 시간까지만)"""
+        deadline = time.monotonic() + get_stt_poller().timeout + 60
+        return [f.result(timeout=max(0, deadline - time.monotonic())) for f in futures]
+
+    # --- Chunked Mode ---
+
+    def _plan_chunks(self, audio_path):
+        """
+        분할 구간 목록 [(start, end), ...] 반환.
+        분할하지 않을 경우 [(0, None)] 한 개만 반환합니다.
+        """
+        if not self.chunk_config.get('enabled', False):
+            return [(0, None)]
+
+        from src.modules.media import MediaProcessor
+        mp = MediaProcessor()
+
+        duration = mp._get_duration(audio_path)
+        min_duration = self.chunk_config.get('min_duration_sec', STT_CHUNK_MIN_DURATION_SEC)
+        count = int(self.chunk_config.get('chunks', STT_CHUNK_COUNT))
+        if duration < min_duration or count < 2:
+            return [(0, None)]
+
+        silences = mp.detect_silences(
+            audio_path,
+            noise_db=self.chunk_config.get('silence_db', -30),
+            min_silence=self.chunk_config.get('silence_min_sec', 0.4)
+        )
+        cuts = self._choose_cut_points(duration, count, silences)
+        overlap = float(self.chunk_config.get('overlap_sec', STT_CHUNK_OVERLAP_SEC))
+
+        ranges = []
+        bounds = [0.0] + cuts + [None]
+        for i in range(len(bounds) - 1):
+            start = bounds[i] if i == 0 else max(0.0, bounds[i] - overlap)
+            ranges.append((start, bounds[i + 1]))
+        return ranges
+
+    @staticmethod
+    def _choose_cut_points(duration, count, silences):
+        """균등 분할 지점 근처의 무음 구간 중앙을 분할 지점으로 선택 (없으면 균등 지점)"""
+        chunk_len = duration / count
+        window = chunk_len * STT_CHUNK_SEARCH_RATIO
+        midpoints = [(s + e) / 2 for s, e in silences]
+
+        cuts = []
+        for k in range(1, count):
+            target = chunk_len * k
+            near = [m for m in midpoints if abs(m - target) <= window and (not cuts or m > cuts[-1])]
+            cut = min(near, key=lambda m: abs(m - target)) if near else target
+            cuts.append(round(cut, 3))
+        return cuts
+
+    def _transcribe_chunked(self, audio_path, ranges, progress_callback=None, record_key=None, context=None):
+        from src.modules.media import MediaProcessor
+        mp = MediaProcessor()
+
+        print(f"     ㄴ 분할 전송 모드: {len(ranges)}개 청크 (무음 구간 기준)")
+        chunk_paths = mp.split_audio(audio_path, ranges)
+
+        # 청크별 업로드 진행률을 합산해서 하나의 진행률로 보고
+        sent = [0] * len(chunk_paths)
+        sent_lock = threading.Lock()
+        total = sum(os.path.getsize(p) for p in chunk_paths)
+
+        def make_callback(idx):
+            def callback(current, _chunk_total):
+                with sent_lock:
+                    sent[idx] = current
+                    done = sum(sent)
+                if progress_callback:
+                    progress_callback(min(done, total), total)
+            return callback
+
+        try:
+            jobs = [None] * len(chunk_paths)
+            upload_error = None
+            with ThreadPoolExecutor(max_workers=len(chunk_paths)) as pool:
+                uploads = {pool.submit(self._upload, path, make_callback(i)): i for i, path in enumerate(chunk_paths)}
+                for future in as_completed(uploads):
+                    try:
+                        jobs[uploads[future]] = future.result()
+                    except Exception as e:
+                        upload_error = upload_error or e
+            if upload_error:
+                # 이미 업로드된 청크 Job은 서버에서 끝날 때까지 추적 (결과는 사용하지 않음, 서버에 방치되지 않도록)
+                for job in jobs:
+                    if job:
+                        self._track(job)
+                raise upload_error
+
+            offsets = [start for start, _ in ranges]
+            self._record(record_key, jobs, offsets, context)
+            try:
+                # 모든 청크를 하나의 폴러가 동시에 추적
+                futures = [self._track(job) for job in jobs]
+                results = self._wait_all(futures)
+            finally:
+                self._forget(record_key)
+        finally:
+            for p in chunk_paths:
+                if os.path.exists(p):
+                    os.remove(p)
+
+        merged = stitch_transcripts(results, offsets)
+        print(f"     ㄴ 청크 병합 완료 (세그먼트 {len(merged['segments'])}개)")
+        return merged
+
+class STTRouter(STTEngine):
+    """
+    설정에 따라 STT 엔진을 선택/대체 실행합니다. (stt_engine.routing)
+    - primary 엔진 실패 시 fallback 엔진으로 재시도 (예: 서버 다운 시 로컬 Whisper)
+    - 짧은 클립(short_clip_types, short_clip_local_sec 미만)은 로컬 엔진 우선 -> 서버 대기열 생략
+    """
+    name = "router"
+
+    def __init__(self):
+        super().__init__()
+        engine_config = settings.config.get('stt_engine', {}) or {}
+        self.routing = engine_config.get('routing', {}) or {}
+
+        from src.modules.local_whisper import LocalWhisperSTT
+        self.engines = {
+            'server': ServerSTT(),
+            'local': LocalWhisperSTT(engine_config.get('local_whisper', {}))
+        }
+        self.server = self.engines['server']
+
+    def engine_order(self, context=None, audio_path=None):
+        """이 작업에 시도할 엔진 순서"""
+        primary = self.routing.get('primary', 'server')
+        fallback = self.routing.get('fallback', 'none')
+        order = [primary] + ([fallback] if fallback in self.engines and fallback != primary else [])
+
+        context = context or {}
+        short_sec = float(self.routing.get('short_clip_local_sec', 0) or 0)
+        short_types = self.routing.get('short_clip_types', ['mission_news'])
+        if short_sec > 0 and context.get('sheet_type') in short_types:
+            duration = context.get('duration')
+            if duration is None and audio_path:
+                from src.modules.media import MediaProcessor
+                duration = MediaProcessor()._get_duration(audio_path)
+            if duration is not None and duration < short_sec:
+                order = ['local'] + [e for e in order if e != 'local']
+
+        return [self.engines[e] for e in order if e in self.engines and self.engines[e].is_available()]
+
+    def transcribe(self, audio_path, progress_callback=None, context=None):
+        engines = self.engine_order(context, audio_path)
+        if not engines:
+            return "Error: 사용 가능한 STT 엔진이 없습니다."
+
+        result = None
+        for engine in engines:
+            result = engine.transcribe(audio_path, progress_callback=progress_callback, context=context)
+            if isinstance(result, dict):
+                return result
+            print(f"[STT] ⚠️ {engine.name} 엔진 실패: {str(result)[:80]}")
+        return result
+
+    def is_available(self):
+        return any(engine.is_available() for engine in self.engines.values())
+
+    def cache_fingerprint(self):
+        # 작업 기록용 라우터 캐시 키 (엔진별 결과는 각 엔진이 따로 캐시)
+        return {'engine': self.name}
+
+    # 스트리밍 업로드는 서버 엔진 전용 -> 서버가 1순위일 때만 사용
+    def should_stream(self, duration, context=None):
+        context = dict(context or {}, duration=duration)
+        engines = self.engine_order(context)
+        return bool(engines) and engines[0] is self.server and self.server.should_stream(duration)
+
+    def transcribe_stream(self, *args, **kwargs):
+        return self.server.transcribe_stream(*args, **kwargs)
+
+    def source_cache_key(self, video_path):
+        return self.server.source_cache_key(video_path)
+
+    def get_cached(self, cache_key):
+        return self.server.get_cached(cache_key)
+
 # 테스트용 코드
 if __name__ == "__main__":
     stt = ServerSTT()
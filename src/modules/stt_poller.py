@@ -0,0 +1,216 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from src.config_loader import settings
+from src.modules.circuit_breaker import get_breaker
+from src.modules.http_client import get_http_client
+from src.constants import (
+    STT_POLL_INTERVAL, STT_POLL_MAX_INTERVAL, STT_POLL_QUEUE_STEP,
+    STT_POLL_PROCESSING_RATIO, STT_POLL_TIMEOUT_SECONDS, STT_POLL_MAX_ERRORS
+)
+
+
+class STTJobNotFound(RuntimeError):
+    """서버에 해당 Job이 없음 (서버 재시작 등으로 유실)"""
+    def __init__(self, job_id):
+        super().__init__(f"STT Job Not Found: {job_id}")
+        self.job_id = job_id
+
+
+class STTJobPoller:
+    """
+    STT 서버 Job 상태를 하나의 백그라운드 스레드에서 일괄 추적하는 폴러입니다.
+    - 공용 STT HTTP 클라이언트 사용 (Keep-Alive 연결 재사용 + 요청 통계)
+    - 대기열 순번(queue_position)과 처리 경과 시간에 따라 폴링 간격 자동 조절
+    - 여러 Job을 동시에 추적하며, 각 Job은 Future로 결과를 돌려줍니다.
+    """
+    def __init__(self, config=None):
+        config = config or {}
+        self.min_interval = float(config.get('min_interval_sec', STT_POLL_INTERVAL))
+        self.max_interval = float(config.get('max_interval_sec', STT_POLL_MAX_INTERVAL))
+        self.queue_step = float(config.get('queue_step_sec', STT_POLL_QUEUE_STEP))
+        self.processing_ratio = float(config.get('processing_ratio', STT_POLL_PROCESSING_RATIO))
+        self.timeout = float(config.get('timeout_sec', STT_POLL_TIMEOUT_SECONDS))
+        self.request_timeout = (5, 30)
+
+        self.http = get_http_client('stt')
+        self._jobs = {} # job_id -> tracking info
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.poll_count = 0
+
+    def track(self, base_url, job_id, headers, queue_position=None, endpoint=None):
+        """
+        Job을 추적 목록에 추가하고 Future를 반환합니다.
+        Future는 완료 시 결과 dict, 실패/타임아웃 시 예외를 가집니다.
+        :param endpoint: 서버 풀의 Endpoint - 대기열 순번 보고/장애 기록 대상 (없으면 'stt' 브레이커)
+        """
+        now = time.monotonic()
+        tracked = {
+            'job_id': job_id,
+            'base_url': base_url,
+            'headers': headers,
+            'future': Future(),
+            'status': 'queued',
+            'queue_position': queue_position,
+            'endpoint': endpoint,
+            'submitted_at': now,
+            'processing_since': None,
+            'next_poll_at': now + self.min_interval,
+            'errors': 0,
+            'polls': 0
+        }
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing:
+                # 같은 Job을 여러 곳에서 기다리는 경우 (재시작 복구 + 재처리) 하나의 Future 공유
+                return existing['future']
+            self._jobs[job_id] = tracked
+            self._ensure_thread()
+        self._wakeup.set()
+        return tracked['future']
+
+    def outstanding(self):
+        """추적 중인 Job 요약 (대시보드/디버깅용)"""
+        with self._lock:
+            return [
+                {k: v for k, v in t.items() if k in ('job_id', 'status', 'queue_position', 'polls')}
+                for t in self._jobs.values()
+            ]
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="stt-poller")
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due = [t for t in self._jobs.values() if t['next_poll_at'] <= now]
+                next_at = min(t['next_poll_at'] for t in self._jobs.values())
+
+            if not due:
+                self._wakeup.wait(timeout=max(0.05, next_at - time.monotonic()))
+                self._wakeup.clear()
+                continue
+
+            for tracked in due:
+                try:
+                    self._poll_once(tracked)
+                except Exception as e:
+                    # 예상 못한 오류는 해당 Job만 실패 처리 (폴링 스레드는 계속)
+                    print(f"⚠️ STT 상태 조회 처리 오류 ({tracked['job_id']}): {e}")
+                    self._finish(tracked, error=e)
+
+    def _finish(self, tracked, result=None, error=None):
+        with self._lock:
+            self._jobs.pop(tracked['job_id'], None)
+        if tracked['future'].done():
+            return
+        if error is not None:
+            tracked['future'].set_exception(error)
+        else:
+            tracked['future'].set_result(result)
+
+    def _poll_once(self, tracked):
+        now = time.monotonic()
+        if now - tracked['submitted_at'] > self.timeout:
+            self._finish(tracked, error=TimeoutError(f"STT Job Timeout ({int(self.timeout)}s): {tracked['job_id']}"))
+            return
+
+        status_url = f"{tracked['base_url']}/transcribe/job/{tracked['job_id']}"
+        try:
+            res = self.http.get(status_url, headers=tracked['headers'], timeout=self.request_timeout)
+            self.poll_count += 1
+            tracked['polls'] += 1
+            if res.status_code == 404:
+                self._finish(tracked, error=STTJobNotFound(tracked['job_id']))
+                return
+            state_data = res.json()
+            if not isinstance(state_data, dict):
+                raise ValueError(f"예상하지 못한 응답 형식: {str(state_data)[:80]}")
+        except Exception as e:
+            tracked['errors'] += 1
+            if tracked['errors'] >= STT_POLL_MAX_ERRORS:
+                breaker = tracked['endpoint'].breaker if tracked['endpoint'] else get_breaker('stt')
+                breaker.record_failure(f"상태 조회 실패: {e}")
+                self._finish(tracked, error=RuntimeError(f"STT 상태 조회 실패: {e}"))
+            else:
+                tracked['next_poll_at'] = now + min(self.max_interval, self.min_interval * (2 ** tracked['errors']))
+            return
+
+        tracked['errors'] = 0
+        status = state_data.get('status')
+
+        if status == 'completed':
+            try:
+                result_url = f"{tracked['base_url']}/transcribe/job/{tracked['job_id']}/result"
+                res = self.http.get(result_url, headers=tracked['headers'], timeout=self.request_timeout)
+                if res.status_code != 200:
+                    raise RuntimeError(f"HTTP {res.status_code}")
+                result = res.json()
+                if not isinstance(result, dict) or not (result.get('text') or result.get('segments')):
+                    raise ValueError(f"결과에 text/segments 없음: {str(result)[:80]}")
+                print(f"     ㄴ 변환 완료! ({tracked['job_id']}, 폴링 {tracked['polls']}회)")
+                self._finish(tracked, result=result)
+            except Exception as e:
+                # 완료 상태인데 결과를 못 받으면 빈 자막으로 진행하지 않고 서버 실패로 집계
+                breaker = tracked['endpoint'].breaker if tracked['endpoint'] else get_breaker('stt')
+                breaker.record_failure(f"결과 조회 실패: {e}")
+                self._finish(tracked, error=RuntimeError(f"STT 결과 조회 실패: {e}"))
+            return
+
+        if status == 'failed':
+            err = state_data.get('error')
+            print(f"❌ 변환 실패: {err}")
+            self._finish(tracked, error=RuntimeError(f"Transcription Failed ({err})"))
+            return
+
+        # queued or processing
+        if status != tracked['status']:
+            print(f"     ... {tracked['job_id']}: {status}")
+        tracked['status'] = status
+        if 'queue_position' in state_data:
+            tracked['queue_position'] = state_data.get('queue_position')
+            if tracked['endpoint']:
+                tracked['endpoint'].report_queue(tracked['queue_position'])
+        if status == 'processing' and tracked['processing_since'] is None:
+            tracked['processing_since'] = now
+
+        tracked['next_poll_at'] = now + self._next_interval(tracked, now)
+
+    def _next_interval(self, tracked, now):
+        """
+        폴링 간격 계산
+        - queued: 앞선 대기 건수가 많을수록 천천히 (queue_position * queue_step)
+        - processing: 처리 경과 시간에 비례해 점점 길게 (경과시간 * processing_ratio)
+        """
+        if tracked['status'] == 'processing' and tracked['processing_since'] is not None:
+            interval = (now - tracked['processing_since']) * self.processing_ratio
+        else:
+            try:
+                position = max(0, int(tracked.get('queue_position') or 0))
+            except (TypeError, ValueError):
+                position = 0
+            interval = position * self.queue_step
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+def get_stt_poller():
+    """프로세스 전역 폴러 (JobProcessor가 Job마다 새로 생성되므로 모듈 단위로 공유)"""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            stt_config = settings.config.get('stt_server', {}) if settings else {}
+            _poller = STTJobPoller(stt_config.get('polling', {}))
+        return _poller
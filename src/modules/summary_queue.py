@@ -0,0 +1,85 @@
+import json
+import time
+from contextlib import closing
+
+from src import state_db
+
+
+class SummaryQueue:
+    """
+    나중에 요약할 작업 목록 (LLM 서버 장애/지연 시 보관 먼저 진행)
+    영상/오디오/자막은 이미 아카이브된 상태이며, 요약 완료 후 시트 갱신 + 텔레그램 전송만 남은 작업입니다.
+    """
+    def __init__(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pending_summaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sheet_type TEXT NOT NULL,
+                    row_idx INTEGER NOT NULL,
+                    filename TEXT NOT NULL,
+                    broadcast_date TEXT,
+                    header TEXT,
+                    text_path TEXT,
+                    llm_text TEXT NOT NULL,
+                    segments TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    next_attempt_at REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def enqueue(self, sheet_type, row_idx, filename, llm_text, segments=None,
+                broadcast_date=None, header=None, text_path=None):
+        with closing(state_db.connect()) as conn, conn:
+            # 같은 행을 다시 처리한 경우 이전 항목은 대체
+            conn.execute(
+                "DELETE FROM pending_summaries WHERE sheet_type = ? AND row_idx = ?", (sheet_type, row_idx)
+            )
+            conn.execute(
+                "INSERT INTO pending_summaries "
+                "(sheet_type, row_idx, filename, broadcast_date, header, text_path, llm_text, segments, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (sheet_type, row_idx, filename, broadcast_date, header, text_path, llm_text,
+                 json.dumps(segments or [], ensure_ascii=False), time.time())
+            )
+
+    def next_due(self):
+        """재시도 시각이 된 가장 오래된 항목 (없으면 None)"""
+        with closing(state_db.connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM pending_summaries WHERE next_attempt_at <= ? ORDER BY created_at LIMIT 1",
+                (time.time(),)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def mark_failed(self, item_id, error, retry_after):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "UPDATE pending_summaries SET attempts = attempts + 1, last_error = ?, next_attempt_at = ? "
+                "WHERE id = ?",
+                (str(error)[:500], time.time() + retry_after, item_id)
+            )
+
+    def delete(self, item_id):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("DELETE FROM pending_summaries WHERE id = ?", (item_id,))
+
+    def pending(self):
+        """대시보드용 대기 목록 (원문 제외)"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, sheet_type, row_idx, filename, attempts, last_error, next_attempt_at, created_at "
+                "FROM pending_summaries ORDER BY created_at"
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def _to_dict(row):
+        d = dict(row)
+        try:
+            d['segments'] = json.loads(d.get('segments') or '[]')
+        except ValueError:
+            d['segments'] = []
+        return d
@@ -1,5 +1,9 @@
 import requests
 from src.config_loader import settings
+from src.modules.circuit_breaker import CircuitOpenError, get_breaker, probe_timeout
+from src.modules.http_client import get_http_client
+from src.modules.telegram_outbox import TelegramSendError, get_outbox_sender, outbox_enabled
+from src.modules.telegram_digest import get_digest, digest_enabled
 import os
 
 class TelegramBot:
@@ -8,10 +12,39 @@ class TelegramBot:
         self.token = self.config.get('bot_token')
         self.chat_id = self.config.get('chat_id')
         self.base_url = f"https://api.telegram.org/bot{self.token}"
+        self.http = get_http_client('telegram')
+        # 텔레그램 API 장애 시 매 건 타임아웃을 기다리지 않도록 차단 (복구는 getMe 헬스 체크로 감지)
+        self.breaker = get_breaker('telegram')
+        if self.token:
+            self.breaker.probe = self._probe
+        # 전송 대기열: 작업 스레드는 등록만 하고, 전송/재시도/전송 간격 제한은 백그라운드 스레드가 담당
+        self.use_outbox = outbox_enabled()
+        # 묶음 전송: 작업별 알림 대신 배치 단위로 시트 종류당 메시지 1개 + 원문 압축 파일 1개
+        self.use_digest = digest_enabled()
+
+    def _probe(self):
+        res = self.http.get(f"{self.base_url}/getMe", timeout=probe_timeout())
+        return res.status_code < 500
+
+    def _post(self, url, **kwargs):
+        """요청 전송 + 브레이커 기록 (네트워크 오류/5xx만 장애로 간주)"""
+        if not self.breaker.admit():
+            raise CircuitOpenError("Telegram", self.breaker.last_error)
+        try:
+            res = self.http.post(url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            self.breaker.record_failure(type(e).__name__)
+            raise
+        if res.status_code >= 500:
+            self.breaker.record_failure(f"HTTP {res.status_code}")
+        else:
+            self.breaker.record_success()
+        return res
 
     def send_message(self, text):
         """
         Send a message to the configured chat_id.
+        전송 대기열 사용 시 등록만 하고 바로 반환 (전송은 백그라운드 스레드가 담당)
         """
         if not self.token:
             print("⚠️ Telegram Token missing.")
@@ -21,50 +54,123 @@ class TelegramBot:
             print("⚠️ Telegram Chat ID missing. Please check get_updates() to find your ID.")
             return
 
-        url = f"{self.base_url}/sendMessage"
-        payload = {
-            "chat_id": self.chat_id,
-            "text": text,
-            "parse_mode": "Markdown" # Optional
-        }
-        
+        if self.use_outbox:
+            try:
+                sender = get_outbox_sender()
+                sender.outbox.enqueue_message(self.chat_id, text)
+                sender.notify()
+                print("     ㄴ 텔레그램 전송 대기열 등록")
+            except Exception as e:
+                print(f"     ⚠️ 텔레그램 전송 대기열 등록 실패: {e}")
+            return
+
+        if not self.breaker.allow():
+            print(f"     ⛔ 텔레그램 차단 중 - 전송 생략 ({self.breaker.last_error})")
+            return
+
         try:
-            res = requests.post(url, json=payload, timeout=10)
-            if res.status_code == 200:
-                print("     ㄴ 텔레그램 전송 완료")
-            elif res.status_code == 400 and payload.get("parse_mode") == "Markdown":
-                print(f"     ⚠️ 마크다운 전송 실패 (400). 일반 텍스트로 재시도합니다...")
-                payload.pop("parse_mode") # Remove Markdown option
-                retry_res = requests.post(url, json=payload, timeout=10)
-                if retry_res.status_code == 200:
-                    print("     ㄴ 텔레그램 일반 텍스트 전송 완료 (Fallback)")
-                else:
-                    print(f"     ❌ 재시도 실패: {retry_res.text}")
-            else:
-                print(f"     ⚠️ 텔레그램 전송 실패: {res.text}")
+            self.deliver_message(self.chat_id, text)
+            print("     ㄴ 텔레그램 전송 완료")
         except Exception as e:
-            print(f"     ⚠️ 텔레그램 통신 에러: {e}")
+            print(f"     ⚠️ 텔레그램 전송 실패: {e}")
+
     def send_document(self, file_path):
         """
         Send a document (file) to the configured chat_id.
+        전송 대기열 사용 시 파일을 대기열 보관 폴더로 복사해두고 바로 반환
         """
         if not self.token or not self.chat_id:
             return
 
-        url = f"{self.base_url}/sendDocument"
-        
+        if self.use_outbox:
+            try:
+                sender = get_outbox_sender()
+                sender.outbox.enqueue_document(self.chat_id, file_path)
+                sender.notify()
+                print(f"     ㄴ 텔레그램 파일 전송 대기열 등록: {os.path.basename(file_path)}")
+            except Exception as e:
+                print(f"     ⚠️ 텔레그램 파일 전송 대기열 등록 실패: {e}")
+            return
+
+        if not self.breaker.allow():
+            print(f"     ⛔ 텔레그램 차단 중 - 파일 전송 생략: {os.path.basename(file_path)}")
+            return
+
         try:
-            with open(file_path, 'rb') as f:
-                files = {'document': f}
-                data = {'chat_id': self.chat_id}
-                res = requests.post(url, data=data, files=files, timeout=30)
-                
-            if res.status_code == 200:
-                print(f"     ㄴ 텔레그램 파일 전송 완료: {os.path.basename(file_path)}")
-            else:
-                print(f"     ⚠️ 텔레그램 파일 전송 실패: {res.text}")
+            self.deliver_document(self.chat_id, file_path=file_path)
+            print(f"     ㄴ 텔레그램 파일 전송 완료: {os.path.basename(file_path)}")
         except Exception as e:
-            print(f"     ⚠️ 텔레그램 파일 전송 에러: {e}")
+            print(f"     ⚠️ 텔레그램 파일 전송 실패: {e}")
+
+    def send_job_result(self, sheet_type, header, summary, text_path=None, batch_id=None):
+        """작업 완료 알림 (묶음 전송 사용 시 묶음에 추가, 아니면 요약 메시지 + 원문 파일 바로 전송)"""
+        if not self.token or not self.chat_id:
+            return
+
+        if self.use_digest:
+            try:
+                get_digest().add(sheet_type, header, summary, text_path=text_path, batch_id=batch_id)
+                print("     ㄴ 텔레그램 묶음 전송에 추가")
+                return
+            except Exception as e:
+                print(f"     ⚠️ 텔레그램 묶음 추가 실패, 개별 전송합니다: {e}")
+
+        self.send_message(f"{header}\n\n{summary}" if header else summary)
+        if text_path and os.path.exists(text_path):
+            self.send_document(text_path)
+
+    def flush(self, timeout=60):
+        """대기열에 남은 전송을 마칠 때까지 대기 (CLI 종료 직전 등)"""
+        if self.use_outbox and self.token and self.chat_id:
+            if not get_outbox_sender().flush(timeout):
+                print("     ⚠️ 텔레그램 대기열 전송이 끝나지 않았습니다. 다음 실행 시 이어서 전송합니다.")
+
+    def deliver_message(self, chat_id, text, parse_mode="Markdown"):
+        """
+        메시지 1건 즉시 전송 (마크다운 오류 시 일반 텍스트로 재전송)
+        실패 시 TelegramSendError (네트워크 오류는 requests 예외 그대로)
+        """
+        url = f"{self.base_url}/sendMessage"
+        payload = {"chat_id": chat_id, "text": text}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+
+        res = self._post(url, json=payload, timeout=10)
+        if res.status_code == 400 and parse_mode:
+            print("     ⚠️ 마크다운 전송 실패 (400). 일반 텍스트로 재시도합니다...")
+            payload.pop("parse_mode")
+            res = self._post(url, json=payload, timeout=10)
+        return self._result(res)
+
+    def deliver_document(self, chat_id, file_path=None, file_id=None, file_name=None):
+        """
+        문서 1건 즉시 전송 -> 텔레그램 file_id (같은 파일 재전송 시 업로드 없이 file_id로 전송 가능)
+        """
+        url = f"{self.base_url}/sendDocument"
+        if file_id:
+            res = self._post(url, data={'chat_id': chat_id, 'document': file_id}, timeout=30)
+        else:
+            with open(file_path, 'rb') as f:
+                files = {'document': (file_name or os.path.basename(file_path), f)}
+                res = self._post(url, data={'chat_id': chat_id}, files=files, timeout=30)
+        result = self._result(res) or {}
+        return (result.get('document') or {}).get('file_id')
+
+    @staticmethod
+    def _result(res):
+        """응답 확인 -> result (429는 retry_after, 5xx는 재시도 대상, 나머지 4xx는 재시도해도 동일한 실패)"""
+        try:
+            body = res.json()
+        except ValueError:
+            body = {}
+        if res.status_code == 200:
+            return body.get('result')
+        description = body.get('description') or res.text[:200]
+        if res.status_code == 429:
+            retry_after = (body.get('parameters') or {}).get('retry_after', 1)
+            raise TelegramSendError(f"HTTP 429: {description}", retry_after=float(retry_after))
+        raise TelegramSendError(f"HTTP {res.status_code}: {description}", permanent=res.status_code < 500)
+
     def get_updates(self):
         """
         Fetches recent updates to help user find their Chat ID.
@@ -74,7 +180,7 @@ class TelegramBot:
             
         url = f"{self.base_url}/getUpdates"
         try:
-            res = requests.get(url, timeout=10)
+            res = self.http.get(url, timeout=10)
             return res.json()
         except Exception as e:
             return str(e)
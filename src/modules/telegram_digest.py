@@ -0,0 +1,274 @@
+import os
+import shutil
+import threading
+import time
+import traceback
+import uuid
+import zipfile
+from contextlib import closing
+from datetime import datetime
+
+from src import state_db
+from src.config_loader import settings
+from src.constants import (
+    SHEET_TYPES, TELEGRAM_MESSAGE_LIMIT, TELEGRAM_DIGEST_WINDOW_SEC, TELEGRAM_DIGEST_POLL_SEC
+)
+
+DIGEST_FILES_DIR = "telegram_digest"
+
+
+def digest_config():
+    return ((settings.config.get('telegram', {}) or {}).get('digest', {}) or {}) if settings else {}
+
+
+def digest_enabled():
+    return bool(digest_config().get('enabled', False))
+
+
+def split_blocks(blocks, limit=TELEGRAM_MESSAGE_LIMIT):
+    """
+    블록(작업별 헤더+요약) 목록을 limit 글자 이하 메시지들로 묶기
+    블록 하나가 limit를 넘으면 줄 단위로, 한 줄이 넘으면 글자 수로 자름
+    """
+    pieces = []
+    for block in blocks:
+        if len(block) <= limit:
+            pieces.append(block)
+            continue
+        current = ""
+        for line in block.split("\n"):
+            while len(line) > limit:
+                room = limit - len(current) - 1 if current else limit
+                if room < 1:
+                    pieces.append(current)
+                    current = ""
+                    continue
+                pieces.append(f"{current}\n{line[:room]}" if current else line[:room])
+                current = ""
+                line = line[room:]
+            if current and len(current) + 1 + len(line) > limit:
+                pieces.append(current)
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            pieces.append(current)
+
+    messages = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 2 + len(piece) > limit:
+            messages.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        messages.append(current)
+    return messages
+
+
+def build_digest_messages(sheet_type, entries, limit=TELEGRAM_MESSAGE_LIMIT):
+    """시트 종류 1개의 완료 작업들 -> 텔레그램 메시지 목록 (메시지마다 제목 줄 포함)"""
+    label = SHEET_TYPES.get(sheet_type, sheet_type)
+    title = f"📋 *{label} 처리 결과 {len(entries)}건*"
+    blocks = [f"{e['header']}\n\n{e['summary']}" if e['header'] else e['summary'] for e in entries]
+    # 제목 줄 + 쪽 번호 자리를 빼고 나눔
+    bodies = split_blocks(blocks, limit - len(title) - 16)
+    if len(bodies) == 1:
+        return [f"{title}\n\n{bodies[0]}"]
+    return [f"{title} ({i + 1}/{len(bodies)})\n\n{body}" for i, body in enumerate(bodies)]
+
+
+class TelegramDigest:
+    """
+    완료 작업 알림 묶음 (배치별로 모아 시트 종류당 메시지 1개 + 원문 압축 파일 1개로 전송)
+    - 배치: 함께 등록한 작업 묶음. 모든 작업이 끝나면 전송, 작업이 멈추면 window_sec 후 전송
+    - 배치 없는 항목(지연 요약 등): 첫 항목 후 window_sec가 지나면 모아서 전송
+    """
+    def __init__(self, config=None, log_callback=None):
+        self.config = config if config is not None else digest_config()
+        self.log = log_callback if log_callback else print
+        self.window = float(self.config.get('window_sec', TELEGRAM_DIGEST_WINDOW_SEC))
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS digest_batches (
+                    batch_id TEXT PRIMARY KEY,
+                    expected INTEGER NOT NULL,
+                    finished INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS digest_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    batch_id TEXT,
+                    sheet_type TEXT NOT NULL,
+                    header TEXT,
+                    summary TEXT NOT NULL,
+                    text_path TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def _files_dir(self):
+        path = os.path.join(state_db.get_state_dir(), DIGEST_FILES_DIR)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def open_batch(self, expected):
+        batch_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO digest_batches (batch_id, expected, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (batch_id, int(expected), now, now)
+            )
+        return batch_id
+
+    def add(self, sheet_type, header, summary, text_path=None, batch_id=None):
+        """완료 작업 1건 추가 (원문 파일은 보관 폴더로 복사 - 작업의 임시 파일이 지워져도 전송 가능)"""
+        spool_path = None
+        if text_path and os.path.exists(text_path):
+            spool_path = os.path.join(self._files_dir(), f"{uuid.uuid4().hex[:8]}_{os.path.basename(text_path)}")
+            shutil.copy(text_path, spool_path)
+        with closing(state_db.connect()) as conn, conn:
+            # 배치가 이미 전송된 경우(작업 지연으로 window_sec 초과) 배치 없는 항목으로 추가
+            if batch_id and not conn.execute(
+                "UPDATE digest_batches SET updated_at = ? WHERE batch_id = ?", (time.time(), batch_id)
+            ).rowcount:
+                batch_id = None
+            conn.execute(
+                "INSERT INTO digest_entries (batch_id, sheet_type, header, summary, text_path, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (batch_id, sheet_type, header, summary, spool_path, time.time())
+            )
+        self.start()
+
+    def finish_job(self, batch_id):
+        """배치 작업 1건 종료 (성공/실패 무관) - 마지막 작업이면 바로 전송"""
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "UPDATE digest_batches SET finished = finished + 1, updated_at = ? WHERE batch_id = ?",
+                (time.time(), batch_id)
+            )
+        self.start()
+        self._wakeup.set()
+
+    def pending(self):
+        """대시보드용 배치별 대기 현황 [{'batch_id', 'entries', 'finished', 'expected'}] (배치 없는 항목은 batch_id None)"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT b.batch_id, COUNT(e.id) AS entries, b.finished, b.expected FROM digest_batches b "
+                "LEFT JOIN digest_entries e ON e.batch_id = b.batch_id GROUP BY b.batch_id ORDER BY b.created_at"
+            ).fetchall()
+            loose = conn.execute("SELECT COUNT(*) AS n FROM digest_entries WHERE batch_id IS NULL").fetchone()
+        result = [dict(r) for r in rows]
+        if loose['n']:
+            result.append({'batch_id': None, 'entries': loose['n'], 'finished': None, 'expected': None})
+        return result
+
+    def due(self):
+        """전송할 배치 목록 (배치 없는 항목은 None)"""
+        now = time.time()
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT batch_id FROM digest_batches WHERE finished >= expected OR updated_at <= ? "
+                "ORDER BY created_at",
+                (now - self.window,)
+            ).fetchall()
+            loose = conn.execute(
+                "SELECT MIN(created_at) AS t FROM digest_entries WHERE batch_id IS NULL"
+            ).fetchone()
+        batches = [r['batch_id'] for r in rows]
+        if loose['t'] is not None and loose['t'] <= now - self.window:
+            batches.append(None)
+        return batches
+
+    def flush(self, batch_id=None):
+        """배치(None이면 배치 없는 항목) 전송 -> 전송한 작업 수"""
+        from src.modules.telegram_bot import TelegramBot
+
+        with self._flush_lock:
+            with closing(state_db.connect()) as conn:
+                if batch_id:
+                    rows = conn.execute(
+                        "SELECT * FROM digest_entries WHERE batch_id = ? ORDER BY id", (batch_id,)
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        "SELECT * FROM digest_entries WHERE batch_id IS NULL ORDER BY id"
+                    ).fetchall()
+            entries = [dict(r) for r in rows]
+
+            if entries:
+                bot = TelegramBot()
+                by_type = {}
+                for entry in entries:
+                    by_type.setdefault(entry['sheet_type'], []).append(entry)
+                for sheet_type, items in by_type.items():
+                    for message in build_digest_messages(sheet_type, items):
+                        bot.send_message(message)
+
+                paths = [e['text_path'] for e in entries if e['text_path'] and os.path.exists(e['text_path'])]
+                if len(paths) == 1:
+                    bot.send_document(paths[0])
+                elif paths:
+                    zip_path = self._zip(paths)
+                    bot.send_document(zip_path)
+                    os.remove(zip_path)
+
+            with closing(state_db.connect()) as conn, conn:
+                conn.executemany("DELETE FROM digest_entries WHERE id = ?", [(e['id'],) for e in entries])
+                if batch_id:
+                    conn.execute("DELETE FROM digest_batches WHERE batch_id = ?", (batch_id,))
+            for entry in entries:
+                if entry['text_path'] and os.path.exists(entry['text_path']):
+                    os.remove(entry['text_path'])
+
+        if entries:
+            self.log(f"📨 [텔레그램 묶음] {len(entries)}건 전송 등록 ({', '.join(SHEET_TYPES.get(t, t) for t in by_type)})")
+        return len(entries)
+
+    def _zip(self, paths):
+        zip_path = os.path.join(self._files_dir(), f"원문_{datetime.now().strftime('%y%m%d_%H%M%S')}.zip")
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in paths:
+                # 보관 시 붙인 접두어 제거 (원래 파일명으로 압축)
+                zf.write(path, os.path.basename(path).split("_", 1)[1])
+        return zip_path
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="telegram-digest")
+                self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                for batch_id in self.due():
+                    self.flush(batch_id)
+            except Exception as e:
+                self.log(f"⚠️ 텔레그램 묶음 전송 오류: {e}")
+                self.log(traceback.format_exc())
+            self._wakeup.wait(timeout=TELEGRAM_DIGEST_POLL_SEC)
+            self._wakeup.clear()
+
+
+_digest = None
+_digest_lock = threading.Lock()
+
+
+def get_digest():
+    """프로세스 전역 묶음 전송기 (첫 호출 시 백그라운드 스레드 시작)"""
+    global _digest
+    with _digest_lock:
+        if _digest is None:
+            _digest = TelegramDigest()
+        return _digest.start()
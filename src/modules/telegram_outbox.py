@@ -0,0 +1,350 @@
+import hashlib
+import os
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from contextlib import closing
+
+from src import state_db
+from src.config_loader import settings
+from src.constants import (
+    TELEGRAM_OUTBOX_POLL_SEC, TELEGRAM_GLOBAL_PER_SEC, TELEGRAM_CHAT_PER_MIN,
+    TELEGRAM_RETRY_BASE_SEC, TELEGRAM_RETRY_MAX_SEC, TELEGRAM_MAX_ATTEMPTS, TELEGRAM_OUTBOX_LEASE_SEC
+)
+
+OUTBOX_FILES_DIR = "telegram_outbox"
+
+
+class TelegramSendError(RuntimeError):
+    """텔레그램 전송 실패 (retry_after: 서버가 지정한 대기 시간, permanent: 재시도해도 동일한 실패)"""
+    def __init__(self, message, retry_after=None, permanent=False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.permanent = permanent
+
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class TelegramOutbox:
+    """
+    텔레그램 전송 대기열 (재시작 후에도 유지)
+    - 문서는 등록 시점에 보관 폴더로 복사 (작업의 임시 파일이 지워져도 전송 가능)
+    - 한 번 업로드한 파일은 내용 해시 -> file_id로 기록해 다시 업로드하지 않음
+    - 여러 프로세스(CLI, 대시보드)의 전송기가 같은 DB를 쓰므로 항목은 claim_next로 점유한 뒤 전송
+    """
+    def __init__(self):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS telegram_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    chat_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    text TEXT,
+                    parse_mode TEXT,
+                    file_path TEXT,
+                    file_name TEXT,
+                    file_hash TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    next_attempt_at REAL NOT NULL DEFAULT 0,
+                    owner TEXT,
+                    lease_until REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL
+                )
+            """)
+            # 점유 기록 컬럼이 없던 이전 버전 DB
+            columns = {r['name'] for r in conn.execute("PRAGMA table_info(telegram_outbox)")}
+            if 'owner' not in columns:
+                conn.execute("ALTER TABLE telegram_outbox ADD COLUMN owner TEXT")
+                conn.execute("ALTER TABLE telegram_outbox ADD COLUMN lease_until REAL NOT NULL DEFAULT 0")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS telegram_files (
+                    file_hash TEXT PRIMARY KEY,
+                    file_id TEXT NOT NULL,
+                    file_name TEXT,
+                    uploaded_at REAL NOT NULL
+                )
+            """)
+
+    def _files_dir(self):
+        path = os.path.join(state_db.get_state_dir(), OUTBOX_FILES_DIR)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def enqueue_message(self, chat_id, text, parse_mode="Markdown"):
+        self._insert(chat_id, 'message', text=text, parse_mode=parse_mode)
+
+    def enqueue_document(self, chat_id, file_path):
+        digest = file_hash(file_path)
+        file_name = os.path.basename(file_path)
+        spool_path = None
+        if not self.file_id_for(digest):
+            spool_path = os.path.join(self._files_dir(), f"{digest[:16]}_{file_name}")
+            if not os.path.exists(spool_path):
+                shutil.copy(file_path, spool_path)
+        self._insert(chat_id, 'document', file_path=spool_path, file_name=file_name, file_hash=digest)
+
+    def _insert(self, chat_id, kind, **fields):
+        columns = ['chat_id', 'kind', 'created_at'] + list(fields)
+        values = [str(chat_id), kind, time.time()] + list(fields.values())
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                f"INSERT INTO telegram_outbox ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+
+    def claim_next(self, owner, lease_sec=TELEGRAM_OUTBOX_LEASE_SEC):
+        """
+        재시도 시각이 된 가장 오래된 항목을 점유해서 반환 (없으면 None)
+        채팅방별 순서 유지: 같은 채팅방의 앞선 항목이 재시도 대기/전송 중이면 뒤 항목도 기다림
+        다른 전송기가 점유 중인 항목은 건너뜀 (점유 기간이 지나면 전송 도중 종료된 것으로 보고 다시 점유)
+        """
+        while True:
+            now = time.time()
+            with closing(state_db.connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT * FROM telegram_outbox o WHERE next_attempt_at <= ? "
+                    "AND (owner IS NULL OR lease_until < ?) "
+                    "AND id = (SELECT MIN(id) FROM telegram_outbox WHERE chat_id = o.chat_id) "
+                    "ORDER BY id LIMIT 1",
+                    (now, now)
+                ).fetchone()
+                if not row:
+                    return None
+                claimed = conn.execute(
+                    "UPDATE telegram_outbox SET owner = ?, lease_until = ? "
+                    "WHERE id = ? AND (owner IS NULL OR lease_until < ?)",
+                    (owner, now + lease_sec, row['id'], now)
+                ).rowcount == 1
+            if claimed:
+                return dict(row, owner=owner, lease_until=now + lease_sec)
+            # 조회와 점유 사이에 다른 전송기가 가져감 -> 다음 항목 확인
+
+    def has_due_before(self, timestamp):
+        """timestamp 이전에 보낼 항목이 남아 있는지"""
+        with closing(state_db.connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM telegram_outbox WHERE next_attempt_at <= ? LIMIT 1", (timestamp,)
+            ).fetchone()
+        return row is not None
+
+    def next_wakeup(self):
+        """다음 재시도 시각(다른 전송기가 점유 중이면 점유 만료 시각)까지 남은 시간 (항목이 없으면 None)"""
+        with closing(state_db.connect()) as conn:
+            row = conn.execute("SELECT MIN(MAX(next_attempt_at, lease_until)) AS t FROM telegram_outbox").fetchone()
+        return None if row['t'] is None else max(0.0, row['t'] - time.time())
+
+    def mark_failed(self, item_id, error, retry_after):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "UPDATE telegram_outbox SET attempts = attempts + 1, last_error = ?, next_attempt_at = ?, "
+                "owner = NULL, lease_until = 0 WHERE id = ?",
+                (str(error)[:500], time.time() + retry_after, item_id)
+            )
+
+    def postpone(self, item_id, retry_after):
+        """전송 한도 초과(429): 시도 횟수는 늘리지 않고 지정된 시간만큼 미룸"""
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "UPDATE telegram_outbox SET last_error = ?, next_attempt_at = ?, owner = NULL, lease_until = 0 "
+                "WHERE id = ?",
+                (f"전송 한도 초과 ({retry_after:.0f}초 대기)", time.time() + retry_after, item_id)
+            )
+
+    def delete(self, item):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute("DELETE FROM telegram_outbox WHERE id = ?", (item['id'],))
+            still_used = item.get('file_path') and conn.execute(
+                "SELECT 1 FROM telegram_outbox WHERE file_path = ? LIMIT 1", (item['file_path'],)
+            ).fetchone()
+        # 보관 파일은 같은 파일을 기다리는 항목이 없을 때 정리
+        if item.get('file_path') and not still_used and os.path.exists(item['file_path']):
+            os.remove(item['file_path'])
+
+    def file_id_for(self, digest):
+        with closing(state_db.connect()) as conn:
+            row = conn.execute("SELECT file_id FROM telegram_files WHERE file_hash = ?", (digest,)).fetchone()
+        return row['file_id'] if row else None
+
+    def remember_file(self, digest, file_id, file_name=None):
+        with closing(state_db.connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO telegram_files (file_hash, file_id, file_name, uploaded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (digest, file_id, file_name, time.time())
+            )
+
+    def pending(self):
+        """대시보드용 대기 목록"""
+        with closing(state_db.connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, kind, file_name, substr(text, 1, 40) AS preview, attempts, last_error, "
+                "next_attempt_at, created_at FROM telegram_outbox ORDER BY id"
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+
+class RateLimiter:
+    """
+    텔레그램 전송 간격 제한
+    - 전체: 초당 global_per_sec건
+    - 채팅방별: 분당 per_chat_per_min건 (그룹/채널 한도 20건/분)
+    """
+    def __init__(self, global_per_sec=TELEGRAM_GLOBAL_PER_SEC, per_chat_per_min=TELEGRAM_CHAT_PER_MIN):
+        self.global_interval = 1.0 / max(0.01, float(global_per_sec))
+        self.chat_interval = 60.0 / max(0.01, float(per_chat_per_min))
+        self._last_global = 0.0
+        self._last_chat = {}
+
+    def wait_time(self, chat_id):
+        now = time.monotonic()
+        return max(
+            0.0,
+            self._last_global + self.global_interval - now,
+            self._last_chat.get(chat_id, 0.0) + self.chat_interval - now
+        )
+
+    def record(self, chat_id):
+        now = time.monotonic()
+        self._last_global = now
+        self._last_chat[chat_id] = now
+
+
+class OutboxSender:
+    """
+    전송 대기열을 백그라운드 스레드 1개로 순서대로 보냅니다. (작업 스레드는 텔레그램 응답을 기다리지 않음)
+    - 전송 간격 제한, 429 응답의 retry_after 준수
+    - 네트워크 오류/5xx는 점점 긴 간격으로 재시도, 재시도해도 같은 실패(4xx)는 폐기
+    - 텔레그램 차단(브레이커) 중에는 시도 횟수를 소모하지 않고 복구를 기다림
+    """
+    def __init__(self, config=None, log_callback=None):
+        self.config = config if config is not None else (settings.config.get('telegram', {}) or {}).get('outbox', {}) or {}
+        self.log = log_callback if log_callback else print
+        self.outbox = TelegramOutbox()
+        self.limiter = RateLimiter(
+            self.config.get('global_per_sec', TELEGRAM_GLOBAL_PER_SEC),
+            self.config.get('per_chat_per_min', TELEGRAM_CHAT_PER_MIN)
+        )
+        self.max_attempts = int(self.config.get('max_attempts', TELEGRAM_MAX_ATTEMPTS))
+        # 대기열 항목 점유 기록용 (같은 DB를 쓰는 다른 프로세스의 전송기와 구분)
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="telegram-outbox")
+                self._thread.start()
+        return self
+
+    def notify(self):
+        """새 항목 추가 시 즉시 전송 시도"""
+        self._wakeup.set()
+
+    def flush(self, timeout=60):
+        """timeout 안에 보낼 수 있는 항목을 모두 보낼 때까지 대기 (CLI 종료 전 등) -> 완료 여부"""
+        self.notify()
+        deadline = time.time() + timeout
+        while self.outbox.has_due_before(deadline):
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.5)
+        return True
+
+    def _run(self):
+        from src.modules.telegram_bot import TelegramBot
+        bot = TelegramBot()
+        while True:
+            try:
+                processed = self.process_next(bot)
+            except Exception as e:
+                self.log(f"⚠️ 텔레그램 대기열 처리 오류: {e}")
+                self.log(traceback.format_exc())
+                processed = False
+            if not processed:
+                # 다음 재시도 시각까지 대기 (차단 중이면 1초 간격으로 복구 확인, 다른 프로세스가 추가한 항목도 주기적으로 확인)
+                wait = self.outbox.next_wakeup()
+                self._wakeup.wait(timeout=TELEGRAM_OUTBOX_POLL_SEC if wait is None else min(TELEGRAM_OUTBOX_POLL_SEC, max(1.0, wait)))
+                self._wakeup.clear()
+
+    def process_next(self, bot):
+        """보낼 항목 1건 처리 -> 처리 시도 여부 반환"""
+        if not bot.breaker.allow():
+            return False
+
+        item = self.outbox.claim_next(self.owner)
+        if not item:
+            return False
+
+        wait = self.limiter.wait_time(item['chat_id'])
+        if wait > 0:
+            time.sleep(wait)
+        self.limiter.record(item['chat_id'])
+
+        try:
+            if item['kind'] == 'document':
+                self._send_document(bot, item)
+            else:
+                bot.deliver_message(item['chat_id'], item['text'], item['parse_mode'])
+        except TelegramSendError as e:
+            self._handle_failure(item, e)
+            return True
+        except Exception as e:
+            self._handle_failure(item, TelegramSendError(f"{type(e).__name__}: {e}"))
+            return True
+
+        self.outbox.delete(item)
+        return True
+
+    def _send_document(self, bot, item):
+        file_id = self.outbox.file_id_for(item['file_hash']) if item['file_hash'] else None
+        if file_id:
+            bot.deliver_document(item['chat_id'], file_id=file_id, file_name=item['file_name'])
+            return
+        if not item['file_path'] or not os.path.exists(item['file_path']):
+            raise TelegramSendError(f"파일 없음: {item['file_name']}", permanent=True)
+        file_id = bot.deliver_document(item['chat_id'], file_path=item['file_path'], file_name=item['file_name'])
+        if file_id and item['file_hash']:
+            self.outbox.remember_file(item['file_hash'], file_id, item['file_name'])
+
+    def _handle_failure(self, item, error):
+        label = item['file_name'] or (item['text'] or '')[:20]
+        if error.retry_after is not None:
+            self.log(f"     ⏳ 텔레그램 전송 한도 초과 - {error.retry_after:.0f}초 후 재전송: {label}")
+            self.outbox.postpone(item['id'], error.retry_after)
+            return
+        if error.permanent or item['attempts'] + 1 >= self.max_attempts:
+            self.log(f"     ❌ 텔레그램 전송 포기 ({item['attempts'] + 1}회 시도): {label} - {error}")
+            self.outbox.delete(item)
+            return
+        retry_after = min(TELEGRAM_RETRY_MAX_SEC, TELEGRAM_RETRY_BASE_SEC * (2 ** item['attempts']))
+        self.log(f"     ⚠️ 텔레그램 전송 실패, {retry_after:.0f}초 후 재시도: {label} - {error}")
+        self.outbox.mark_failed(item['id'], error, retry_after)
+
+
+_sender = None
+_sender_lock = threading.Lock()
+
+
+def outbox_enabled():
+    outbox_config = ((settings.config.get('telegram', {}) or {}).get('outbox', {}) or {}) if settings else {}
+    return bool(outbox_config.get('enabled', True))
+
+
+def get_outbox_sender():
+    """프로세스 전역 전송기 (첫 호출 시 백그라운드 스레드 시작)"""
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = OutboxSender()
+        return _sender.start()
@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, ExitStack
+
+from src.config_loader import settings
+from src.constants import RESOURCE_POOL_LIMITS, RESOURCE_UTILIZATION_WINDOW
+
+
+class ResourcePool:
+    """
+    이름 있는 동시 사용 제한 (ffmpeg 인코딩, STT 업로드, GPU 요청, NAS 복사 등)
+    여러 작업/단계가 같은 자원을 동시에 과하게 쓰지 않도록 capacity개까지만 허용합니다.
+    """
+    def __init__(self, name, capacity):
+        self.name = name
+        self.capacity = max(1, int(capacity))
+        self._cond = threading.Condition()
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.created_at = time.monotonic()
+        self._holding = {} # 사용 중인 슬롯 -> 확보 시각
+        self._released = deque() # 최근 사용 구간 (시작, 끝) - 사용률 계산용
+
+    @contextmanager
+    def hold(self):
+        started = time.monotonic()
+        with self._cond:
+            self.waiting += 1
+            while self.in_use >= self.capacity:
+                self._cond.wait()
+            self.waiting -= 1
+            self.in_use += 1
+            waited = time.monotonic() - started
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            token = object()
+            self._holding[token] = time.monotonic()
+        try:
+            yield waited
+        finally:
+            with self._cond:
+                self.in_use -= 1
+                self._released.append((self._holding.pop(token), time.monotonic()))
+                self._cond.notify()
+
+    def _utilization(self, now):
+        """최근 RESOURCE_UTILIZATION_WINDOW초 동안 슬롯 사용 비율"""
+        window_start = max(self.created_at, now - RESOURCE_UTILIZATION_WINDOW)
+        while self._released and self._released[0][1] < window_start:
+            self._released.popleft()
+        busy = sum(end - max(start, window_start) for start, end in self._released)
+        busy += sum(now - max(start, window_start) for start in self._holding.values())
+        return min(1.0, busy / (max(1e-6, now - window_start) * self.capacity))
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                'name': self.name,
+                'capacity': self.capacity,
+                'in_use': self.in_use,
+                'waiting': self.waiting,
+                'acquired': self.acquired,
+                'avg_wait': self.total_wait / self.acquired if self.acquired else 0.0,
+                'max_wait': self.max_wait,
+                'utilization': self._utilization(time.monotonic())
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _limits():
+    limits = dict(RESOURCE_POOL_LIMITS)
+    if settings:
+        limits.update(((settings.config.get('job_manager', {}) or {}).get('resources', {}) or {}))
+    return limits
+
+
+def get_resource_pool(name):
+    """자원 이름별 프로세스 전역 풀 (설정에 없는 이름은 1개로 제한)"""
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = ResourcePool(name, _limits().get(name, 1))
+        return _pools[name]
+
+
+@contextmanager
+def hold_resources(names):
+    """
+    여러 자원을 함께 확보 (교착 방지를 위해 항상 이름 순서대로 확보)
+    Yields: 자원 확보까지 기다린 시간 (초)
+    """
+    started = time.monotonic()
+    with ExitStack() as stack:
+        for name in sorted(set(names or ())):
+            stack.enter_context(get_resource_pool(name).hold())
+        yield time.monotonic() - started
+
+
+def all_resource_pools():
+    """대시보드용 자원별 사용 현황 (설정된 자원은 사용 전에도 표시)"""
+    for name in _limits():
+        get_resource_pool(name)
+    with _pools_lock:
+        pools = sorted(_pools.values(), key=lambda p: p.name)
+    return [p.snapshot() for p in pools]
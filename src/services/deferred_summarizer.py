@@ -0,0 +1,115 @@
+import os
+import threading
+import traceback
+
+from src.constants import SUMMARY_RETRY_BASE_SEC, SUMMARY_RETRY_MAX_SEC, SUMMARY_QUEUE_POLL_SEC
+from src.modules import api_client, telegram_bot
+from src.modules.summary_queue import SummaryQueue
+
+# 요약을 나중에 채우는 작업의 텍스트 파일/시트 자리표시
+PENDING_SUMMARY_TEXT = "(AI 요약 대기 중 - 요약이 완료되면 시트와 텔레그램으로 전달됩니다)"
+STATUS_SUMMARY_PENDING = "요약 대기"
+
+
+class DeferredSummarizer:
+    """
+    요약 대기열(SummaryQueue)을 백그라운드에서 처리합니다.
+    GPU 서버가 사용 가능할 때 요약 -> 아카이브 텍스트 갱신 -> 시트 요약/상태 갱신 -> 텔레그램 전송.
+    실패 시 점점 긴 간격으로 재시도합니다.
+    """
+    def __init__(self, log_callback=None):
+        self.log = log_callback if log_callback else print
+        self.queue = SummaryQueue()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._gsheet = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="deferred-summarizer")
+                self._thread.start()
+        return self
+
+    def notify(self):
+        """새 항목 추가 시 즉시 처리 시도"""
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            try:
+                processed = self.process_next()
+            except Exception as e:
+                self.log(f"⚠️ 요약 대기열 처리 오류: {e}")
+                processed = False
+            if not processed:
+                self._wakeup.wait(timeout=SUMMARY_QUEUE_POLL_SEC)
+                self._wakeup.clear()
+
+    def _get_gsheet(self):
+        if self._gsheet is None:
+            from src.modules.gsheet import GSheetManager
+            self._gsheet = GSheetManager()
+        return self._gsheet
+
+    def process_next(self):
+        """재시도 시각이 된 항목 1건 처리 -> 처리 시도 여부 반환"""
+        llm = api_client.APIClient()
+        if not llm.is_available():
+            return False # 차단 중: 헬스 체크로 복구될 때까지 대기
+
+        item = self.queue.next_due()
+        if not item:
+            return False
+
+        self.log(f"🧠 [요약 대기열] {item['filename']} 요약 시작 (시도 {item['attempts'] + 1}회차)")
+        try:
+            summary = llm.analyze_text(
+                item['llm_text'], prompt_type=item['sheet_type'], segments=item['segments'] or None,
+                broadcast_date=item['broadcast_date'], label=item['filename']
+            )
+        except Exception as e:
+            summary = f"[에러] {e}"
+            self.log(traceback.format_exc())
+
+        if llm.is_error_result(summary):
+            retry_after = min(SUMMARY_RETRY_MAX_SEC, SUMMARY_RETRY_BASE_SEC * (2 ** item['attempts']))
+            self.queue.mark_failed(item['id'], summary, retry_after)
+            self.log(f"   ⚠️ 요약 실패, {int(retry_after)}초 후 재시도: {summary}")
+            return True
+
+        self._deliver(item, summary)
+        self.queue.delete(item['id'])
+        self.log(f"✅ [요약 대기열] {item['filename']} 요약 전달 완료")
+        return True
+
+    def _deliver(self, item, summary):
+        # 1. 아카이브된 텍스트 파일의 자리표시를 요약으로 교체
+        text_path = item.get('text_path')
+        if text_path and os.path.exists(text_path):
+            with open(text_path, "r", encoding="utf-8") as f:
+                content = f.read()
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(content.replace(PENDING_SUMMARY_TEXT, summary, 1))
+
+        # 2. 시트 요약 + 상태 갱신
+        gsheet = self._get_gsheet()
+        gsheet.update_summary(item['sheet_type'], item['row_idx'], summary)
+        gsheet.update_status(item['sheet_type'], item['row_idx'], "완료")
+
+        # 3. 텔레그램 전송 (묶음 전송 사용 시 배치 없는 항목으로 모아서 전송)
+        telegram_bot.TelegramBot().send_job_result(item['sheet_type'], item.get('header'), summary, text_path)
+
+
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+
+def get_deferred_summarizer():
+    """프로세스 전역 요약기 (첫 호출 시 백그라운드 스레드 시작)"""
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is None:
+            _summarizer = DeferredSummarizer()
+        return _summarizer.start()
@@ -6,21 +6,58 @@ from datetime import datetime
 from src.config_loader import settings
 from src.modules import media, stt_module, api_client, nas_manager, telegram_bot
 from src.modules.gsheet import GSheetManager
+from src.modules.circuit_breaker import CircuitOpenError
+from src.modules.job_checkpoints import JobCheckpoints
+from src.modules.result_cache import file_sha256, text_sha256
+from src.modules.summary_queue import SummaryQueue
+from src.modules.telegram_digest import get_digest
+from src.resource_pool import get_resource_pool
+from src.services.deferred_summarizer import PENDING_SUMMARY_TEXT, STATUS_SUMMARY_PENDING, get_deferred_summarizer
 import traceback
 import time
 
 class JobProcessor:
-    def __init__(self, log_callback=None, status_callback=None):
+    # 작업 1건의 처리 단계 (JobManager 파이프라인에서는 단계별 작업자가 나눠서 실행)
+    STAGES = ('media', 'stt', 'llm', 'thumbnail', 'archive', 'sheet')
+    # 단계별로 확보할 자원 (resource_pool, 스트리밍 STT는 실행 중 ffmpeg 추가 확보)
+    STAGE_RESOURCES = {
+        'media': ('ffmpeg',),
+        'stt': ('stt',),
+        'llm': ('llm',),
+        'thumbnail': ('ffmpeg',),
+        'archive': ('nas_io',)
+    }
+    # 단계 완료 시 저장하는 결과 (다시 처리할 때 완료된 단계는 이 값으로 복원하고 건너뜀)
+    CHECKPOINT_KEYS = {
+        'media': ('row_idx', 'sheet_type', 'raw_date', 'yymmdd', 'name', 'region', 'new_filename',
+                  'file_to_process', 'stt_context', 'audio_path'),
+        'stt': ('audio_path', 'audio_hash', 'transcript_key', 'transcript'),
+        'llm': ('llm_text', 'llm_segments', 'summary_text', 'defer_reason', 'txt_filename', 'txt_path',
+                'srt_path', 'header', 'notified'),
+        'thumbnail': ('final_thumb_path',),
+        'archive': ('dest_folder', 'video_dest_path')
+    }
+    # 이후 단계가 다시 쓰는 임시 파일 (없어졌으면 해당 단계부터 다시 실행, 아카이브 완료 후에는 확인 안 함)
+    CHECKPOINT_FILES = {
+        'media': ('audio_path',),
+        'stt': ('audio_path',),
+        'llm': ('txt_path', 'srt_path'),
+        'thumbnail': ('final_thumb_path',)
+    }
+
+    def __init__(self, log_callback=None, status_callback=None, progress_callback=None):
         """
         :param log_callback: Function to call for logging (e.g., st.write or print)
         :param status_callback: Function to call for updating status text
+        :param progress_callback: Function accepting (current, total, label) for stage progress
         """
         self.log_callback = log_callback if log_callback else print
         self.status_callback = status_callback if status_callback else lambda x: None
+        self.progress_callback = progress_callback
         
         # Initialize Modules
         self.gsheet = GSheetManager()
-        self.stt = stt_module.ServerSTT()
+        self.stt = stt_module.STTRouter()
         self.llm = api_client.APIClient()
         self.nas = nas_manager.NASManager()
         self.telegram = telegram_bot.TelegramBot()
@@ -30,11 +67,25 @@ class JobProcessor:
         self.inbox_base = settings.paths['inbox']
         self.subfolders = settings.config['google_sheet'].get('subfolders', {})
         self.speaker_map = settings.config.get('speaker_map', {}) # Refactoring: Read from Config
+        # LLM 장애/지연 시 요약을 대기열로 미루고 아카이브 먼저 진행
+        self.deferred_config = settings.gpu_config.get('deferred_summary', {}) or {}
+        self.defer_enabled = bool(self.deferred_config.get('enabled', False))
+        # 단계별 결과 저장 (실패 후 재처리 시 완료된 단계 건너뜀)
+        checkpoint_config = (settings.config.get('job_manager', {}) or {}).get('checkpoints', {}) or {}
+        self.checkpoints = JobCheckpoints() if checkpoint_config.get('enabled', True) else None
 
     def log(self, message):
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_callback(f"[{timestamp}] {message}")
 
+    def report_progress(self, current, total, label=None):
+        if self.progress_callback:
+            self.progress_callback(current, total, label)
+
+    def _upload_progress(self, sent, total):
+        mb = 1024 * 1024
+        self.report_progress(sent, total, f"STT 업로드 {sent / mb:.1f}/{total / mb:.1f}MB")
+
     def process_jobs(self, jobs, progress_callback=None):
         """
         Process a list of jobs.
@@ -43,6 +94,7 @@ class JobProcessor:
         """
         self.log("작업을 시작합니다... (Service Layer)")
         total = len(jobs)
+        digest_batch = get_digest().open_batch(total) if self.telegram.use_digest else None
         
         for i, job in enumerate(jobs):
             try:
@@ -52,17 +104,175 @@ class JobProcessor:
                 meta = job['data']
                 
                 self.status_callback(f"Processing ({i+1}/{total}): {original_filename}")
-                self.process_single_job(job)
+                self.process_single_job(job, digest_batch=digest_batch)
                 
             except Exception as e:
                 self.log(f"❌ 에러 발생 ({job.get('file_name')}): {e}")
                 self.log(traceback.format_exc()) # 상세 에러 로그 출력
                 self.gsheet.update_status(sheet_type, row_idx, "에러", error_msg=str(e))
+            finally:
+                if digest_batch:
+                    get_digest().finish_job(digest_batch)
                 
             if progress_callback:
                 progress_callback(i + 1, total)
 
-    def process_single_job(self, job):
+    def _check_endpoints(self, context):
+        """
+        STT/LLM 서버가 차단(연속 실패) 상태면 오디오 추출 전에 즉시 실패 처리합니다.
+        (서버 다운 중 작업마다 추출 -> 타임아웃 대기로 워커를 붙잡지 않도록)
+        """
+        if not self.llm.is_available() and not self.defer_enabled:
+            raise CircuitOpenError("GPU(LLM)", self.llm.pool.last_error)
+        if not self.stt.engine_order(context):
+            raise CircuitOpenError("STT", self.stt.server.pool.last_error)
+
+    def _defer_reason(self):
+        """요약을 지금 하지 않고 대기열로 미룰 이유 (없으면 None)"""
+        if not self.defer_enabled:
+            return None
+        if not self.llm.is_available():
+            return "GPU 서버 차단 중"
+        max_waiting = int(self.deferred_config.get('max_waiting', 0) or 0)
+        waiting = len(self.llm.scheduler.snapshot()['waiting'])
+        if max_waiting and waiting >= max_waiting:
+            return f"GPU 대기열 {waiting}건"
+        return None
+
+    def _extract_audio(self, video_path, context):
+        """
+        오디오 추출 (미디어 단계).
+        stream_from_ffmpeg 대상이면 추출은 STT 단계에서 업로드와 함께 진행하므로 건너뜁니다.
+        Returns: (audio_path 또는 None, 캐시된 STT 결과 또는 None)
+        """
+        context['duration'] = self.mp._get_duration(video_path)
+
+        if self.stt.should_stream(context['duration'], context):
+            cached = self.stt.get_cached(self.stt.source_cache_key(video_path))
+            if cached:
+                # 이전 시도에서 변환된 결과 재사용 (아카이브용 오디오만 추출)
+                self.log("   ♻️ STT 캐시 사용 (서버 전송 생략)")
+                return self.mp.extract_audio(video_path), cached
+            return None, None
+
+        self.log("   🔊 오디오 추출 중...")
+        return self.mp.extract_audio(video_path), None
+
+    def _transcribe(self, video_path, audio_path, context):
+        """
+        STT (STT 단계).
+        audio_path가 없으면 ffmpeg 출력을 임시 파일 없이 바로 업로드하고
+        (아카이브용 mp3는 tee로 동시에 기록), 실패하면 기존 파일 기반 방식으로 재시도합니다.
+        Returns: (audio_path, stt_result)
+        """
+        if audio_path is None:
+            base_name = os.path.splitext(os.path.basename(video_path))[0]
+            audio_path = os.path.join(settings.paths['temp'], f"{base_name}.mp3")
+            self.log("   🔊 오디오 추출 + STT 스트리밍 전송 중...")
+            with get_resource_pool('ffmpeg').hold():
+                stt_result = self.stt.transcribe_stream(
+                    self.mp.iter_audio(video_path, tee_path=audio_path),
+                    filename=os.path.basename(audio_path),
+                    progress_callback=self._upload_progress,
+                    source_key=self.stt.source_cache_key(video_path),
+                    context=context
+                )
+                if isinstance(stt_result, dict) and os.path.exists(audio_path):
+                    return audio_path, stt_result
+                self.log(f"   ⚠️ 스트리밍 전송 실패, 파일 방식으로 재시도: {str(stt_result)[:80]}")
+                self.log("   🔊 오디오 추출 중...")
+                audio_path = self.mp.extract_audio(video_path)
+
+        stt_result = self.stt.transcribe(audio_path, progress_callback=self._upload_progress, context=context)
+        return audio_path, stt_result
+
+    def new_context(self, job, digest_batch=None):
+        """
+        단계 사이에 넘겨지는 작업 1건의 상태
+        이전 시도의 단계별 결과가 있으면 복원 (ctx['done']: 건너뛸 단계)
+        """
+        ctx = {'job': job, 'digest_batch': digest_batch, 'stt_result': None, 'done': []}
+        if self.checkpoints:
+            ctx['checkpoint_key'] = self.checkpoint_key(job)
+            self._restore(ctx)
+        return ctx
+
+    @staticmethod
+    def checkpoint_key(job):
+        """시트 행 + 파일명 + 파일명 결정에 쓰는 값 (시트 내용을 고치면 처음부터 다시 처리)"""
+        meta = job.get('data', {}) or {}
+        fields = [str(meta.get(k, '')) for k in ('방송 일자', '국가', '이름(한글)', '지역')]
+        return f"{job['type']}:{job['index']}:{job['file_name']}:{text_sha256('|'.join(fields))[:12]}"
+
+    def _restore(self, ctx):
+        saved = self.checkpoints.load(ctx['checkpoint_key'])
+        archived = 'archive' in saved
+        for stage in self.STAGES:
+            data = saved.get(stage)
+            if data is not None and not archived:
+                data = self._verify_checkpoint(stage, data)
+            if data is None:
+                # 다시 실행하는 단계에서도 이미 보낸 텔레그램 알림은 다시 보내지 않음
+                ctx['notified'] = any(d.get('notified') for d in saved.values())
+                break
+            ctx.update(data)
+            ctx['done'].append(stage)
+        if ctx['done']:
+            remaining = [s for s in self.STAGES if s not in ctx['done']]
+            self.log(f"   ♻️ 이전 시도 이어서 진행 ({', '.join(ctx['done'])} 완료 -> {remaining[0] if remaining else '없음'}부터)")
+
+    def _verify_checkpoint(self, stage, data):
+        """저장된 단계 결과를 그대로 쓸 수 있는지 확인 -> 복원할 값 (다시 실행해야 하면 None)"""
+        for key in self.CHECKPOINT_FILES.get(stage, ()):
+            if data.get(key) and not os.path.exists(data[key]):
+                return None
+        if stage == 'media' and not os.path.exists(data['file_to_process']):
+            # 이전 시도의 아카이브 단계에서 영상만 먼저 이동된 경우
+            video_dest_path = self._archive_paths(data['yymmdd'], data['new_filename'])[1]
+            if not os.path.exists(video_dest_path):
+                return None
+            data = dict(data, file_to_process=video_dest_path)
+        if stage == 'stt':
+            if data.get('audio_hash') and file_sha256(data['audio_path']) != data['audio_hash']:
+                return None
+            stt_result = data.get('transcript')
+            if data.get('transcript_key'):
+                stt_result = self.stt.get_cached(data['transcript_key'])
+                if stt_result is None:
+                    return None
+            data = dict(data, stt_result=stt_result)
+        return data
+
+    def run_stage(self, stage, ctx):
+        """
+        단계 1개 실행 -> 다음 단계 진행 여부 (False = 작업 종료)
+        완료 시 결과를 저장하고, 마지막 단계까지 끝나거나 작업이 종료되면 저장된 결과를 삭제
+        """
+        if stage in ctx['done']:
+            return True
+        proceed = getattr(self, f"_stage_{stage}")(ctx) is not False
+        ctx['done'].append(stage)
+        if self.checkpoints:
+            if proceed and stage != self.STAGES[-1]:
+                data = {k: ctx.get(k) for k in self.CHECKPOINT_KEYS.get(stage, ())}
+                self.checkpoints.save(ctx['checkpoint_key'], stage, data)
+            else:
+                self.checkpoints.clear(ctx['checkpoint_key'])
+        return proceed
+
+    def process_single_job(self, job, digest_batch=None):
+        """
+        작업 1건을 모든 단계(STAGES) 순서대로 실행합니다. (이전 시도에서 완료된 단계는 건너뜀)
+        :param digest_batch: 텔레그램 묶음 전송 배치 ID (함께 등록한 작업들의 알림을 모아서 전송)
+        """
+        ctx = self.new_context(job, digest_batch)
+        for stage in self.STAGES:
+            if not self.run_stage(stage, ctx):
+                return None
+        return ctx.get('result')
+
+    def _stage_media(self, ctx):
+        job = ctx['job']
         row_idx = job['index']
         original_filename = job['file_name']
         sheet_type = job['type']
@@ -75,7 +285,7 @@ class JobProcessor:
         
         if not os.path.exists(inbox_dir):
             self.log(f"❌ 폴더 없음: {inbox_dir}")
-            return
+            return False
             
         # 2. Filename Logic (Date Standardizing)
         raw_date = str(meta.get('방송 일자', ''))
@@ -107,29 +317,58 @@ class JobProcessor:
         
         # Handling existing/renamed files
         file_to_process = inbox_path
+        video_dest_path = self._archive_paths(yymmdd, new_filename)[1]
         
         if not os.path.exists(inbox_path):
             if os.path.exists(renamed_inbox_path):
                 self.log(f"   ℹ️ 이미 변경된 파일 발견: {new_filename}")
                 file_to_process = renamed_inbox_path
+            elif os.path.exists(video_dest_path):
+                # 이전 시도의 아카이브 단계에서 영상만 먼저 이동된 경우
+                self.log(f"   ℹ️ 이미 아카이브된 영상 사용: {new_filename}")
+                file_to_process = video_dest_path
             else:
                 self.log(f"❌ 파일 없음: {original_filename}")
                 self.gsheet.update_status(sheet_type, row_idx, "에러", error_msg="File Not Found")
-                return
+                return False
         else:
             # Rename if needed
             if inbox_path != renamed_inbox_path:
                 os.rename(inbox_path, renamed_inbox_path)
                 self.log(f"   파일명 변경: {new_filename}")
                 file_to_process = renamed_inbox_path
+
+        ctx.update(
+            row_idx=row_idx, sheet_type=sheet_type, raw_date=raw_date, yymmdd=yymmdd,
+            name=name, region=region, new_filename=new_filename, file_to_process=file_to_process
+        )
                 
-        # 3. Audio Extraction
-        self.log("   🔊 오디오 추출 중...")
-        audio_path = self.mp.extract_audio(file_to_process)
-        
-        # 4. STT & Summary
-        self.log("   🧠 AI 분석 중...")
-        stt_result = self.stt.transcribe(audio_path)
+        # 3. Audio Extraction (스트리밍 전송 대상은 STT 단계에서 추출과 전송을 함께 진행)
+        ctx['stt_context'] = {'sheet_type': sheet_type, 'row_idx': row_idx, 'file': new_filename}
+        self._check_endpoints(ctx['stt_context'])
+        ctx['audio_path'], ctx['stt_result'] = self._extract_audio(file_to_process, ctx['stt_context'])
+
+    def _stage_stt(self, ctx):
+        # 4. STT
+        if ctx['stt_result'] is None:
+            ctx['audio_path'], ctx['stt_result'] = self._transcribe(
+                ctx['file_to_process'], ctx['audio_path'], ctx['stt_context']
+            )
+
+        # 재처리용 기록: 오디오 해시 + 변환 결과 캐시 키 (캐시 미사용/실패 결과는 결과 그대로 저장)
+        audio_path, stt_result = ctx['audio_path'], ctx['stt_result']
+        ctx['audio_hash'] = file_sha256(audio_path) if audio_path and os.path.exists(audio_path) else None
+        ctx['transcript_key'] = None
+        if self.stt.cache and ctx['audio_hash'] and isinstance(stt_result, dict):
+            ctx['transcript_key'] = self.stt.cache.make_key(ctx['audio_hash'], self.stt.cache_fingerprint())
+            self.stt.cache.put_transcript(ctx['transcript_key'], stt_result)
+        ctx['transcript'] = None if ctx['transcript_key'] else stt_result
+
+    def _stage_llm(self, ctx):
+        stt_result = ctx['stt_result']
+        sheet_type = ctx['sheet_type']
+        new_filename = ctx['new_filename']
+        yymmdd = ctx['yymmdd']
         
         full_text = ""
         segments = []
@@ -142,7 +381,23 @@ class JobProcessor:
             full_text = str(stt_result)
             self.log(f"⚠️ STT 결과 형식이 예외적임: {str(stt_result)[:50]}...")
 
-        summary_text = self.llm.analyze_text(full_text, prompt_type=sheet_type)
+        llm_text, llm_segments, compact_msg = self.llm.compact_input(full_text, segments)
+        if compact_msg:
+            self.log(f"   🧹 {compact_msg}")
+
+        defer_reason = self._defer_reason()
+        if not defer_reason:
+            self.log("   🧠 AI 분석 중...")
+            summary_text = self.llm.analyze_text(
+                llm_text, prompt_type=sheet_type, progress_callback=self.report_progress, segments=llm_segments,
+                broadcast_date=ctx['raw_date'], label=new_filename
+            )
+            if self.defer_enabled and self.llm.is_error_result(summary_text):
+                defer_reason = summary_text
+        if defer_reason:
+            # 요약은 백그라운드 요약기가 나중에 채움 (시트/텔레그램도 그때 전달)
+            self.log(f"   ⏸ AI 요약 보류 ({defer_reason}) -> 보관 먼저 진행")
+            summary_text = PENDING_SUMMARY_TEXT
         
         # 5. Prepare Text Content & Save Temp File
         txt_filename = os.path.splitext(new_filename)[0] + ".txt"
@@ -190,8 +445,8 @@ class JobProcessor:
             # Escape: _ * [ ] `
             return str(text).replace('_', r'\_').replace('*', r'\*').replace('[', r'\[').replace(']', r'\]').replace('`', r'\`')
             
-        safe_region = escape_md_field(region)
-        safe_name = escape_md_field(name)
+        safe_region = escape_md_field(ctx['region'])
+        safe_name = escape_md_field(ctx['name'])
         
         # [수정] Summary는 LLM이 이미 Markdown 문법(*, - 등)을 사용해서 생성했으므로, 
         # 이를 이스케이프하면 포맷팅이 깨집니다. 따라서 Summary는 원본 그대로 보냅니다.
@@ -206,10 +461,18 @@ class JobProcessor:
         else:
             header = f"📢 *[{yymmdd} {safe_region} - {safe_name}]*"
             
-        msg = f"{header}\n\n{summary_text}"
-        self.telegram.send_message(msg)
-        self.telegram.send_document(txt_path)
-        
+        if not defer_reason and not ctx.get('notified'):
+            self.telegram.send_job_result(sheet_type, header, summary_text, txt_path, batch_id=ctx['digest_batch'])
+            ctx['notified'] = True
+
+        ctx.update(
+            llm_text=llm_text, llm_segments=llm_segments, summary_text=summary_text, defer_reason=defer_reason,
+            txt_filename=txt_filename, txt_path=txt_path, srt_path=srt_path, header=header
+        )
+
+    def _stage_thumbnail(self, ctx):
+        file_to_process = ctx['file_to_process']
+
         # 7. Thumbnail
         self.log("   and 🖼 썸네일 가공 중 (자막 제거 + 4:3 크롭)...")
         
@@ -224,27 +487,41 @@ class JobProcessor:
         
         final_thumb_path = None
         if thumb_source:
-            thumb_name = os.path.splitext(new_filename)[0] + ".jpg"
+            thumb_name = os.path.splitext(ctx['new_filename'])[0] + ".jpg"
             final_thumb_path = os.path.join(settings.paths['temp'], thumb_name)
             
             shutil.copy(thumb_source, final_thumb_path)
             self.log(f"   ✨ 썸네일 준비 완료: {thumb_name}")
+        ctx['final_thumb_path'] = final_thumb_path
+
+    def _archive_paths(self, yymmdd, new_filename):
+        """아카이브 폴더 (YYYY/MM), 영상 저장 경로"""
+        dest_folder = os.path.join(settings.paths['archive'], f"20{yymmdd[:2]}", yymmdd[2:4])
+        return dest_folder, os.path.join(dest_folder, new_filename)
+
+    def _stage_archive(self, ctx):
+        yymmdd = ctx['yymmdd']
+        new_filename = ctx['new_filename']
+        file_to_process = ctx['file_to_process']
+        txt_filename, txt_path = ctx['txt_filename'], ctx['txt_path']
+        audio_path, srt_path = ctx['audio_path'], ctx['srt_path']
+        final_thumb_path = ctx['final_thumb_path']
 
         # 8. Archive (NAS)
         self.log("   💾 아카이브 저장 중...")
         time.sleep(1.0) # 파일 잠금 해제 대기 (안전장치)
         
-        dest_folder = os.path.join(settings.paths['archive'], f"20{yymmdd[:2]}", yymmdd[2:4]) # YYYY/MM
+        dest_folder, video_dest_path = self._archive_paths(yymmdd, new_filename)
         if not os.path.exists(dest_folder):
             os.makedirs(dest_folder, exist_ok=True)
         
         # Save Text (Copy from Temp)
         shutil.copy(txt_path, os.path.join(dest_folder, txt_filename))
         
-        # Save Video (Move to Archive)
-        video_dest_path = os.path.join(dest_folder, new_filename)
-        shutil.move(file_to_process, video_dest_path)
-        self.log(f"   🚚 영상 이동 완료: Inbox -> Archive ({new_filename})")
+        # Save Video (Move to Archive) - 이전 시도에서 이미 이동했으면 생략
+        if os.path.abspath(file_to_process) != os.path.abspath(video_dest_path):
+            shutil.move(file_to_process, video_dest_path)
+            self.log(f"   🚚 영상 이동 완료: Inbox -> Archive ({new_filename})")
 
         # Save Audio (Move/Copy .mp3)
         if audio_path and os.path.exists(audio_path):
@@ -280,24 +557,70 @@ class JobProcessor:
                 
         except Exception as e:
             self.log(f"⚠️ 임시 파일 삭제 중 오류 (무시): {e}")
-        
+
+        ctx.update(dest_folder=dest_folder, video_dest_path=video_dest_path)
+
+    def _stage_sheet(self, ctx):
+        sheet_type, row_idx = ctx['sheet_type'], ctx['row_idx']
+        new_filename = ctx['new_filename']
+        dest_folder, txt_filename = ctx['dest_folder'], ctx['txt_filename']
+
         # 9. Update Sheet
-        self.gsheet.update_status(
-            sheet_type,
-            row_idx,
-            "완료",
-            new_filename=new_filename,
-            summary_text=summary_text
-        )
+        if ctx['defer_reason']:
+            self.gsheet.update_status(sheet_type, row_idx, STATUS_SUMMARY_PENDING, new_filename=new_filename)
+            SummaryQueue().enqueue(
+                sheet_type, row_idx, new_filename, ctx['llm_text'], segments=ctx['llm_segments'],
+                broadcast_date=ctx['raw_date'], header=ctx['header'], text_path=os.path.join(dest_folder, txt_filename)
+            )
+            get_deferred_summarizer().notify()
+            self.log("   📥 요약 대기열 등록 완료 (GPU 서버 사용 가능 시 자동 요약)")
+        else:
+            self.gsheet.update_status(
+                sheet_type,
+                row_idx,
+                "완료",
+                new_filename=new_filename,
+                summary_text=ctx['summary_text']
+            )
 
-        self.log(f"✅ {name} 처리 완료!")
+        self.log(f"✅ {ctx['name']} 처리 완료!")
 
         # 10. Return result with file paths for download
-        result_files = {
-            'video': video_dest_path,
+        ctx['result'] = {
+            'video': ctx['video_dest_path'],
             'audio': os.path.join(dest_folder, os.path.splitext(new_filename)[0] + ".mp3"),
             'thumbnail': os.path.join(dest_folder, os.path.splitext(new_filename)[0] + ".jpg"),
             'text': os.path.join(dest_folder, txt_filename),
-            'srt': os.path.join(dest_folder, os.path.splitext(new_filename)[0] + ".srt") if srt_path else None
+            'srt': os.path.join(dest_folder, os.path.splitext(new_filename)[0] + ".srt") if ctx['srt_path'] else None
         }
-        return result_files
+
+
+class StagedJob:
+    """
+    JobManager 파이프라인용 작업 1건 (단계별 실행기)
+    단계마다 다른 작업자 스레드에서 호출되지만 한 작업의 단계는 항상 순서대로 하나씩 실행됩니다.
+    """
+    stages = JobProcessor.STAGES
+    resources = JobProcessor.STAGE_RESOURCES
+
+    def __init__(self, job, digest_batch=None, log_callback=None, status_callback=None, progress_callback=None):
+        self.processor = JobProcessor(
+            log_callback=log_callback,
+            status_callback=status_callback,
+            progress_callback=progress_callback
+        )
+        self.ctx = self.processor.new_context(job, digest_batch)
+        self.digest_batch = digest_batch
+
+    def run_stage(self, stage):
+        """단계 실행 -> 다음 단계 진행 여부"""
+        return self.processor.run_stage(stage, self.ctx)
+
+    @property
+    def result(self):
+        return self.ctx.get('result')
+
+    def finish(self, error=None):
+        """작업 종료 (성공/실패 무관) - 묶음 전송 배치에 종료 기록"""
+        if self.digest_batch:
+            get_digest().finish_job(self.digest_batch)
@@ -0,0 +1,26 @@
+import os
+import sqlite3
+
+from src.config_loader import settings
+
+# 재시작 후에도 유지되어야 하는 상태(STT Job ID 등)를 저장하는 로컬 SQLite DB
+STATE_DB_NAME = "mnap_state.db"
+
+
+def get_state_dir():
+    state_dir = settings.paths.get('state', './data/state') if settings else './data/state'
+    os.makedirs(state_dir, exist_ok=True)
+    return state_dir
+
+
+def connect(db_name=STATE_DB_NAME):
+    """
+    WAL 모드 SQLite 연결을 반환합니다.
+    연결은 스레드 간에 공유하지 말고, 사용하는 곳에서 열고 닫으세요.
+    """
+    path = os.path.join(get_state_dir(), db_name)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
@@ -0,0 +1,124 @@
+"""
+스트리밍 multipart/form-data 업로드 유틸리티
+- 파일 전체를 메모리에 올리지 않고 chunk 단위로 전송 (메모리 사용량 일정)
+- 전송한 바이트 수를 콜백으로 보고 (업로드 진행률 표시용)
+"""
+import os
+import uuid
+from typing import Callable, Iterator, Optional
+
+
+class MultipartFileStream:
+    """
+    requests의 data= 인자로 넘기는 반복 가능한(iterable) 업로드 바디
+
+    Usage:
+        stream = MultipartFileStream('file', audio_path, chunk_size=256 * 1024)
+        requests.post(url, data=stream, headers={**headers, 'Content-Type': stream.content_type})
+
+    __len__이 전체 크기를 돌려주므로 requests가 Content-Length를 설정하고
+    각 chunk를 순서대로 소켓에 씁니다. (반복할 때마다 처음부터 다시 생성되므로 재시도 가능)
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        file_path: str,
+        filename: Optional[str] = None,
+        file_content_type: str = "application/octet-stream",
+        chunk_size: int = 256 * 1024,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        self.field_name = field_name
+        self.file_path = file_path
+        self.filename = filename or os.path.basename(file_path)
+        self.file_content_type = file_content_type
+        self.chunk_size = max(1024, int(chunk_size))
+        self.progress_callback = progress_callback
+
+        self._init_envelope()
+
+        self.file_size = os.path.getsize(file_path)
+        self.total_size = len(self._preamble) + self.file_size + len(self._epilogue)
+        self.bytes_sent = 0
+
+    def __len__(self) -> int:
+        return self.total_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.bytes_sent = 0
+        yield self._advance(self._preamble)
+        with open(self.file_path, "rb") as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                yield self._advance(chunk)
+        yield self._advance(self._epilogue)
+
+    def _init_envelope(self) -> None:
+        """boundary와 파일 파트 앞/뒤에 붙는 multipart 헤더 생성"""
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self._preamble = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self.field_name}"; filename="{self.filename}"\r\n'
+            f"Content-Type: {self.file_content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._epilogue = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+    def _advance(self, data: bytes) -> bytes:
+        self.bytes_sent += len(data)
+        if self.progress_callback:
+            try:
+                self.progress_callback(self.bytes_sent, self.total_size)
+            except Exception:
+                pass # 진행률 보고 실패가 업로드를 막지 않도록
+        return data
+
+
+class MultipartPipeStream(MultipartFileStream):
+    """
+    길이를 미리 알 수 없는 바이트 스트림(예: ffmpeg stdout)을 그대로 업로드하는 바디
+
+    __len__이 0을 돌려주므로 requests는 Transfer-Encoding: chunked로 전송합니다.
+    원본 iterator는 한 번만 소비할 수 있으므로 재시도가 불가능합니다.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        chunks: Iterator[bytes],
+        filename: str,
+        file_content_type: str = "application/octet-stream",
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        self.field_name = field_name
+        self.chunks = chunks
+        self.filename = filename
+        self.file_content_type = file_content_type
+        self.progress_callback = progress_callback
+
+        self._init_envelope()
+
+        self.total_size = 0 # 알 수 없음
+        self.bytes_sent = 0
+        self._consumed = False
+
+    def __len__(self) -> int:
+        return 0
+
+    def __bool__(self) -> bool:
+        # __len__ == 0 이어도 빈 바디로 취급되지 않도록
+        return True
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._consumed:
+            raise RuntimeError("Pipe stream can only be sent once")
+        self._consumed = True
+        yield self._advance(self._preamble)
+        for chunk in self.chunks:
+            if chunk:
+                yield self._advance(chunk)
+        yield self._advance(self._epilogue)
@@ -0,0 +1,87 @@
+"""
+토큰 수 추정 / 토큰 예산 기준 텍스트 분할 유틸리티
+- 토크나이저 없이 문자 종류별 비율로 토큰 수를 근사 (한글 약 1.5자, 영문/숫자 약 4자당 1토큰)
+- STT 세그먼트 경계를 유지한 채 토큰 예산 단위로 묶음
+"""
+import math
+import re
+from typing import List, Dict, Any, Optional
+
+CJK_CHARS_PER_TOKEN = 1.5
+OTHER_CHARS_PER_TOKEN = 4.0
+
+_CJK_PATTERN = re.compile(r'[ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힣]')
+_SENTENCE_END = re.compile(r'(?<=[.!?。？！])\s+|\n+')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 대략적인 토큰 수 (보수적으로 올림)
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    other = len(text) - cjk
+    return int(math.ceil(cjk / CJK_CHARS_PER_TOKEN + other / OTHER_CHARS_PER_TOKEN))
+
+
+def _split_long_text(text: str, max_tokens: int) -> List[str]:
+    """세그먼트 정보가 없거나 한 덩어리가 예산을 넘을 때 문장 단위 -> 문자 단위로 분할"""
+    pieces = [p for p in _SENTENCE_END.split(text) if p and p.strip()]
+    result = []
+    for piece in pieces:
+        if estimate_tokens(piece) <= max_tokens:
+            result.append(piece.strip())
+            continue
+        # 문장 구분이 없는 긴 텍스트: 예산에 맞는 길이로 자름
+        step = max(1, int(len(piece) * max_tokens / estimate_tokens(piece)))
+        result.extend(piece[i:i + step].strip() for i in range(0, len(piece), step))
+    return result
+
+
+def split_by_token_budget(
+    text: str,
+    max_tokens: int,
+    segments: Optional[List[Dict[str, Any]]] = None
+) -> List[str]:
+    """
+    텍스트를 토큰 예산 이하의 청크 리스트로 분할
+
+    Args:
+        text: 전체 텍스트 (segments가 없을 때 사용)
+        max_tokens: 청크당 최대 토큰 수
+        segments: STT 세그먼트 리스트 ({'text', ...}) - 있으면 세그먼트 경계에서만 자름
+
+    Returns:
+        청크 텍스트 리스트 (순서 유지)
+    """
+    units = [str(s.get('text', '')).strip() for s in segments or [] if str(s.get('text', '')).strip()]
+    if not units:
+        units = _split_long_text(text or "", max_tokens)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for unit in units:
+        unit_tokens = estimate_tokens(unit)
+        if unit_tokens > max_tokens:
+            # 세그먼트 하나가 예산보다 큰 경우 (비정상적으로 긴 세그먼트)
+            parts = _split_long_text(unit, max_tokens)
+        else:
+            parts = [unit]
+        for part in parts:
+            part_tokens = estimate_tokens(part) + 1
+            if current and current_tokens + part_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(part)
+            current_tokens += part_tokens
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
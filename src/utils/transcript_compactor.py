@@ -0,0 +1,157 @@
+"""
+STT 원문 압축(정리) 유틸리티 - LLM 요청 전 입력 토큰 절감
+- 공백 정규화, 말더듬/반복 구절 축약, 반복 루프(Whisper 환각) 제거
+- 인접 구간의 중복 세그먼트/경계를 넘는 반복 구절 제거, 단독 군말(어, 음 ...) 제거
+- 토큰 예산 초과 시 세그먼트 경계에서 자름
+"""
+import re
+from typing import List, Dict, Any, Optional
+
+from src.utils.token_estimator import estimate_tokens
+
+# 단독으로 쓰인 경우에만 제거하는 군말
+FILLER_WORDS = {'어', '음', '으음', '음음', '어어', '에', '아', '흠', '허'}
+
+MAX_NGRAM = 8  # 반복 판정할 최대 구절 길이 (어절 수)
+DUPLICATE_WINDOW = 3  # 최근 N개 세그먼트와 같은 문장이면 중복으로 간주
+
+_CHAR_LOOP = re.compile(r'([^\d\s]{1,4}?)\1{3,}')
+_TRAILING_PUNCT = re.compile(r'[\s.,!?~…]+$')
+
+
+def normalize_whitespace(text: str) -> str:
+    return " ".join(str(text).split())
+
+
+def collapse_repetitions(text: str) -> str:
+    """
+    연속 반복 축약
+    - 어절 n-gram(1~MAX_NGRAM)이 연달아 반복되면 1회만 남김 ("제가 제가 제가" -> "제가")
+    - 같은 글자 묶음이 4회 이상 반복되면 2회로 축약 ("하하하하하" -> "하하")
+    """
+    text = _CHAR_LOOP.sub(r'\1\1', text)
+    words = text.split()
+    if len(words) < 2:
+        return " ".join(words)
+
+    result: List[str] = []
+    i = 0
+    while i < len(words):
+        collapsed = False
+        for n in range(min(MAX_NGRAM, (len(words) - i) // 2), 0, -1):
+            gram = [_strip_punct(w) for w in words[i:i + n]]
+            repeats = 1
+            while words[i + repeats * n:i + (repeats + 1) * n] and \
+                    [_strip_punct(w) for w in words[i + repeats * n:i + (repeats + 1) * n]] == gram:
+                repeats += 1
+            if repeats > 1:
+                # 마지막 반복의 구두점을 살려 문장 경계 유지
+                last = i + (repeats - 1) * n
+                result.extend(words[last:last + n])
+                i += repeats * n
+                collapsed = True
+                break
+        if not collapsed:
+            result.append(words[i])
+            i += 1
+    return " ".join(result)
+
+
+def _strip_punct(word: str) -> str:
+    return _TRAILING_PUNCT.sub('', word)
+
+
+def _trim_repeated_head(previous: str, text: str) -> str:
+    """앞 세그먼트의 끝 구절을 되풀이하며 시작하면 반복 부분 제거 (세그먼트 경계를 넘는 반복)"""
+    tail = [_strip_punct(w) for w in previous.split()]
+    words = text.split()
+    for n in range(min(MAX_NGRAM, len(tail), len(words)), 0, -1):
+        if [_strip_punct(w) for w in words[:n]] != tail[-n:]:
+            continue
+        while [_strip_punct(w) for w in words[:n]] == tail[-n:]:
+            words = words[n:]
+        break
+    return " ".join(words)
+
+
+def _remove_fillers(text: str) -> str:
+    words = [w for w in text.split() if _strip_punct(w) not in FILLER_WORDS]
+    return " ".join(words)
+
+
+def compact_text(text: str) -> str:
+    """단일 텍스트 정리 (공백 -> 반복 -> 군말 순서)"""
+    text = normalize_whitespace(text)
+    text = collapse_repetitions(text)
+    return _remove_fillers(text)
+
+
+def compact_transcript(
+    text: str,
+    segments: Optional[List[Dict[str, Any]]] = None,
+    max_tokens: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    STT 결과를 LLM 입력용으로 정리
+
+    Args:
+        text: STT 전체 텍스트 (segments가 없을 때 사용)
+        segments: STT 세그먼트 리스트 ({'start', 'end', 'text'})
+        max_tokens: 토큰 예산 (None이면 자르지 않음)
+
+    Returns:
+        {'text', 'segments', 'tokens_before', 'tokens_after', 'truncated'}
+        segments는 정리된 텍스트를 가진 새 리스트 (원본은 수정하지 않음), text는 segments를 이어붙인 값
+    """
+    if not text and segments:
+        text = " ".join(str(s.get('text', '')) for s in segments)
+    tokens_before = estimate_tokens(text or "")
+    compacted: List[Dict[str, Any]] = []
+
+    if segments:
+        recent: List[str] = []
+        for seg in segments:
+            cleaned = compact_text(seg.get('text', ''))
+            if compacted:
+                cleaned = _trim_repeated_head(compacted[-1]['text'], cleaned)
+            key = _strip_punct(cleaned)
+            if not key or key in recent:
+                # 빈 세그먼트 / 직전 구간 반복 (Whisper 반복 루프)
+                continue
+            recent = (recent + [key])[-DUPLICATE_WINDOW:]
+            compacted.append(dict(seg, text=cleaned))
+        full_text = " ".join(s['text'] for s in compacted)
+    else:
+        full_text = compact_text(text or "")
+
+    truncated = False
+    if max_tokens and estimate_tokens(full_text) > max_tokens:
+        truncated = True
+        if compacted:
+            kept, used = [], 0
+            for seg in compacted:
+                seg_tokens = estimate_tokens(seg['text']) + 1
+                if used + seg_tokens > max_tokens:
+                    break
+                kept.append(seg)
+                used += seg_tokens
+            compacted = kept
+            full_text = " ".join(s['text'] for s in compacted)
+        else:
+            # 예산 이하가 되는 가장 긴 앞부분 (문자 종류별 토큰 비율이 달라 비율로 자르면 초과할 수 있음)
+            low, high = 0, len(full_text)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if estimate_tokens(full_text[:mid]) <= max_tokens:
+                    low = mid
+                else:
+                    high = mid - 1
+            full_text = full_text[:low]
+
+    return {
+        'text': full_text,
+        'segments': compacted,
+        'tokens_before': tokens_before,
+        'tokens_after': estimate_tokens(full_text),
+        'truncated': truncated
+    }
@@ -0,0 +1,104 @@
+"""
+STT 분할 결과 병합 유틸리티
+- 청크별 STT 결과(text + segments)를 원본 타임라인 기준으로 이어붙임
+- 청크 경계의 겹침(overlap) 구간에서 중복된 세그먼트 제거
+"""
+from typing import List, Dict, Any, Optional
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(str(text).split())
+
+
+def stitch_transcripts(
+    chunk_results: List[Dict[str, Any]],
+    offsets: List[float],
+    tolerance: float = 0.2
+) -> Dict[str, Any]:
+    """
+    청크별 STT 결과를 하나의 결과로 병합
+
+    Args:
+        chunk_results: 청크 순서대로 정렬된 STT 결과 리스트 ({'text', 'segments', ...})
+        offsets: 각 청크의 원본 오디오 기준 시작 시각 (초)
+        tolerance: 겹침 판정 허용 오차 (초)
+
+    Returns:
+        {'text': 전체 텍스트, 'segments': 보정된 세그먼트 리스트, ...}
+
+    중복 제거 규칙:
+        - 세그먼트 중간 지점이 직전까지 채택된 마지막 세그먼트 종료 시각보다
+          앞서면 이미 앞 청크에서 인식된 구간으로 보고 버림
+        - 경계에 걸친 세그먼트가 직전 세그먼트와 같은 문장이면 버림
+
+    세그먼트 없이 텍스트만 온 청크는 청크 구간(offset ~ 다음 청크 offset) 전체를 덮는
+    세그먼트 1개로 만들어 시간 순서대로 병합 (모든 청크에 세그먼트가 없으면 텍스트만 이어붙임)
+    """
+    merged_segments: List[Dict[str, Any]] = []
+    texts: List[str] = []
+    boundary: Optional[float] = None
+    has_segments = any(isinstance(result, dict) and result.get('segments') for result in chunk_results)
+
+    for index, (result, offset) in enumerate(zip(chunk_results, offsets)):
+        if not isinstance(result, dict):
+            continue
+
+        segments = result.get('segments') or []
+        if not segments:
+            chunk_text = _normalize_text(result.get('text', ''))
+            if not chunk_text:
+                continue
+            if not has_segments:
+                # 모든 청크에 세그먼트가 없으면 텍스트만 이어붙임
+                texts.append(chunk_text)
+                continue
+            # 청크 구간 전체를 덮는 세그먼트 1개 (시각 정보가 없어 겹침 구간 중복 판정은 하지 않음)
+            if index + 1 < len(offsets):
+                end = offsets[index + 1]
+            else:
+                end = offset + float(result.get('duration') or 0)
+            merged_segments.append({
+                'id': len(merged_segments),
+                'start': round(offset, 3),
+                'end': round(max(end, offset), 3),
+                'text': chunk_text
+            })
+            boundary = max(boundary or 0.0, end)
+            continue
+
+        for seg in segments:
+            start = float(seg.get('start', 0)) + offset
+            end = float(seg.get('end', 0)) + offset
+            text = _normalize_text(seg.get('text', ''))
+            if not text:
+                continue
+
+            if boundary is not None:
+                midpoint = (start + end) / 2
+                if midpoint < boundary - tolerance:
+                    continue
+                last = merged_segments[-1] if merged_segments else None
+                if last and start < boundary + tolerance and _normalize_text(last['text']) == text:
+                    continue
+
+            new_seg = dict(seg)
+            new_seg['id'] = len(merged_segments)
+            new_seg['start'] = round(start, 3)
+            new_seg['end'] = round(end, 3)
+            new_seg['text'] = text
+            merged_segments.append(new_seg)
+            boundary = max(boundary or 0.0, end)
+
+    if has_segments:
+        texts = [seg['text'] for seg in merged_segments]
+
+    stitched: Dict[str, Any] = {}
+    # 언어 등 부가 정보는 첫 번째 청크 기준으로 유지
+    for result in chunk_results:
+        if isinstance(result, dict):
+            stitched.update({k: v for k, v in result.items() if k not in ('text', 'segments')})
+            break
+
+    stitched['text'] = " ".join(texts)
+    stitched['segments'] = merged_segments
+    return stitched
@@ -0,0 +1,34 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# Add project root to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+# 실제 설정(config/config.yaml) 대신 템플릿 기반 임시 설정으로 실행 (설정 파일/토큰 없이도 테스트 가능)
+# ConfigLoader는 import 시점에 작업 디렉터리 기준 config/config.yaml을 읽음
+_config_root = tempfile.mkdtemp(prefix="mnap_test_")
+os.makedirs(os.path.join(_config_root, "config"))
+shutil.copy(os.path.join(ROOT, "config", "config_template.yaml"), os.path.join(_config_root, "config", "config.yaml"))
+_cwd = os.getcwd()
+os.chdir(_config_root)
+try:
+    from src.config_loader import settings
+finally:
+    os.chdir(_cwd)
+
+# 환경 변수로 덮어쓴 값이 있어도 테스트 중 실제 서버/텔레그램으로 요청하지 않음
+settings.config['telegram'].update(bot_token=None, chat_id=None)
+
+
+@pytest.fixture(autouse=True)
+def temp_paths(tmp_path, monkeypatch):
+    """테스트마다 새 작업 폴더/상태 DB (state_db는 settings.paths['state'] 아래에 생성)"""
+    for key in list(settings.paths):
+        monkeypatch.setitem(settings.paths, key, str(tmp_path / key))
+    monkeypatch.setitem(settings.paths, 'state', str(tmp_path / 'state'))
+    return tmp_path
@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.api_client import APIClient, LLMIncompleteStream
+from src.modules.circuit_breaker import CircuitBreaker
+from src.modules.endpoint_pool import Endpoint
+
+ROUTE = {'stream': True, 'connect_timeout': 1, 'first_token_timeout': 5, 'inactivity_timeout': 5}
+
+
+class FakeResponse:
+    def __init__(self, lines):
+        self.status_code = 200
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_lines(self, chunk_size=None):
+        for line in self.lines:
+            yield line.encode('utf-8')
+
+
+class FakeHTTP:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def post(self, url, **kwargs):
+        return FakeResponse(self.lines)
+
+
+def sse(content=None, finish_reason=None):
+    delta = {'content': content} if content else {}
+    return "data: " + json.dumps({'choices': [{'delta': delta, 'finish_reason': finish_reason}]})
+
+
+def client(lines):
+    api = APIClient()
+    api.http = FakeHTTP(lines)
+    return api
+
+
+def endpoint():
+    ep = Endpoint('http://gpu')
+    ep.breaker = CircuitBreaker('llm-test', failure_threshold=5, reset_timeout=60)
+    return ep
+
+
+def test_complete_stream():
+    lines = [": keep-alive", sse("요약"), sse("입니다"), "data: [DONE]"]
+    assert client(lines)._post_streaming('http://gpu', {}, None, ROUTE, endpoint()) == "요약입니다"
+
+    # [DONE] 없이 finish_reason으로 끝나는 서버
+    lines = [sse("요약"), sse(finish_reason="stop")]
+    assert client(lines)._post_streaming('http://gpu', {}, None, ROUTE, endpoint()) == "요약"
+
+
+def test_stream_cut_before_done_is_error():
+    with pytest.raises(LLMIncompleteStream):
+        client([sse("요약 일부")])._post_streaming('http://gpu', {}, None, ROUTE, endpoint())
+    with pytest.raises(LLMIncompleteStream):
+        client(["data: [DONE]"])._post_streaming('http://gpu', {}, None, ROUTE, endpoint())
+
+
+def test_incomplete_stream_counts_as_failure():
+    ep = endpoint()
+    result = client([sse("요약 일부")])._send_completion({}, route=ROUTE, endpoint=ep)
+
+    assert APIClient.is_error_result(result)
+    assert ep.breaker.failures == 1
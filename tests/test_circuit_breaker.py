@@ -0,0 +1,99 @@
+import os
+import sys
+import threading
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.circuit_breaker import CircuitBreaker, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('test', failure_threshold=3, reset_timeout=60)
+    breaker.record_failure('timeout')
+    breaker.record_failure('timeout')
+    breaker.record_success()  # 성공하면 연속 실패 횟수 초기화
+    breaker.record_failure('timeout')
+    breaker.record_failure('timeout')
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure('connection refused')
+    assert breaker.state == STATE_OPEN
+    assert breaker.last_error == 'connection refused'
+    assert not breaker.allow()
+    assert breaker.snapshot()['retry_in'] > 0
+
+
+def test_probe_recovers_after_reset_timeout():
+    results = [False, True]
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0)
+    breaker.probe = lambda: results.pop(0)
+    breaker.record_failure('down')
+
+    assert not breaker.allow()  # 헬스 체크 실패 -> 계속 차단
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow()  # 헬스 체크 성공 -> 복구
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+
+
+def test_probe_error_is_recorded():
+    def probe():
+        raise ConnectionError('refused')
+
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0)
+    breaker.probe = probe
+    breaker.record_failure('down')
+
+    assert not breaker.check()
+    assert breaker.state == STATE_OPEN
+    assert breaker.last_error == 'refused'
+
+
+def test_half_open_without_probe():
+    breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=0)
+    breaker.record_failure('down')
+    breaker.record_failure('down')
+
+    assert breaker.allow()  # 복구 시각 경과 -> 시험 요청 통과
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.record_failure('still down')  # 시험 요청 실패 -> 바로 다시 차단
+    assert breaker.state == STATE_OPEN
+
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_half_open_admits_single_trial():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.2)
+    breaker.record_failure('down')
+    assert not breaker.admit()
+    time.sleep(0.25)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(breaker.admit())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1  # 시험 요청 1건만 통과
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.admit() and breaker.admit()
+
+
+def test_unreported_trial_expires():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.2)
+    breaker.record_failure('down')
+    time.sleep(0.25)
+
+    assert breaker.admit()
+    assert not breaker.admit()
+    time.sleep(0.25)  # 결과 없이 reset_timeout 경과 -> 다음 요청이 다시 시험
+    assert breaker.admit()
@@ -0,0 +1,123 @@
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.job_checkpoints import JobCheckpoints
+from src.modules.result_cache import file_sha256
+from src.services.job_processor import JobProcessor
+
+JOB = {
+    'index': 5, 'file_name': 'raw.mp4', 'type': 'mission_news',
+    'data': {'방송 일자': '2024-03-05', '국가': '케냐', '이름(한글)': '홍길동'}
+}
+
+
+class FakeSTT:
+    def get_cached(self, cache_key):
+        return None
+
+
+class FakeStages:
+    """단계 실행 기록 + fail_at 단계에서 실패 (외부 서비스 없이 단계 결과만 ctx에 기록)"""
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.calls = []
+        self.fail_at = None
+
+    def install(self, processor):
+        for stage in JobProcessor.STAGES:
+            setattr(processor, f"_stage_{stage}", lambda ctx, stage=stage: self.run(stage, ctx))
+
+    def _file(self, name):
+        path = str(self.tmp_path / name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(name)
+        return path
+
+    def run(self, stage, ctx):
+        self.calls.append(stage)
+        if stage == self.fail_at:
+            raise RuntimeError(f"{stage} 실패")
+        if stage == 'media':
+            ctx.update(row_idx=5, sheet_type='mission_news', raw_date='2024-03-05', yymmdd='240305',
+                       name='홍길동', region='', new_filename='240305_홍길동.mp4',
+                       file_to_process=self._file('raw.mp4'), stt_context=None,
+                       audio_path=self._file('raw.mp3'))
+        elif stage == 'stt':
+            ctx.update(audio_hash=file_sha256(ctx['audio_path']), transcript_key=None,
+                       transcript={'text': '원문', 'segments': []})
+        elif stage == 'llm':
+            ctx.update(summary_text='요약본', txt_path=self._file('summary.txt'),
+                       srt_path=self._file('summary.srt'), notified=True)
+        elif stage == 'thumbnail':
+            ctx.update(final_thumb_path=self._file('thumb.jpg'))
+        elif stage == 'sheet':
+            ctx['result'] = 'done'
+
+
+@pytest.fixture
+def stages(tmp_path):
+    return FakeStages(tmp_path)
+
+
+def new_processor(stages):
+    """재시작 후 새로 만든 처리기 (단계별 결과는 상태 DB에서만 복원)"""
+    processor = JobProcessor.__new__(JobProcessor)
+    processor.log_callback = lambda message: None
+    processor.stt = FakeSTT()
+    processor.checkpoints = JobCheckpoints()
+    stages.install(processor)
+    return processor
+
+
+def test_resume_from_first_incomplete_stage(stages):
+    stages.fail_at = 'thumbnail'
+    with pytest.raises(RuntimeError):
+        new_processor(stages).process_single_job(JOB)
+    assert stages.calls == ['media', 'stt', 'llm', 'thumbnail']
+
+    stages.calls.clear()
+    stages.fail_at = None
+    processor = new_processor(stages)
+    ctx = processor.new_context(JOB)
+    assert ctx['done'] == ['media', 'stt', 'llm']
+    assert ctx['stt_result'] == {'text': '원문', 'segments': []}
+    assert ctx['notified'] is True
+
+    assert processor.process_single_job(JOB) == 'done'
+    assert stages.calls == ['thumbnail', 'archive', 'sheet']
+    # 끝까지 완료되면 저장된 결과 삭제
+    assert processor.checkpoints.load(JobProcessor.checkpoint_key(JOB)) == {}
+
+
+def test_checkpoint_with_missing_file_is_rerun(stages):
+    stages.fail_at = 'thumbnail'
+    with pytest.raises(RuntimeError):
+        new_processor(stages).process_single_job(JOB)
+
+    # llm 단계가 만든 자막 파일이 사라짐 -> llm 단계부터 다시 실행
+    os.remove(stages.tmp_path / 'summary.srt')
+    processor = new_processor(stages)
+    assert processor.new_context(JOB)['done'] == ['media', 'stt']
+    assert processor._verify_checkpoint('llm', {'txt_path': str(stages.tmp_path / 'summary.txt'),
+                                                'srt_path': str(stages.tmp_path / 'summary.srt')}) is None
+
+    stages.calls.clear()
+    stages.fail_at = None
+    assert processor.process_single_job(JOB) == 'done'
+    assert stages.calls == ['llm', 'thumbnail', 'archive', 'sheet']
+
+
+def test_checkpoint_with_changed_audio_is_rerun(stages):
+    stages.fail_at = 'llm'
+    with pytest.raises(RuntimeError):
+        new_processor(stages).process_single_job(JOB)
+
+    # 오디오 파일 내용이 바뀌면 STT 결과를 쓰지 않음
+    with open(stages.tmp_path / 'raw.mp3', 'w', encoding='utf-8') as f:
+        f.write('changed')
+    assert new_processor(stages).new_context(JOB)['done'] == ['media']
@@ -0,0 +1,86 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import job_store
+from src.job_store import JobStore
+
+
+@pytest.fixture
+def store():
+    """테스트마다 새 상태 DB를 쓰는 작업 목록 (conftest.temp_paths)"""
+    return JobStore()
+
+
+def restart(monkeypatch):
+    """프로세스 재시작 (PROCESS_TOKEN이 바뀌어 이전 점유 기록은 다른 프로세스 것으로 간주)"""
+    monkeypatch.setattr(job_store, 'PROCESS_TOKEN', job_store.PROCESS_TOKEN + "-restarted")
+
+
+def test_claim_is_exclusive(store):
+    store.add('job-1', 'sheet', '작업 1', {'index': 1}, handler='sheet_job')
+    other = JobStore()  # 같은 DB를 쓰는 다른 관리자
+
+    results = []
+    barrier = threading.Barrier(8)
+
+    def claim(s):
+        barrier.wait()
+        results.append(s.claim('job-1'))
+
+    threads = [threading.Thread(target=claim, args=(store if i % 2 else other,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results.count(True) == 1
+    job = store.get('job-1')
+    assert job['status'] == 'processing'
+    assert job['attempts'] == 1
+    assert store.claim('job-1') is False
+
+
+def test_recover_requeues_jobs_left_processing(store, monkeypatch):
+    store.add('job-1', 'sheet', '작업 1', {'index': 1}, handler='sheet_job')
+    store.add('job-2', 'sheet', '작업 2', {'index': 2}, handler='sheet_job')
+    assert store.claim('job-1')
+    store.update('job-1', stage='llm', progress=50)
+
+    restart(monkeypatch)
+    queued = JobStore().recover(max_attempts=3)
+
+    assert [job['id'] for job in queued] == ['job-1', 'job-2']
+    job = store.get('job-1')
+    assert job['status'] == 'queued'
+    assert job['owner'] is None
+    assert job['stage'] is None
+    # 재시작 후 다시 점유 가능 (시도 횟수 누적)
+    assert store.claim('job-1')
+    assert store.get('job-1')['attempts'] == 2
+
+
+def test_recover_keeps_jobs_of_current_process(store):
+    store.add('job-1', 'sheet', '작업 1', {'index': 1}, handler='sheet_job')
+    assert store.claim('job-1')
+
+    assert store.recover(max_attempts=3) == []
+    assert store.get('job-1')['status'] == 'processing'
+
+
+def test_recover_fails_job_after_max_attempts(store, monkeypatch):
+    store.add('job-1', 'sheet', '작업 1', {'index': 1}, handler='sheet_job')
+    for _ in range(3):
+        assert store.claim('job-1')
+        restart(monkeypatch)
+        store.recover(max_attempts=3)
+
+    job = store.get('job-1')
+    assert job['status'] == 'failed'
+    assert job['attempts'] == 3
+    assert job['completed_at'] is not None
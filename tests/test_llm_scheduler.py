@@ -0,0 +1,120 @@
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.llm_scheduler import LLMScheduler, PRIORITY_URGENT, priority_for
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.01)
+
+
+def start_waiter(scheduler, priority, label, order):
+    """슬롯을 얻으면 순서를 기록하고 바로 반환하는 요청"""
+    def run():
+        with scheduler.slot(priority, label):
+            order.append(label)
+
+    waiting = len(scheduler.snapshot()['waiting'])
+    thread = threading.Thread(target=run)
+    thread.start()
+    wait_until(lambda: len(scheduler.snapshot()['waiting']) == waiting + 1)
+    return thread
+
+
+def test_priority_then_fifo_order():
+    scheduler = LLMScheduler(max_concurrent=1, aging_sec=60)
+    order = []
+    scheduler.acquire(1, 'holder')
+
+    threads = [
+        start_waiter(scheduler, 2, 'testimony', order),
+        start_waiter(scheduler, 1, 'news-1', order),
+        start_waiter(scheduler, 1, 'news-2', order),
+        start_waiter(scheduler, PRIORITY_URGENT, 'urgent', order),
+    ]
+    scheduler.release()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert order == ['urgent', 'news-1', 'news-2', 'testimony']
+    assert scheduler.snapshot()['in_flight'] == 0
+    assert scheduler.snapshot()['completed'] == 5
+
+
+def test_aging_lets_old_request_go_first():
+    scheduler = LLMScheduler(max_concurrent=1, aging_sec=0.1)
+    order = []
+    scheduler.acquire(1, 'holder')
+
+    old = start_waiter(scheduler, 5, 'old', order)
+    time.sleep(0.35)  # 3단계 상승 -> 우선순위 2
+    new = start_waiter(scheduler, 3, 'new', order)
+    scheduler.release()
+    old.join(timeout=2)
+    new.join(timeout=2)
+
+    assert order == ['old', 'new']
+
+
+def test_on_wait_called_once_with_requests_ahead():
+    scheduler = LLMScheduler(max_concurrent=1, aging_sec=60)
+    calls = []
+    assert scheduler.acquire(1, on_wait=calls.append) < 1.0
+    assert calls == []  # 바로 슬롯을 얻으면 호출 안 함
+
+    thread = threading.Thread(target=scheduler.acquire, args=(1,), kwargs={'on_wait': calls.append})
+    thread.start()
+    wait_until(lambda: calls)
+    scheduler.release()
+    thread.join(timeout=2)
+
+    assert calls == [1]
+
+
+def test_priority_for():
+    config = {'urgent_days': 2}
+    far = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+    soon = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    past = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    assert priority_for('mission_news', far, config) == 1
+    assert priority_for('testimony', far, config) == 2
+    assert priority_for('testimony', soon, config) == PRIORITY_URGENT
+    assert priority_for('testimony', past, config) == 2
+    assert priority_for('testimony', None, {'priorities': {'testimony': 5}}) == 5
+
+
+def test_next_waiter_wakes_after_head_takes_slot():
+    # 슬롯 2개가 한꺼번에 비었을 때 먼저 기다리던(먼저 깨어나는) 후순위 요청은 선두가 아니라 다시 대기
+    # -> 선두 요청이 슬롯을 잡은 뒤 바로 이어서 진행해야 함 (aging 주기까지 잠들지 않음)
+    for _ in range(10):
+        scheduler = LLMScheduler(max_concurrent=2, aging_sec=60)
+        scheduler.acquire(1, 'holder-1')
+        scheduler.acquire(1, 'holder-2')
+        granted = []
+
+        threads = []
+        for priority, label in ((1, 'next'), (0, 'head')):
+            waiting = len(scheduler.snapshot()['waiting'])
+            thread = threading.Thread(target=lambda p=priority, l=label: granted.append(scheduler.acquire(p, l)), daemon=True)
+            thread.start()
+            wait_until(lambda: len(scheduler.snapshot()['waiting']) == waiting + 1)
+            threads.append(thread)
+
+        with scheduler._cond:
+            scheduler.release()
+            scheduler.release()
+        for thread in threads:
+            thread.join(timeout=1)
+
+        assert len(granted) == 2
+        assert scheduler.snapshot()['in_flight'] == 2
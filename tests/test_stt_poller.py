@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.circuit_breaker import CircuitBreaker
+from src.modules.endpoint_pool import Endpoint
+from src.modules.stt_poller import STTJobPoller
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeHTTP:
+    def __init__(self, result):
+        self.result = result
+
+    def get(self, url, **kwargs):
+        if url.endswith('/result'):
+            return self.result
+        return FakeResponse(200, {'status': 'completed'})
+
+
+def poll(result):
+    poller = STTJobPoller()
+    poller.http = FakeHTTP(result)
+    endpoint = Endpoint('http://stt')
+    endpoint.breaker = CircuitBreaker('stt-test', failure_threshold=5, reset_timeout=60)
+    future = poller.track('http://stt', 'job-1', {}, endpoint=endpoint)
+    return future, endpoint.breaker
+
+
+def test_completed_result_is_returned():
+    future, breaker = poll(FakeResponse(200, {'text': '자막', 'segments': []}))
+    assert future.result(timeout=5)['text'] == '자막'
+    assert breaker.failures == 0
+
+
+@pytest.mark.parametrize('response', [
+    FakeResponse(500, {'detail': 'Internal Server Error'}),
+    FakeResponse(200, {'detail': 'result expired'}),
+    FakeResponse(200, {'text': '', 'segments': []}),
+])
+def test_bad_result_is_failure(response):
+    future, breaker = poll(response)
+    with pytest.raises(RuntimeError, match="결과 조회 실패"):
+        future.result(timeout=5)
+    assert breaker.failures == 1
@@ -0,0 +1,64 @@
+import os
+import sys
+import threading
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.telegram_outbox import TelegramOutbox
+
+
+def test_claim_next_is_exclusive_across_senders():
+    outbox = TelegramOutbox()
+    for i in range(20):
+        outbox.enqueue_message(f"chat-{i}", f"메시지 {i}")
+
+    # 같은 DB를 쓰는 두 프로세스의 전송기 (CLI, 대시보드)
+    claimed = {'cli': [], 'dashboard': []}
+    barrier = threading.Barrier(2)
+
+    def run(owner):
+        store = TelegramOutbox()
+        barrier.wait()
+        while True:
+            item = store.claim_next(owner)
+            if not item:
+                break
+            claimed[owner].append(item['id'])
+
+    threads = [threading.Thread(target=run, args=(owner,)) for owner in claimed]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = claimed['cli'] + claimed['dashboard']
+    assert len(ids) == 20
+    assert len(set(ids)) == 20
+
+
+def test_claimed_item_blocks_chat_until_released():
+    outbox = TelegramOutbox()
+    outbox.enqueue_message("chat", "첫 번째")
+    outbox.enqueue_message("chat", "두 번째")
+
+    first = outbox.claim_next('a')
+    assert first['text'] == "첫 번째"
+    # 앞선 항목이 전송 중이면 같은 채팅방의 뒤 항목도 기다림
+    assert outbox.claim_next('b') is None
+
+    outbox.mark_failed(first['id'], "timeout", retry_after=0)
+    again = outbox.claim_next('b')
+    assert again['id'] == first['id']
+    assert again['attempts'] == 1
+
+
+def test_expired_lease_is_reclaimed():
+    outbox = TelegramOutbox()
+    outbox.enqueue_message("chat", "메시지")
+
+    # 전송 도중 종료된 전송기 (점유 기간 만료)
+    assert outbox.claim_next('dead', lease_sec=-1)
+    item = outbox.claim_next('alive')
+    assert item['owner'] == 'alive'
+    assert outbox.claim_next('other') is None
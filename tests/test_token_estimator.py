@@ -0,0 +1,41 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.token_estimator import estimate_tokens, split_by_token_budget
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("가나다") == 2  # 한글 1.5자당 1토큰
+    assert estimate_tokens("가나다 abcd") == 4  # 올림
+
+
+def test_split_keeps_segment_boundaries_and_order():
+    segments = [{'text': f"{i}번째 구간입니다."} for i in range(20)]
+    chunks = split_by_token_budget("", 30, segments)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+    # 세그먼트를 자르거나 빠뜨리지 않고 순서대로 묶음
+    assert " ".join(chunks) == " ".join(s['text'] for s in segments)
+
+
+def test_split_text_without_segments():
+    text = "첫 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다."
+    assert split_by_token_budget(text, 1000) == [text]
+
+    chunks = split_by_token_budget(text, 10)
+    assert [c for c in chunks] == ["첫 문장입니다.", "두 번째 문장입니다.", "세 번째 문장입니다."]
+
+
+def test_split_oversized_segment():
+    # 예산보다 긴 세그먼트 하나 (문장 구분 없음) -> 문자 단위로 분할
+    chunks = split_by_token_budget("", 20, [{'text': "가" * 100}])
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 20 for chunk in chunks)
+    assert "".join(chunks) == "가" * 100
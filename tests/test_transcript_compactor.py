@@ -0,0 +1,86 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.token_estimator import estimate_tokens
+from src.utils.transcript_compactor import collapse_repetitions, compact_text, compact_transcript
+
+
+def test_collapse_repetitions():
+    assert collapse_repetitions("제가 제가 제가 말씀드리면") == "제가 말씀드리면"
+    assert collapse_repetitions("감사합니다 여러분 감사합니다 여러분.") == "감사합니다 여러분."
+    assert collapse_repetitions("하하하하하 좋네요") == "하하 좋네요"
+    # 숫자 반복은 그대로
+    assert collapse_repetitions("1111 번") == "1111 번"
+
+
+def test_compact_text_removes_standalone_fillers():
+    assert compact_text("  어  그래서 음, 우리가  어제 ") == "그래서 우리가 어제"
+
+
+def test_compact_transcript_drops_repeated_segments():
+    segments = [
+        {'start': 0, 'end': 2, 'text': '시작합니다.'},
+        {'start': 2, 'end': 4, 'text': '음'},
+        {'start': 4, 'end': 6, 'text': '감사합니다.'},
+        {'start': 6, 'end': 8, 'text': '감사합니다.'},
+        {'start': 8, 'end': 10, 'text': '감사합니다'},
+        {'start': 10, 'end': 12, 'text': '끝입니다.'},
+    ]
+    result = compact_transcript("", segments)
+
+    assert [s['text'] for s in result['segments']] == ['시작합니다.', '감사합니다.', '끝입니다.']
+    assert [s['start'] for s in result['segments']] == [0, 4, 10]
+    assert result['text'] == '시작합니다. 감사합니다. 끝입니다.'
+    assert result['tokens_after'] < result['tokens_before']
+    assert result['truncated'] is False
+    # 원본 세그먼트는 수정하지 않음
+    assert segments[1]['text'] == '음'
+
+
+def test_compact_transcript_truncates_at_segment_boundary():
+    segments = [{'start': i, 'end': i + 1, 'text': f"{i}번째 구간입니다."} for i in range(50)]
+    result = compact_transcript("", segments, max_tokens=40)
+
+    assert result['truncated'] is True
+    assert result['tokens_after'] <= 40
+    assert result['segments'] == segments[:len(result['segments'])]
+    assert result['text'] == " ".join(s['text'] for s in result['segments'])
+
+
+def test_compact_transcript_text_only_budget():
+    result = compact_transcript(" ".join(f"{i}번째 문장입니다." for i in range(100)), max_tokens=50)
+
+    assert result['truncated'] is True
+    assert estimate_tokens(result['text']) <= 50
+    assert result['text'].startswith("0번째 문장입니다. 1번째")
+    assert result['segments'] == []
+
+
+def test_repetition_across_segments_keeps_segments_in_sync():
+    segments = [
+        {'start': 0, 'end': 2, 'text': '감사합니다 여러분'},
+        {'start': 2, 'end': 4, 'text': '감사합니다 여러분 감사합니다 여러분 오늘은'},
+        {'start': 4, 'end': 6, 'text': '오늘은'},
+        {'start': 6, 'end': 8, 'text': '선교 소식입니다.'},
+    ]
+    result = compact_transcript("", segments)
+
+    # 경계를 넘는 반복은 뒤 세그먼트에서 제거, 반복만 남은 세그먼트는 버림
+    assert [(s['start'], s['text']) for s in result['segments']] == [
+        (0, '감사합니다 여러분'), (2, '오늘은'), (6, '선교 소식입니다.')
+    ]
+    assert result['text'] == " ".join(s['text'] for s in result['segments'])
+
+
+def test_budget_cut_keeps_collapsed_text():
+    segments = [{'start': 0, 'end': 1, 'text': '제가 제가 제가 말씀드리면'}] + [
+        {'start': i, 'end': i + 1, 'text': f"{i}번째 구간입니다."} for i in range(1, 50)
+    ]
+    result = compact_transcript("", segments, max_tokens=40)
+
+    assert result['truncated'] is True
+    assert result['text'].startswith('제가 말씀드리면 1번째')
+    assert result['text'] == " ".join(s['text'] for s in result['segments'])
@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.transcript_stitcher import stitch_transcripts
+
+
+def seg(start, end, text):
+    return {'start': start, 'end': end, 'text': text}
+
+
+def test_offsets_are_applied_and_ids_renumbered():
+    chunks = [
+        {'text': '하나 둘', 'segments': [seg(0, 2, '하나'), seg(2, 4, '둘')], 'language': 'ko'},
+        {'text': '셋', 'segments': [seg(0, 3, '셋')], 'language': 'ko'},
+    ]
+    result = stitch_transcripts(chunks, [0, 10])
+
+    assert [(s['id'], s['start'], s['end'], s['text']) for s in result['segments']] == [
+        (0, 0, 2, '하나'), (1, 2, 4, '둘'), (2, 10, 13, '셋')
+    ]
+    assert result['text'] == '하나 둘 셋'
+    assert result['language'] == 'ko'
+
+
+def test_overlap_duplicates_are_dropped():
+    # 두 번째 청크는 8초부터 시작 (8~10초 겹침)
+    chunks = [
+        {'segments': [seg(0, 5, '첫 문장입니다.'), seg(5, 9.5, '경계 문장입니다.')]},
+        {'segments': [seg(0, 1.5, '경계 문장입니다.'), seg(1.5, 4, '다음 문장입니다.')]},
+    ]
+    result = stitch_transcripts(chunks, [0, 8])
+
+    assert [s['text'] for s in result['segments']] == ['첫 문장입니다.', '경계 문장입니다.', '다음 문장입니다.']
+    assert result['segments'][-1]['start'] == 9.5
+
+
+def test_text_only_chunks_and_failed_chunks():
+    result = stitch_transcripts([{'text': ' 앞  부분 '}, None, {'text': '뒷 부분'}], [0, 10, 20])
+
+    assert result['text'] == '앞 부분 뒷 부분'
+    assert result['segments'] == []
+
+
+def test_text_only_chunk_between_segmented_chunks_is_kept():
+    chunks = [
+        {'segments': [seg(0, 9, '첫 청크')]},
+        {'text': '세그먼트 없는 청크', 'segments': []},
+        {'segments': [seg(0, 3, '마지막 청크')]},
+    ]
+    result = stitch_transcripts(chunks, [0, 8, 16])
+
+    assert [(s['id'], s['start'], s['end'], s['text']) for s in result['segments']] == [
+        (0, 0, 9, '첫 청크'), (1, 8, 16, '세그먼트 없는 청크'), (2, 16, 19, '마지막 청크')
+    ]
+    assert result['text'] == '첫 청크 세그먼트 없는 청크 마지막 청크'